@@ -0,0 +1,72 @@
+# ==============================================================================
+# benchmarks/animation.py
+# Kosten der Tween-Timeline: Aufbau einer Auflösungs-Animation, ms/Frame bei vielen parallelen Clips.
+# Aufruf: python -m benchmarks.animation [--frames 600]
+# ==============================================================================
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import main as game
+from benchmarks.render_frame import started_game
+from src.ui.text_cache import get_font, render_text
+from src.ui.tween import Clip, Timeline, Track, ease_out_cubic
+
+def many_clips(count: int) -> Timeline:
+    """`count` gauge markers and crew flashes with staggered start times, like several resolutions at once."""
+    timeline = Timeline()
+    font = get_font("Arial", 24)
+    width, height = game.screen.get_size()
+    for i in range(count):
+        x, y = (i * 37) % (width - 60), (i * 53) % (height - 60)
+        start = (i % 20) * 0.05
+        if i % 2:
+            surface = render_text(font, f"-{i % 3 + 1}", (200, 0, 0)).convert_alpha()
+            position = Track([(start, (x, y)), (start + 1.0, (x, y - 30))], ease_out_cubic)
+        else:
+            surface = pygame.Surface((40, 40)).convert()
+            surface.fill((255, 255, 255))
+            position = Track([(start, (x, y)), (start + 1.0, (x, y))])
+        timeline.add(Clip(surface, position, Track([(start, 0), (start + 0.15, 255), (start + 1.0, 0)])))
+    return timeline
+
+def frame_cost(timeline: Timeline, frames: int, dt: float) -> float:
+    """Mean ms per frame drawing `timeline` at time steps of `dt` (wrapping around its duration)."""
+    start = time.perf_counter()
+    for frame in range(frames):
+        timeline.elapsed = (frame * dt) % timeline.duration
+        timeline.draw(game.screen)
+    return (time.perf_counter() - start) / frames * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+    game.init_display()
+
+    game_state = started_game()
+    builds = 200
+    start = time.perf_counter()
+    for _ in range(builds):
+        animation = game.create_resolution_animation(game_state, game_state.current_challenge, True)
+    build_ms = (time.perf_counter() - start) / builds * 1000
+    print(f"Auflösungs-Animation: {len(animation.clips)} Clips, Aufbau {build_ms:.3f} ms (einmal je Auflösung), "
+          f"{frame_cost(animation, args.frames, 1 / 60):.3f} ms/Frame")
+
+    # Zeitbasiert: dieselbe Sequenz bei 30, 60 und 144 FPS, Kosten je Frame bleiben gleich
+    for fps in (30, 60, 144):
+        print(f"  bei {fps:>3} FPS: {frame_cost(animation, args.frames, 1 / fps):.3f} ms/Frame, "
+              f"{animation.duration * fps:.0f} Frames für {animation.duration:.1f} s")
+
+    print(f"{'Clips':>6} {'ms/Frame':>9} {'µs/Clip':>8}")
+    for count in (10, 100, 1000):
+        timeline = many_clips(count)
+        cost = frame_cost(timeline, args.frames, 1 / 60)
+        print(f"{count:>6} {cost:>9.3f} {cost * 1000 / count:>8.2f}")
+
+if __name__ == "__main__":
+    main()
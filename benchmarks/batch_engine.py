@@ -0,0 +1,92 @@
+# ==============================================================================
+# benchmarks/batch_engine.py
+# Vergleich BatchEngine gegen die skalare GameState-Klasse (1k / 100k / 1M Spiele).
+# Aufruf: python -m benchmarks.batch_engine [--scalar-limit 100000]
+# ==============================================================================
+import argparse
+import time
+
+import numpy as np
+
+from src.game.game_state import GameState, GAME_OVER
+from src.sim.batch_engine import BatchEngine, SYSTEMS, scalar_game_tuple
+
+CREW = [0, 1, 2, 3]
+
+def make_actions(n: int, rounds: int, actions_per_round: int, seed: int) -> np.ndarray:
+    """Random action script: (round, action, game, [player, system, amount])."""
+    rng = np.random.default_rng(seed)
+    script = np.empty((rounds, actions_per_round, n, 3), dtype=np.int8)
+    script[..., 0] = rng.integers(0, len(CREW), script.shape[:-1])
+    script[..., 1] = rng.integers(0, len(SYSTEMS), script.shape[:-1])
+    script[..., 2] = rng.choice(np.array([-1, 1, 1, 1], dtype=np.int8), script.shape[:-1])
+    return script
+
+def run_batch(engine: BatchEngine, script: np.ndarray):
+    for round_actions in script:
+        for player, system, amount in round_actions.transpose(0, 2, 1):
+            engine.set_active(player)
+            engine.modify_system_value(system, amount)
+        engine.end_round()
+
+def run_scalar(games, script: np.ndarray):
+    for i, game_state in enumerate(games):
+        for round_actions in script[:, :, i]:
+            if game_state.current_phase == GAME_OVER: break
+            for player, system, amount in round_actions:
+                game_state.active_character = game_state.players[player]
+                game_state.modify_system_value(SYSTEMS[system], int(amount))
+                if game_state.current_phase == GAME_OVER: break
+            else:
+                game_state.finish_action_phase()
+
+def start_scalar(seeds):
+    games = []
+    for seed in seeds:
+        game_state = GameState(seed)
+        game_state.selected_character_indices = set(CREW)
+        game_state.start_game()
+        games.append(game_state)
+    return games
+
+def check_parity(n: int, rounds: int, actions: int):
+    seeds = range(n)
+    script = make_actions(n, rounds, actions, seed=1)
+    engine = BatchEngine.from_seeds(seeds, CREW)
+    games = start_scalar(seeds)
+    run_batch(engine, script)
+    run_scalar(games, script)
+    mismatches = [i for i, g in enumerate(games) if engine.game_tuple(i) != scalar_game_tuple(g)]
+    if mismatches:
+        raise AssertionError(f"{len(mismatches)} Abweichungen, erstes Spiel {mismatches[0]}: "
+                             f"{engine.game_tuple(mismatches[0])} != {scalar_game_tuple(games[mismatches[0]])}")
+    print(f"Parität: {n} Spiele x {rounds} Runden bitgleich")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--actions", type=int, default=8)
+    parser.add_argument("--scalar-limit", type=int, default=100000,
+                        help="größere Läufe der skalaren Klasse werden hochgerechnet")
+    args = parser.parse_args()
+
+    check_parity(2000, args.rounds, args.actions)
+    print(f"{'Spiele':>10} {'skalar [s]':>12} {'batch [s]':>10} {'Speedup':>8}")
+    for n in (int(size) for size in args.sizes.split(",")):
+        script = make_actions(n, args.rounds, args.actions, seed=2)
+        engine = BatchEngine.random_start(n, CREW, np.random.default_rng(3))
+        start = time.perf_counter()
+        run_batch(engine, script)
+        batch_time = time.perf_counter() - start
+
+        scalar_n = min(n, args.scalar_limit)
+        games = start_scalar(range(scalar_n))
+        start = time.perf_counter()
+        run_scalar(games, script[:, :, :scalar_n])
+        scalar_time = (time.perf_counter() - start) * n / scalar_n
+        note = "" if scalar_n == n else f"  (skalar hochgerechnet aus {scalar_n})"
+        print(f"{n:>10} {scalar_time:>12.3f} {batch_time:>10.3f} {scalar_time / batch_time:>7.1f}x{note}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# ==============================================================================
+# benchmarks/deck_loading.py
+# Laden, Ziehen und Indexabfragen großer generierter Herausforderungsdecks.
+# Aufruf: python -m benchmarks.deck_loading [--cards 100000]
+# ==============================================================================
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from src.game import decks
+
+def write_generated_deck(path: str, n: int, seed: int = 1):
+    rng = random.Random(seed)
+    cards = [{"name": f"Testkarte {i}", "description": "...", "reward": "Fortschritt", "penalty": "-",
+              "target_thrust": rng.randint(0, 8), "target_navigation": rng.randint(0, 8),
+              "phase": rng.randint(1, 3), **({"crew_sizes": [3, 4]} if i % 5 == 0 else {})}
+             for i in range(n)]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"cards": cards}, f)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cards", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "cards.json")
+        write_generated_deck(path, args.cards)
+        start = time.perf_counter()
+        pool = decks.card_pool(1, 4, path)
+        load_time = time.perf_counter() - start
+        start = time.perf_counter()
+        deck = decks.create_challenge_deck(1, 4, random.Random(2), path)
+        build_time = time.perf_counter() - start
+        print(f"{args.cards} Karten in der Datei, {len(pool)} für Phase 1 / 4 Personen")
+        print(f"Laden + Karten erzeugen: {load_time * 1000:.1f} ms, Mischen + Index: {build_time * 1000:.1f} ms")
+
+        start = time.perf_counter()
+        queries = 10000
+        for i in range(queries):
+            deck.count_beatable(thrust=i % 9)
+        query_time = (time.perf_counter() - start) / queries * 1e6
+        expected = sum(1 for card in deck if card.target_thrust <= 5)
+        assert deck.count_beatable(thrust=5) == expected
+        print(f"count_beatable: {query_time:.2f} µs/Abfrage (Schub >= 5 schafft {expected} Karten)")
+
+        start = time.perf_counter()
+        drawn = 0
+        while deck.draw() is not None:
+            drawn += 1
+        draw_time = (time.perf_counter() - start) / max(1, drawn) * 1e9
+        print(f"draw: {draw_time:.0f} ns/Karte über {drawn} Karten")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+# ==============================================================================
+# benchmarks/fixtures.py
+# Gemeinsame Ausgangszustände der Benchmarks: volle Crew, fester Seed, ohne pygame.
+# ==============================================================================
+from typing import Optional
+
+from src.game.game_state import GameState
+from src.game.rules import Rules
+
+def new_game(seed: int = 1, rules: Optional[Rules] = None) -> GameState:
+    """Setup screen with all four characters selected."""
+    game_state = GameState(seed, rules=rules)
+    game_state.selected_character_indices = {0, 1, 2, 3}
+    return game_state
+
+def started_game(seed: int = 1, rules: Optional[Rules] = None) -> GameState:
+    """First AKTIONSPHASE of a full crew."""
+    game_state = new_game(seed, rules)
+    game_state.start_game()
+    return game_state
@@ -0,0 +1,125 @@
+# ==============================================================================
+# benchmarks/render_frame.py
+# Frame-Zeiten: vollständiges Neuzeichnen gegen Retained Mode (Dirty Rects).
+# Aufruf: python -m benchmarks.render_frame [--frames 2000]
+# ==============================================================================
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import main as game
+from benchmarks.fixtures import started_game
+from src.game.game_state import GameState
+from src.ui.text_cache import font_registry, text_cache
+
+SYSTEMS = ["oxygen", "water", "temperature", "airpressure", "thrust", "navigation"]
+
+def click(game_state: GameState, rng: random.Random):
+    """One random player input, as main() would apply it."""
+    roll = rng.random()
+    if roll < 0.2:
+        game_state.active_character = rng.choice(game_state.players)
+    elif roll < 0.3:
+        player = rng.choice(game_state.players)
+        player.is_ready = not player.is_ready
+    else:
+        game_state.modify_system_value(rng.choice(SYSTEMS), rng.choice((1, 1, -1)))
+    if game_state.current_phase == game.AKTIONSPHASE and all(p.is_ready for p in game_state.players):
+        game_state.finish_action_phase()
+
+def check_equivalence(steps: int = 200):
+    """Retained output must match the full redraw pixel for pixel."""
+    full, retained = pygame.Surface(game.screen.get_size()), pygame.Surface(game.screen.get_size())
+    renderer = game.create_renderer()
+    game_state, rng = started_game(), random.Random(7)
+    for _ in range(steps):
+        if game_state.current_phase == game.GAME_OVER:
+            game_state = started_game(rng.randrange(1000))
+        click(game_state, rng)
+        game.draw_frame(full, game_state)
+        renderer.render(retained, game.screen_for_phase(game_state.current_phase), game_state)
+        if pygame.image.tobytes(full, "RGB") != pygame.image.tobytes(retained, "RGB"):
+            raise AssertionError("Retained-Mode-Frame weicht vom vollständigen Neuzeichnen ab")
+    print(f"Äquivalenz: {steps} Frames pixelgleich")
+
+def check_overlay_repair():
+    """Repainting the resolution animation's rects must restore the retained frame exactly."""
+    surface = pygame.Surface(game.screen.get_size())
+    renderer = game.create_renderer()
+    game_state = started_game()
+    renderer.render(surface, "Mission", game_state)
+    clean = pygame.image.tobytes(surface, "RGB")
+    animation = game.create_resolution_animation(game_state, game_state.current_challenge, False)
+    overlay, frames = [], 0
+    while not animation.is_finished:
+        renderer.repaint(surface, game_state, overlay)
+        overlay = animation.draw(surface)
+        animation.update(1 / 60)
+        frames += 1
+    renderer.repaint(surface, game_state, overlay)
+    if pygame.image.tobytes(surface, "RGB") != clean:
+        raise AssertionError("Overlay-Reparatur hinterlässt Reste der Animation")
+    print(f"Overlay-Reparatur: {frames} Animations-Frames, danach pixelgleich")
+
+def check_text_cache(frames: int = 100):
+    """After one warm-up frame, a steady-state full redraw must not render any text."""
+    game_state = started_game()
+    animation = game.create_resolution_animation(game_state, game_state.current_challenge, False)
+    animation.elapsed = 1.5  # Zähler, Banner und Gauge-Marken sichtbar
+    game.draw_frame(game.screen, game_state)
+    animation.draw(game.screen)
+    text_cache.reset_stats()
+    lookups = font_registry.lookups
+    for _ in range(frames):
+        game.draw_frame(game.screen, game_state)
+        animation.draw(game.screen)
+    stats = text_cache.stats()
+    print(f"Textcache im Dauerzustand: {stats['hits']} Treffer, {stats['misses']} Fehlgriffe, "
+          f"{font_registry.lookups - lookups} neue Font-Lookups")
+    if stats["misses"] or font_registry.lookups != lookups:
+        raise AssertionError("Dauerzustand rendert noch Text oder lädt Fonts")
+
+def measure(frames: int, clicks_every: int, retained: bool) -> list:
+    renderer = game.create_renderer()
+    game_state, rng = started_game(), random.Random(3)
+    times = []
+    for frame in range(frames):
+        if clicks_every and frame % clicks_every == 0:
+            click(game_state, rng)
+            if game_state.current_phase == game.GAME_OVER:
+                game_state = started_game(frame)
+        start = time.perf_counter()
+        if retained:
+            dirty = renderer.render(game.screen, game.screen_for_phase(game_state.current_phase), game_state)
+            if dirty: pygame.display.update(dirty)
+        else:
+            game.draw_frame(game.screen, game_state)
+            pygame.display.flip()
+        times.append(time.perf_counter() - start)
+    return sorted(times)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    game.init_display()
+    check_equivalence()
+    check_overlay_repair()
+    check_text_cache()
+    print(f"{'Modus':<22} {'Klick alle':>10} {'Mittel [ms]':>12} {'p95 [ms]':>9}")
+    for clicks_every in (0, 30, 1):
+        for retained in (False, True):
+            times = measure(args.frames, clicks_every, retained)
+            mean = sum(times) / len(times) * 1000
+            p95 = times[int(len(times) * 0.95)] * 1000
+            label = "Retained (Dirty Rects)" if retained else "Vollständig"
+            print(f"{label:<22} {clicks_every or '-':>10} {mean:>12.3f} {p95:>9.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# ==============================================================================
+# benchmarks/resolutions.py
+# Frame-Zeiten bei 720p, 1440p und 2160p: natives Layout gegen Hochskalieren, Klick-Lookup.
+# Aufruf: python -m benchmarks.resolutions [--frames 500]
+# ==============================================================================
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import main as game
+from benchmarks.render_frame import check_equivalence, check_overlay_repair, measure, started_game
+from src.ui.layout import Layout
+
+RESOLUTIONS = {"720p": (1280, 720), "1440p": (2560, 1440), "2160p": (3840, 2160)}
+
+def mean_ms(times) -> float:
+    return sum(times) / len(times) * 1000
+
+def relayout_cost(size, repeat: int = 20) -> tuple:
+    """ms for a new Layout and for re-baking the mission screen at native resolution (once per resize)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        game.apply_layout(Layout(*size))
+    layout_ms = (time.perf_counter() - start) / repeat * 1000
+    renderer, game_state = game.create_renderer(), started_game()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        renderer.invalidate()
+        renderer.render(game.screen, "Mission", game_state)
+    return layout_ms, (time.perf_counter() - start) / repeat * 1000
+
+def animation_cost(frames: int) -> float:
+    """ms per retained frame while the resolution animation plays: repair the last overlay, draw the next."""
+    renderer, game_state = game.create_renderer(), started_game()
+    renderer.render(game.screen, "Mission", game_state)
+    animation = game.create_resolution_animation(game_state, game_state.current_challenge, False)
+    overlay, times = [], []
+    for frame in range(frames):
+        animation.elapsed = animation.duration * frame / frames
+        start = time.perf_counter()
+        dirty = renderer.repaint(game.screen, game_state, overlay)
+        overlay = animation.draw(game.screen)
+        pygame.display.update(dirty + overlay)
+        times.append(time.perf_counter() - start)
+    return mean_ms(times)
+
+def upscale_cost(size, frames: int) -> tuple:
+    """The rejected alternative: draw at 1280x720 and scale the finished frame to `size` every frame."""
+    game.apply_layout(Layout())
+    base, game_state = pygame.Surface((1280, 720)), started_game()
+    scaled, smooth = [], []
+    for frame in range(frames):
+        start = time.perf_counter()
+        game.draw_frame(base, game_state)
+        game.screen.blit(pygame.transform.scale(base, size), (0, 0))
+        scaled.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        game.draw_frame(base, game_state)
+        game.screen.blit(pygame.transform.smoothscale(base, size), (0, 0))
+        smooth.append(time.perf_counter() - start)
+    game.apply_layout(Layout(*size))
+    return mean_ms(scaled), mean_ms(smooth)
+
+def click_lookup_cost(clicks: int = 20_000) -> tuple:
+    """µs per click: grid lookup in the ControlMap against a linear scan over all control rects."""
+    controls = game.controls_for("Mission", started_game())
+    rng = random.Random(5)
+    width, height = game.screen.get_size()
+    points = [(rng.randrange(width), rng.randrange(height)) for _ in range(clicks)]
+    start = time.perf_counter()
+    grid = [controls.lookup(pos) for pos in points]
+    grid_us = (time.perf_counter() - start) / clicks * 1e6
+    start = time.perf_counter()
+    linear = [next((action for rect, action in reversed(controls.controls) if rect.collidepoint(pos)), None) for pos in points]
+    linear_us = (time.perf_counter() - start) / clicks * 1e6
+    if grid != linear:
+        raise AssertionError("Raster-Lookup trifft andere Controls als der lineare Scan")
+    return len(controls.controls), grid_us, linear_us
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=500)
+    args = parser.parse_args()
+
+    rows = []
+    for name, size in RESOLUTIONS.items():
+        game.init_display(size)
+        print(f"--- {name} ({size[0]}x{size[1]}, Skalierung {game.layout.scale:g}) ---")
+        check_equivalence(50)
+        check_overlay_repair()
+        layout_ms, bake_ms = relayout_cost(size)
+        full = mean_ms(measure(args.frames, 0, retained=False))
+        idle = mean_ms(measure(args.frames, 0, retained=True))
+        clicks = mean_ms(measure(args.frames, 1, retained=True))
+        animation = animation_cost(args.frames)
+        scaled, smooth = upscale_cost(size, max(20, args.frames // 10)) if name != "720p" else (None, None)
+        count, grid_us, linear_us = click_lookup_cost()
+        rows.append((name, layout_ms, bake_ms, full, idle, clicks, animation, scaled, smooth))
+        print(f"Klick-Lookup: {count} Controls, Raster {grid_us:.2f} µs, linearer Scan {linear_us:.2f} µs")
+
+    print(f"\n{'ms':<6} {'Layout':>7} {'Backen':>7} {'Voll':>7} {'Ruhend':>7} {'Klicks':>7} {'Anim.':>7} "
+          f"{'Skal.':>7} {'Smooth':>7}")
+    for name, *values in rows:
+        print(f"{name:<6} " + " ".join(f"{value:>7.3f}" if value is not None else f"{'-':>7}" for value in values))
+    print("Layout/Backen: einmal je Größenänderung; Voll: draw_frame je Frame; Ruhend/Klicks/Anim.: Retained Mode "
+          "ohne Eingaben, mit Klick je Frame, während der Auflösungs-Animation; Skal./Smooth: 720p zeichnen und "
+          "mit pygame.transform.scale/smoothscale hochskalieren")
+
+if __name__ == "__main__":
+    main()
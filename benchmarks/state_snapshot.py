@@ -0,0 +1,75 @@
+# ==============================================================================
+# benchmarks/state_snapshot.py
+# Speicher pro Zustand und Kopierzeit: gepackter Snapshot gegen copy.deepcopy.
+# Aufruf: python -m benchmarks.state_snapshot [--cards 20000 70000]
+# ==============================================================================
+import argparse
+import copy
+import gc
+import os
+import sys
+import tempfile
+import timeit
+from types import FunctionType, ModuleType
+from typing import Optional
+
+from benchmarks.deck_loading import write_generated_deck
+from benchmarks.fixtures import started_game
+from src.game.game_state import GameState
+from src.game.rules import Rules
+
+def deep_size(obj) -> int:
+    """Bytes of an object graph (types, modules and functions are shared and not counted)."""
+    seen, stack, total = set(), [obj], 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, (type, ModuleType, FunctionType)):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        stack.extend(gc.get_referents(current))
+    return total
+
+def clicked_game(rules: Optional[Rules] = None) -> GameState:
+    game_state = started_game(4, rules)
+    game_state.modify_system_value("thrust", 1)
+    return game_state
+
+def large_deck(cards: int, directory: str):
+    """Undoable clicks with a generated deck: each one takes a snapshot of the whole draw pile."""
+    path = os.path.join(directory, f"cards-{cards}.json")
+    write_generated_deck(path, cards)
+    game_state = clicked_game(Rules(card_file=path))
+    game_state.snapshot()  # Deck einmal packen, danach nur noch gezogene Karten herausschieben
+    n = 200
+    click = timeit.timeit(lambda: (game_state.modify_system_value("thrust", 1, record_undo=True), game_state.undo()),
+                          number=n) / n * 1e6
+    print(f"{len(game_state.challenge_deck):>7} Karten im Stapel: Klick + Undo {click:>8.1f} µs, "
+          f"Snapshot {game_state.snapshot().bit_length() // 8} Bytes")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cards", type=int, nargs="*", default=[20000, 70000], help="Größen generierter Decks")
+    args = parser.parse_args()
+    game_state = clicked_game()
+    snapshot = game_state.snapshot()
+    clone = copy.deepcopy(game_state)
+    print(f"{'':<22} {'Bytes/Zustand':>14} {'Kopie [µs]':>11} {'Wiederherst. [µs]':>18}")
+
+    n = 20000
+    deepcopy_time = timeit.timeit(lambda: copy.deepcopy(game_state), number=n) / n * 1e6
+    print(f"{'copy.deepcopy':<22} {deep_size(clone):>14} {deepcopy_time:>11.2f} {deepcopy_time:>18.2f}")
+
+    snapshot_time = timeit.timeit(game_state.snapshot, number=n) / n * 1e6
+    restore_time = timeit.timeit(lambda: game_state.restore(snapshot), number=n) / n * 1e6
+    print(f"{'snapshot()/restore()':<22} {sys.getsizeof(snapshot):>14} {snapshot_time:>11.2f} {restore_time:>18.2f}")
+
+    hash_time = timeit.timeit(lambda: hash(snapshot), number=n) / n * 1e6
+    print(f"Hash eines Snapshots: {hash_time:.3f} µs, Snapshot-Länge {snapshot.bit_length()} Bit")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for cards in args.cards:
+            large_deck(cards, directory)
+
+if __name__ == "__main__":
+    main()
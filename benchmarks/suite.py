@@ -0,0 +1,201 @@
+# ==============================================================================
+# benchmarks/suite.py
+# Regressions-Benchmarks: Spiellogik in Ops/s, Bildschirme in ms/Frame, JSON-Baselines.
+# Aufruf: python -m benchmarks.suite [--save benchmarks/baseline.json] [--compare benchmarks/baseline.json]
+# ==============================================================================
+import argparse
+import contextlib
+import datetime
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Sequence
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import main as game
+from benchmarks.fixtures import new_game, started_game
+from src.game.game_state import GameState, VORBEREITUNGSPHASE, SYSTEMS
+
+BASELINE_FORMAT = 1
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.15  # ein Kern, geteilte Maschinen: kleinere Schwankungen sind Rauschen
+
+# Höhere Werte sind besser bei Ops/s, niedrigere bei ms/Frame
+HIGHER_IS_BETTER = {"ops/s": True, "ms/Frame": False}
+
+@contextlib.contextmanager
+def _gc_paused():
+    """Like timeit: a collection triggered by the prepared states must not land in the timed loop."""
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled: gc.enable()
+
+# --- Spiellogik ---
+def resolved_game(seed: int) -> GameState:
+    game_state = started_game(seed)
+    game_state.resolve_challenge()
+    game_state.current_phase = VORBEREITUNGSPHASE
+    return game_state
+
+def modify(game_state: GameState):
+    # Rotierendes System, damit Spezialisten-Bonus und normale Klicks beide vorkommen
+    game_state.modify_system_value(SYSTEMS[game_state.seed % len(SYSTEMS)], 1)
+
+# Name -> (Vorbereitung je Aufruf, gemessene Operation); vorbereitete Zustände werden nicht mitgemessen
+ENGINE_CASES: Dict[str, tuple] = {
+    "start_game": (new_game, GameState.start_game),
+    "start_new_round": (started_game, GameState.start_new_round),
+    "modify_system_value": (started_game, modify),
+    "resolve_challenge": (started_game, GameState.resolve_challenge),
+    "prepare_next_round": (resolved_game, GameState.prepare_next_round),
+}
+
+def measure_engine(setup: Callable[[int], GameState], op: Callable[[GameState], None], calls: int, repeat: int) -> float:
+    """Best of `repeat` runs over `calls` freshly prepared states, in operations per second."""
+    best = float("inf")
+    for run in range(repeat):
+        states = [setup(run * calls + i) for i in range(calls)]
+        with _gc_paused():
+            start = time.perf_counter()
+            for game_state in states:
+                op(game_state)
+            best = min(best, time.perf_counter() - start)
+    return calls / best
+
+# --- Bildschirme ---
+def _animation_frames(surface: pygame.Surface) -> List[Callable[[], None]]:
+    """Frames spread over the whole resolution sequence, success and failure."""
+    frames = []
+    for seed, success in ((0, True), (1, False)):
+        game_state = started_game(seed)
+        animation = game.create_resolution_animation(game_state, game_state.current_challenge, success)
+        for step in range(8):
+            frames.append(lambda a=animation, t=animation.duration * step / 8: (setattr(a, "elapsed", t), a.draw(surface)))
+    return frames
+
+def render_cases(surface: pygame.Surface, variants: int = 8) -> Dict[str, List[Callable[[], None]]]:
+    """Name -> list of frames to cycle through (different game states, same screen)."""
+    games = [started_game(seed) for seed in range(variants)]
+    for i, game_state in enumerate(games):
+        game_state.mission_progress = i % 11
+        game_state.active_character = game_state.players[i % len(game_state.players)]
+        game_state.players[i % len(game_state.players)].is_ready = True
+    selections = [set(range(i % 5)) for i in range(variants)]
+    return {
+        "draw_setup_screen": [lambda s=s: game.draw_setup_screen(surface, s) for s in selections],
+        "draw_cockpit": [lambda gs=gs: game.draw_cockpit(surface, gs) for gs in games],
+        "draw_zone1_travel_map": [lambda gs=gs: game.draw_zone1_travel_map(surface, gs.mission_progress) for gs in games],
+        "draw_zone3_crew_control": [lambda gs=gs: game.draw_zone3_crew_control(surface, gs) for gs in games],
+        "draw_game_over_screen": [lambda gs=gs: game.draw_game_over_screen(surface, gs) for gs in games],
+        "ResolutionAnimation.draw": _animation_frames(surface),
+    }
+
+def measure_render(frames: Sequence[Callable[[], None]], count: int, repeat: int) -> float:
+    """Best of `repeat` runs of `count` frames, in milliseconds per frame (warm text cache)."""
+    for draw in frames:
+        draw()
+    best = float("inf")
+    for _ in range(repeat):
+        with _gc_paused():
+            start = time.perf_counter()
+            for i in range(count):
+                frames[i % len(frames)]()
+            best = min(best, time.perf_counter() - start)
+    return best / count * 1000
+
+# --- Suite ---
+def run_suite(calls: int = 20_000, frames: int = 500, repeat: int = 5, groups: Sequence[str] = ("engine", "render"),
+              progress: bool = True) -> Dict[str, dict]:
+    results: Dict[str, dict] = {}
+    def report(name: str, value: float, unit: str):
+        results[name] = {"value": value, "unit": unit}
+        if progress: print(f"  {name:<32} {value:>14.3f} {unit}")
+
+    if "engine" in groups:
+        for name, (setup, op) in ENGINE_CASES.items():
+            report(f"engine.{name}", measure_engine(setup, op, calls, repeat), "ops/s")
+    if "render" in groups:
+        surface = game.screen or game.init_display()
+        for name, case_frames in render_cases(surface).items():
+            report(f"render.{name}", measure_render(case_frames, frames, repeat), "ms/Frame")
+    return results
+
+def environment() -> dict:
+    return {"python": platform.python_version(), "pygame": pygame.version.ver, "platform": platform.platform(),
+            "machine": platform.machine(), "sdl_videodriver": os.environ.get("SDL_VIDEODRIVER")}
+
+def save_baseline(path: str, results: Dict[str, dict], settings: dict):
+    directory = os.path.dirname(path)
+    if directory: os.makedirs(directory, exist_ok=True)
+    baseline = {"format": BASELINE_FORMAT, "created": datetime.datetime.now().isoformat(timespec="seconds"),
+                "environment": environment(), "settings": settings, "results": results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def load_baseline(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("format") != BASELINE_FORMAT:
+        raise ValueError(f"Unbekanntes Baseline-Format in {path}: {baseline.get('format')}")
+    return baseline
+
+def compare(baseline: Dict[str, dict], results: Dict[str, dict], threshold: float) -> List[str]:
+    """Prints old/new per benchmark and returns the names that got worse by more than `threshold`."""
+    regressions = []
+    print(f"{'Benchmark':<32} {'Baseline':>12} {'Aktuell':>12} {'Änderung':>9}  Einheit")
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None or old["unit"] != result["unit"]:
+            print(f"{name:<32} {'-':>12} {result['value']:>12.3f} {'neu':>9}  {result['unit']}")
+            continue
+        change = result["value"] / old["value"] - 1
+        worse = -change if HIGHER_IS_BETTER[result["unit"]] else change
+        flag = ""
+        if worse > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<32} {old['value']:>12.3f} {result['value']:>12.3f} {change:>+9.1%}  {result['unit']}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark-Suite mit Baseline-Vergleich")
+    parser.add_argument("--group", choices=("engine", "render"), action="append", default=None)
+    parser.add_argument("--calls", type=int, default=20_000, help="Aufrufe je Spiellogik-Messung")
+    parser.add_argument("--frames", type=int, default=500, help="Frames je Bildschirm-Messung")
+    parser.add_argument("--repeat", type=int, default=5, help="Wiederholungen, der beste Lauf zählt")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, default=None, metavar="DATEI")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, default=None, metavar="DATEI")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="erlaubte Verschlechterung als Anteil (0.15 = 15 %%)")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.compare) if args.compare else None
+    groups = args.group or ("engine", "render")
+    settings = {"calls": args.calls, "frames": args.frames, "repeat": args.repeat}
+    print(f"Benchmarks ({', '.join(groups)}):")
+    results = run_suite(args.calls, args.frames, args.repeat, groups)
+    if args.save:
+        save_baseline(args.save, results, settings)
+        print(f"Baseline gespeichert: {args.save}")
+    if baseline is not None:
+        if baseline["settings"] != settings:
+            print(f"Hinweis: Baseline wurde mit {baseline['settings']} gemessen")
+        regressions = compare(baseline["results"], results, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} Regression(en) über {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"Keine Regression über {args.threshold:.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# ==============================================================================
+# benchmarks/tracing.py
+# Kosten des Tracings auf einem langen Headless-Lauf: ausgeschaltet, eingeschaltet, Guard-Kosten.
+# Aufruf: python -m benchmarks.tracing [--rounds 1000000]
+# ==============================================================================
+import argparse
+import random
+import time
+import timeit
+
+from src.game.tracing import Tracer
+from src.sim.monte_carlo import greedy_policy, play_game
+
+class GuardCounter:
+    """Stands in for a disabled tracer: falsy like None, but counts how often a hook was tested."""
+    def __init__(self):
+        self.tests = 0
+
+    def __bool__(self):
+        self.tests += 1
+        return False
+
+def run(rounds: int, tracer_factory, seed: int = 0) -> float:
+    """Plays greedy missions until `rounds` rounds have been played; returns the elapsed seconds."""
+    rng = random.Random(seed)
+    played = 0
+    start = time.perf_counter()
+    while played < rounds:
+        played += play_game((0, 1, 2, 3), greedy_policy, rng, max_rounds=200, tracer=tracer_factory()).round_counter
+    return time.perf_counter() - start
+
+def guard_cost_ns() -> float:
+    """Cost of one `if self.tracer:` test against None on a slotted object."""
+    class Slotted:
+        __slots__ = ("tracer",)
+    obj = Slotted()
+    obj.tracer = None
+    number = 2_000_000
+    guarded = min(timeit.repeat("if obj.tracer: pass", globals={"obj": obj}, number=number, repeat=5))
+    empty = min(timeit.repeat("pass", number=number, repeat=5))
+    return (guarded - empty) / number * 1e9
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3, help="Modi abwechselnd wiederholen, der beste Lauf zählt")
+    args = parser.parse_args()
+
+    counter = GuardCounter()
+    run(args.rounds // 100, lambda: counter)
+    guards_per_round = counter.tests / (args.rounds // 100)
+
+    tracer = Tracer()
+    modes = {"aus (tracer=None)": lambda: None, "an (Ringpuffer)": lambda: tracer}
+    best = {name: float("inf") for name in modes}
+    for _ in range(args.repeat):
+        for name, factory in modes.items():
+            best[name] = min(best[name], run(args.rounds, factory))
+
+    off = best["aus (tracer=None)"]
+    print(f"{args.rounds} Runden, bester von {args.repeat} Läufen")
+    print(f"{'Modus':<20} {'Zeit [s]':>9} {'µs/Runde':>9} {'Aufschlag':>10}")
+    for name, seconds in best.items():
+        print(f"{name:<20} {seconds:>9.2f} {seconds / args.rounds * 1e6:>9.2f} {seconds / off - 1:>+10.1%}")
+    print(f"Trace-Events aufgezeichnet: {tracer.recorded} ({tracer.recorded / (args.rounds * args.repeat):.1f} je Runde)")
+
+    # Ausgeschaltet bleibt nur der Test `if self.tracer:` je Hook; seine Summe schätzt den Aufschlag
+    cost = guard_cost_ns()
+    per_round = guards_per_round * cost / 1000
+    print(f"Ausgeschaltet: {guards_per_round:.1f} Guard-Tests je Runde à {cost:.1f} ns = {per_round:.3f} µs/Runde "
+          f"({per_round / (off / args.rounds * 1e6):.2%} der Rundenzeit)")
+
+if __name__ == "__main__":
+    main()
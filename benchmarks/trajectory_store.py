@@ -0,0 +1,72 @@
+# ==============================================================================
+# benchmarks/trajectory_store.py
+# Schreib- und Abfragezeit des Verlaufsspeichers bei sehr vielen Zeilen.
+# Aufruf: python -m benchmarks.trajectory_store [--rows 100000000]
+# ==============================================================================
+import argparse
+import resource
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from src.sim.trajectories import COLUMNS, SYSTEMS, TrajectoryStore, TrajectoryWriter
+
+def synthetic_columns(n: int, first_game: int, rng: np.random.Generator, rounds: int = 50) -> dict:
+    """Games of `rounds` rows each with plausible value ranges (content is irrelevant for timing)."""
+    games = n // rounds
+    columns = {
+        "seed": np.repeat(np.arange(first_game, first_game + games, dtype=np.uint64), rounds),
+        "round": np.tile(np.arange(1, rounds + 1, dtype=np.int32), games),
+        "crew": np.repeat(rng.integers(1, 5, games, dtype=np.int8), rounds),
+    }
+    for system in SYSTEMS:
+        columns[system] = rng.integers(0, 9, games * rounds, dtype=np.int8)
+        columns[f"spent_{system}"] = rng.integers(0, 4, games * rounds, dtype=np.int16)
+    for name, dtype in COLUMNS:
+        if name not in columns:
+            columns[name] = rng.integers(-1, 9, games * rounds).astype(dtype)
+    return columns
+
+def max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000_000)
+    parser.add_argument("--directory", default=None, help="Standard: temporäres Verzeichnis, danach gelöscht")
+    args = parser.parse_args()
+
+    directory = args.directory or tempfile.mkdtemp(prefix="trajectories-")
+    try:
+        rng = np.random.default_rng(0)
+        writer = TrajectoryWriter(directory, prefix="bench")
+        step = 5_000_000
+        start = time.perf_counter()
+        for first in range(0, args.rows, step):
+            writer.append_columns(synthetic_columns(min(step, args.rows - first), first, rng))
+        write_time = time.perf_counter() - start
+        print(f"Geschrieben: {writer.rows_written} Zeilen in {writer.chunks_written} Chunks, "
+              f"{write_time:.1f} s ({writer.rows_written / write_time / 1e6:.1f} Mio. Zeilen/s)")
+
+        rss_before = max_rss_mb()
+        store = TrajectoryStore(directory)
+        start = time.perf_counter()
+        histogram = store.histogram("oxygen", round=5, crew=3)
+        query_time = time.perf_counter() - start
+        print(f"Sauerstoff in Runde 5 bei 3er-Crews: {sum(histogram.values())} Treffer in {query_time:.2f} s "
+              f"({len(store) / query_time / 1e6:.0f} Mio. Zeilen/s gescannt)")
+        print(f"Verteilung: {histogram}")
+
+        start = time.perf_counter()
+        count = store.count(round=(45, 50), outcome=3)
+        print(f"Niederlagen in Runde 45-50: {count} in {time.perf_counter() - start:.2f} s")
+        print(f"Spitzen-RSS: {rss_before:.0f} MB vor den Abfragen, {max_rss_mb():.0f} MB danach "
+              f"(Daten: {len(store) * sum(np.dtype(t).itemsize for _, t in COLUMNS) / 1e6:.0f} MB)")
+    finally:
+        if not args.directory:
+            shutil.rmtree(directory)
+
+if __name__ == "__main__":
+    main()
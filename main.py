@@ -2,25 +2,31 @@
 # main.py
 # KORRIGIERT: Behebt NameError und ValueError. Stellt volle Funktionalität wieder her.
 # ==============================================================================
+import argparse
+import os
 import pygame
 import sys
-from typing import Dict, List, Optional, Set, Tuple
+import time
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple
 from collections import defaultdict
-from src.game.game_state import GameState, SETUP_SCREEN, AKTIONSPHASE, AUFLOESUNGSPHASE, VORBEREITUNGSPHASE, GAME_OVER
-
-pygame.init()
-SCREEN_WIDTH, SCREEN_HEIGHT = 1280, 720
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Mission Enceladus - Prototyp")
-font = pygame.font.SysFont("Arial", 24, bold=True)
-big_font = pygame.font.SysFont("Arial", 36, bold=True)
-small_font = pygame.font.SysFont("Arial", 18)
-clock = pygame.time.Clock()
-
-# --- Layout & Farben ---
-LEFT_PANEL_WIDTH = int(SCREEN_WIDTH * 0.15)
-RIGHT_PANEL_WIDTH = int(SCREEN_WIDTH * 0.15)
-CENTER_PANEL_WIDTH = SCREEN_WIDTH - LEFT_PANEL_WIDTH - RIGHT_PANEL_WIDTH
+from src.ai.advisor import Advisor
+from src.game.action_log import ActionLogWriter, check_seed
+from src.game.game_state import GameState, SETUP_SCREEN, AKTIONSPHASE, AUFLOESUNGSPHASE, GAME_OVER, SPECIALIZATIONS
+from src.game.tracing import Tracer
+from src.ui.animation import ResolutionAnimation
+from src.ui.frame_histogram import FrameHistogram
+from src.ui.layout import BASE_HEIGHT, BASE_WIDTH, ControlMap, Gauge, Layout
+from src.ui.retained import RetainedLayer, RetainedRenderer, Widget
+from src.ui.scheduler import FrameScheduler
+from src.ui.text_cache import render_text
+
+SCREEN_WIDTH, SCREEN_HEIGHT = BASE_WIDTH, BASE_HEIGHT
+# Erst durch init_display() gesetzt: der Import allein öffnet kein Fenster (Benchmarks, Werkzeuge)
+screen: Optional[pygame.Surface] = None
+layout: Optional[Layout] = None
+font = big_font = small_font = None
+
+# --- Farben (alle Rechtecke liefert das aktuelle Layout) ---
 COLOR_BACKGROUND = (10, 20, 40)
 COLOR_PANEL_BG = (15, 30, 50)
 COLOR_WHITE = (220, 220, 220)
@@ -29,179 +35,428 @@ COLOR_YELLOW = (255, 255, 0)
 COLOR_GREEN = (0, 200, 0)
 COLOR_RED = (200, 0, 0)
 
-def draw_text(surface, text, pos, color=COLOR_WHITE, f=font, center=False):
-    text_surface = f.render(text, True, color)
+DEFAULT_RECORDING_PATH = os.path.join("recordings", "missions.mlog")
+ADVICE_EVENT = pygame.USEREVENT + 2  # neuer Ratschlag aus dem Worker, weckt die Ereignisschleife
+
+advisor: Optional[Advisor] = None
+tracer: Optional[Tracer] = None
+trace_path: Optional[str] = None
+
+def init_display(size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT), flags: int = pygame.RESIZABLE) -> pygame.Surface:
+    """Initialises pygame, opens the window and lays it out; call once before drawing."""
+    global screen
+    pygame.init()
+    screen = pygame.display.set_mode(size, flags)
+    pygame.display.set_caption("Mission Enceladus - Prototyp")
+    apply_layout(Layout(*screen.get_size()))
+    return screen
+
+def apply_layout(new_layout: Layout):
+    """Switches all drawing to `new_layout`; static layers must be re-baked afterwards."""
+    global layout, font, big_font, small_font
+    layout = new_layout
+    font, big_font, small_font = layout.font, layout.big_font, layout.small_font
+    _controls.clear()
+
+def draw_text(surface, text, pos, color=COLOR_WHITE, f=None, center=False):
+    text_surface = render_text(f or font, text, color)
     text_rect = text_surface.get_rect(center=pos) if center else text_surface.get_rect(topleft=pos)
     surface.blit(text_surface, text_rect)
 
-def draw_setup_screen(surface, selected_indices: Set[int]) -> Tuple[List[pygame.Rect], pygame.Rect]:
+CHAR_NAMES = ["Sauerstoff", "Wasser", "Temperatur", "Luftdruck"]
+
+def draw_setup_chrome(surface):
     surface.fill(COLOR_BACKGROUND)
-    draw_text(surface, "CREW-MANIFEST", (SCREEN_WIDTH / 2, 100), center=True, f=big_font)
-    char_rects = []
-    char_names = ["Sauerstoff", "Wasser", "Temperatur", "Luftdruck"]
-    for i, name in enumerate(char_names):
-        rect = pygame.Rect(200 + i * 220, 250, 200, 250)
-        char_rects.append(rect)
-        color = COLOR_YELLOW if i in selected_indices else COLOR_GREY
-        pygame.draw.rect(surface, color, rect, 5, border_radius=10)
-        draw_text(surface, name, rect.midtop + pygame.Vector2(0, 20), center=True)
-    start_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - 150, 600, 300, 70)
-    is_ready = 1 <= len(selected_indices) <= 4
+    draw_text(surface, "CREW-MANIFEST", layout.title_pos, center=True, f=big_font)
+
+def draw_character_card(surface, index: int, selected: bool):
+    rect = layout.char_rects[index]
+    color = COLOR_YELLOW if selected else COLOR_GREY
+    pygame.draw.rect(surface, color, rect, layout.px(5), border_radius=layout.px(10))
+    draw_text(surface, CHAR_NAMES[index], rect.midtop + pygame.Vector2(0, layout.px(20)), center=True)
+
+def draw_start_button(surface, is_ready: bool):
+    start_button_rect = layout.start_button
     button_color = COLOR_GREEN if is_ready else COLOR_GREY
-    pygame.draw.rect(surface, button_color, start_button_rect, border_radius=10)
+    pygame.draw.rect(surface, button_color, start_button_rect, border_radius=layout.px(10))
     draw_text(surface, "MISSION STARTEN", start_button_rect.center, center=True)
-    return char_rects, start_button_rect
-
-def draw_game_over_screen(surface, game_state: GameState) -> Tuple[pygame.Rect, pygame.Rect]:
-    overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
-    surface.blit(overlay, (0,0))
-    draw_text(surface, "MISSION GESCHEITERT", (SCREEN_WIDTH/2, 150), center=True, f=big_font, color=COLOR_RED)
-    draw_text(surface, f"Reisedauer: {game_state.round_counter} Runden", (SCREEN_WIDTH/2, 250), center=True)
-    draw_text(surface, f"Gemeisterte Herausforderungen: {game_state.challenges_completed_counter}", (SCREEN_WIDTH/2, 300), center=True)
-    draw_text(surface, f"Weiteste Etappe: {game_state.mission_progress} / 10", (SCREEN_WIDTH/2, 350), center=True)
-    new_mission_rect = pygame.Rect(SCREEN_WIDTH/2 - 350, 500, 300, 70)
-    pygame.draw.rect(surface, COLOR_GREEN, new_mission_rect, border_radius=10)
-    draw_text(surface, "Neue Mission starten", new_mission_rect.center, center=True)
-    exit_rect = pygame.Rect(SCREEN_WIDTH/2 + 50, 500, 300, 70)
-    pygame.draw.rect(surface, COLOR_RED, exit_rect, border_radius=10)
-    draw_text(surface, "Mission beenden", exit_rect.center, center=True)
-    return new_mission_rect, exit_rect
-    
-def draw_cockpit(surface, game_state: GameState) -> List[Tuple[pygame.Rect, str, int]]:
-    interactive_elements = []
-    cockpit_rect = pygame.Rect(LEFT_PANEL_WIDTH, 0, CENTER_PANEL_WIDTH, SCREEN_HEIGHT)
-    
-    systems = {"oxygen": "Sauerstoff", "water": "Wasser", "temperature": "Temperatur", "airpressure": "Luftdruck"}
-    for i, (sys_key, sys_name) in enumerate(systems.items()):
-        x_pos = cockpit_rect.x + 30 + (i * (CENTER_PANEL_WIDTH / 4))
-        draw_text(surface, sys_name, (x_pos, 50))
-        value = getattr(game_state, sys_key)
-        for j in range(6):
-            color = COLOR_GREEN if j < value else COLOR_GREY
-            pygame.draw.rect(surface, color, (x_pos, 100 + j * 30, 150, 20))
-        
-        plus_rect = pygame.Rect(x_pos + 160, 100, 40, 95)
-        minus_rect = pygame.Rect(x_pos + 160, 205, 40, 75)
-        pygame.draw.rect(surface, COLOR_GREEN, plus_rect)
-        pygame.draw.rect(surface, COLOR_RED, minus_rect)
-        draw_text(surface, "+", plus_rect.center, center=True)
-        draw_text(surface, "-", minus_rect.center, center=True)
-        interactive_elements.append((plus_rect, sys_key, 1))
-        interactive_elements.append((minus_rect, sys_key, -1))
-        
-    nav_systems = {"thrust": "Schub", "navigation": "Navigation"}
-    for i, (sys_key, sys_name) in enumerate(nav_systems.items()):
-        x_pos = cockpit_rect.x + 100 + (i * 450)
-        draw_text(surface, sys_name, (x_pos, 350))
-        value = getattr(game_state, sys_key)
-        for j in range(8):
-             color = COLOR_YELLOW if j < value else COLOR_GREY
-             pygame.draw.rect(surface, color, (x_pos, 400 + j * 25, 150, 20))
-        plus_rect = pygame.Rect(x_pos + 160, 400, 40, 95)
-        minus_rect = pygame.Rect(x_pos + 160, 505, 40, 95)
-        pygame.draw.rect(surface, COLOR_GREEN, plus_rect)
-        pygame.draw.rect(surface, COLOR_RED, minus_rect)
-        draw_text(surface, "+", plus_rect.center, center=True)
-        draw_text(surface, "-", minus_rect.center, center=True)
-        interactive_elements.append((plus_rect, sys_key, 1))
-        interactive_elements.append((minus_rect, sys_key, -1))
-        
-    draw_text(surface, f"Energie: {game_state.energy_pool}", (cockpit_rect.centerx, 650), center=True, f=big_font)
-    
-    if game_state.current_challenge:
-        challenge = game_state.current_challenge
-        draw_text(surface, f"Herausforderung: {challenge.name}", (cockpit_rect.centerx, 500), center=True)
-        draw_text(surface, f"Ziel: Schub {challenge.target_thrust} | Navigation {challenge.target_navigation}", (cockpit_rect.centerx, 540), center=True)
-    return interactive_elements
 
-def draw_zone1_travel_map(surface, progress: int, total_steps: int = 10):
-    map_rect = pygame.Rect(0, 0, LEFT_PANEL_WIDTH, SCREEN_HEIGHT)
+def draw_setup_screen(surface, selected_indices: Set[int]):
+    draw_setup_chrome(surface)
+    for i in range(len(CHAR_NAMES)):
+        draw_character_card(surface, i, i in selected_indices)
+    draw_start_button(surface, 1 <= len(selected_indices) <= 4)
+
+def draw_game_over_screen(surface, game_state: GameState):
+    surface.blit(layout.dim_overlay(), (0, 0))
+    title_pos, rounds_pos, challenges_pos, progress_pos = layout.game_over_lines
+    draw_text(surface, "MISSION GESCHEITERT", title_pos, center=True, f=big_font, color=COLOR_RED)
+    draw_text(surface, f"Reisedauer: {game_state.round_counter} Runden", rounds_pos, center=True)
+    draw_text(surface, f"Gemeisterte Herausforderungen: {game_state.challenges_completed_counter}", challenges_pos, center=True)
+    draw_text(surface, f"Weiteste Etappe: {game_state.mission_progress} / 10", progress_pos, center=True)
+    pygame.draw.rect(surface, COLOR_GREEN, layout.new_mission_button, border_radius=layout.px(10))
+    draw_text(surface, "Neue Mission starten", layout.new_mission_button.center, center=True)
+    pygame.draw.rect(surface, COLOR_RED, layout.exit_button, border_radius=layout.px(10))
+    draw_text(surface, "Mission beenden", layout.exit_button.center, center=True)
+
+def draw_cockpit_chrome(surface):
+    for gauge in layout.gauges:
+        draw_text(surface, gauge.sys_name, gauge.label_pos)
+        pygame.draw.rect(surface, COLOR_GREEN, gauge.plus_rect)
+        pygame.draw.rect(surface, COLOR_RED, gauge.minus_rect)
+        draw_text(surface, "+", gauge.plus_rect.center, center=True)
+        draw_text(surface, "-", gauge.minus_rect.center, center=True)
+
+def draw_gauge(surface, gauge: Gauge, value: int):
+    for j, segment in enumerate(gauge.segment_rects):
+        color = gauge.color if j < value else COLOR_GREY
+        pygame.draw.rect(surface, color, segment)
+
+def draw_energy(surface, energy_pool: int):
+    draw_text(surface, f"Energie: {energy_pool}", layout.energy.center, center=True, f=big_font)
+
+def draw_challenge(surface, challenge):
+    if challenge:
+        name_pos, target_pos = layout.challenge_lines
+        draw_text(surface, f"Herausforderung: {challenge.name}", name_pos, center=True)
+        draw_text(surface, f"Ziel: Schub {challenge.target_thrust} | Navigation {challenge.target_navigation}", target_pos, center=True)
+
+def advised_clicks(system: str) -> int:
+    advice = advisor.current if advisor else None
+    return advice.clicks(system) if advice else 0
+
+def draw_advice(surface, gauge: Gauge, clicks: int):
+    """Highlights a "+" button the advisor recommends, with the number of clicks."""
+    if not clicks: return
+    pygame.draw.rect(surface, COLOR_YELLOW, gauge.plus_rect, layout.px(3))
+    draw_text(surface, f"{clicks}x", gauge.plus_rect.midbottom + pygame.Vector2(0, -layout.px(14)), center=True, f=small_font)
+
+def draw_advisor_status(surface, status: str):
+    draw_text(surface, status, layout.advisor_status.center, color=COLOR_GREY, f=small_font, center=True)
+
+def draw_cockpit(surface, game_state: GameState):
+    draw_cockpit_chrome(surface)
+    for gauge in layout.gauges:
+        draw_gauge(surface, gauge, getattr(game_state, gauge.sys_key))
+        if advisor: draw_advice(surface, gauge, advised_clicks(gauge.sys_key))
+    draw_energy(surface, game_state.energy_pool)
+    draw_challenge(surface, game_state.current_challenge)
+    if advisor: draw_advisor_status(surface, advisor.status())
+
+def draw_travel_map_chrome(surface, total_steps: int = 10):
+    map_rect, start_y, end_y = layout.travel_map, layout.travel_start_y, layout.travel_end_y
     pygame.draw.rect(surface, COLOR_PANEL_BG, map_rect)
-    start_pos_y = map_rect.height - 50
-    end_pos_y = 50
-    draw_text(surface, "🌍", (map_rect.centerx, start_pos_y), f=big_font, center=True)
-    draw_text(surface, "🪐", (map_rect.centerx, end_pos_y), f=big_font, center=True)
-    path_height = start_pos_y - end_pos_y
+    draw_text(surface, "🌍", (map_rect.centerx, start_y), f=big_font, center=True)
+    draw_text(surface, "🪐", (map_rect.centerx, end_y), f=big_font, center=True)
+    path_height, tick = start_y - end_y, layout.px(10)
     for i in range(1, total_steps):
-        y = start_pos_y - (i * path_height / total_steps)
-        pygame.draw.line(surface, COLOR_GREY, (map_rect.centerx - 10, y), (map_rect.centerx + 10, y), 2)
-    rocket_y = start_pos_y - (progress * path_height / total_steps)
-    draw_text(surface, "🚀", (map_rect.centerx, rocket_y), f=big_font, center=True)
-    
-def draw_zone3_crew_control(surface, game_state: GameState) -> Dict:
-    crew_rect = pygame.Rect(LEFT_PANEL_WIDTH + CENTER_PANEL_WIDTH, 0, RIGHT_PANEL_WIDTH, SCREEN_HEIGHT)
-    pygame.draw.rect(surface, COLOR_PANEL_BG, crew_rect)
-    portrait_rects, ready_button_rects = [], []
-    if not game_state.players: return {"portrait_rects": [], "ready_button_rects": []}
-    for i, player in enumerate(game_state.players):
-        y_pos = 50 + i * 150
-        rect = pygame.Rect(crew_rect.x + 20, y_pos, crew_rect.width - 40, 80)
-        portrait_rects.append(rect)
-        is_active = player == game_state.active_character
-        pygame.draw.rect(surface, COLOR_GREY, rect, border_radius=5)
-        if is_active: pygame.draw.rect(surface, COLOR_YELLOW, rect, 4, border_radius=5)
-        draw_text(surface, f"{player.name}", rect.center, center=True, f=small_font)
-        if player.is_ready: draw_text(surface, "✓", rect.topright + pygame.Vector2(-15, 5), color=COLOR_GREEN, f=big_font)
-        ready_rect = pygame.Rect(crew_rect.x + 20, y_pos + 90, crew_rect.width - 40, 40)
-        ready_button_rects.append(ready_rect)
-        button_color = COLOR_GREEN if player.is_ready else COLOR_RED
-        pygame.draw.rect(surface, button_color, ready_rect, border_radius=10)
-        draw_text(surface, "Bereit", ready_rect.center, center=True, f=small_font)
-    return {"portrait_rects": portrait_rects, "ready_button_rects": ready_button_rects}
+        y = start_y - (i * path_height / total_steps)
+        pygame.draw.line(surface, COLOR_GREY, (map_rect.centerx - tick, y), (map_rect.centerx + tick, y), layout.px(2))
+
+def draw_rocket(surface, progress: int, total_steps: int = 10):
+    path_height = layout.travel_start_y - layout.travel_end_y
+    rocket_y = layout.travel_start_y - (progress * path_height / total_steps)
+    draw_text(surface, "🚀", (layout.travel_map.centerx, rocket_y), f=big_font, center=True)
+
+def draw_zone1_travel_map(surface, progress: int, total_steps: int = 10):
+    draw_travel_map_chrome(surface, total_steps)
+    draw_rocket(surface, progress, total_steps)
+
+def draw_crew_card(surface, game_state: GameState, index: int):
+    player = game_state.players[index]
+    rect, ready_rect = layout.crew_cards[index]
+    is_active = player == game_state.active_character
+    pygame.draw.rect(surface, COLOR_GREY, rect, border_radius=layout.px(5))
+    if is_active: pygame.draw.rect(surface, COLOR_YELLOW, rect, layout.px(4), border_radius=layout.px(5))
+    draw_text(surface, f"{player.name}", rect.center, center=True, f=small_font)
+    if player.is_ready:
+        draw_text(surface, "✓", rect.topright + pygame.Vector2(-layout.px(15), layout.px(5)), color=COLOR_GREEN, f=big_font)
+    button_color = COLOR_GREEN if player.is_ready else COLOR_RED
+    pygame.draw.rect(surface, button_color, ready_rect, border_radius=layout.px(10))
+    draw_text(surface, "Bereit", ready_rect.center, center=True, f=small_font)
+
+def draw_zone3_crew_control(surface, game_state: GameState):
+    pygame.draw.rect(surface, COLOR_PANEL_BG, layout.crew_panel)
+    for i in range(len(game_state.players)):
+        draw_crew_card(surface, game_state, i)
+
+# --- Klickziele: je Bildschirm und Layout einmal aufgebaut ---
+_controls: Dict[Tuple[str, int], ControlMap] = {}
+
+def controls_for(screen_name: str, game_state: GameState) -> ControlMap:
+    """The click targets of `screen_name` for the current layout, built on first use after a resize."""
+    key = (screen_name, len(game_state.players))
+    controls = _controls.get(key)
+    if controls is None:
+        controls = _controls[key] = layout.control_map()
+        if screen_name == SETUP_SCREEN:
+            for i, rect in enumerate(layout.char_rects): controls.add(rect, ("select_character", i))
+            controls.add(layout.start_button, ("start",))
+        elif screen_name == GAME_OVER:
+            controls.add(layout.new_mission_button, ("new_mission",))
+            controls.add(layout.exit_button, ("exit",))
+        else:
+            for gauge in layout.gauges:
+                controls.add(gauge.plus_rect, ("modify", gauge.sys_key, 1))
+                controls.add(gauge.minus_rect, ("modify", gauge.sys_key, -1))
+            for i in range(len(game_state.players)):
+                portrait_rect, ready_rect = layout.crew_cards[i]
+                controls.add(portrait_rect, ("set_active", i))
+                controls.add(ready_rect, ("toggle_ready", i))
+    return controls
+
+def draw_frame(surface, game_state: GameState) -> ControlMap:
+    """Full immediate-mode redraw of the current screen; returns its click targets."""
+    surface.fill(COLOR_BACKGROUND)
+    if game_state.current_phase == SETUP_SCREEN:
+        draw_setup_screen(surface, game_state.selected_character_indices)
+    elif game_state.current_phase == GAME_OVER:
+        draw_game_over_screen(surface, game_state)
+    else:
+        draw_zone1_travel_map(surface, game_state.mission_progress)
+        draw_cockpit(surface, game_state)
+        draw_zone3_crew_control(surface, game_state)
+    return controls_for(screen_for_phase(game_state.current_phase), game_state)
+
+# --- Retained Mode: statische Elemente gebacken, Widgets nur bei Änderung ---
+def _bake_setup(surface, game_state: GameState) -> ControlMap:
+    draw_setup_chrome(surface)
+    return controls_for(SETUP_SCREEN, game_state)
+
+def _setup_widgets(game_state: GameState) -> List[Widget]:
+    widgets = [Widget(rect, lambda gs, i=i: i in gs.selected_character_indices,
+                      lambda surface, gs, i=i: draw_character_card(surface, i, i in gs.selected_character_indices))
+               for i, rect in enumerate(layout.char_rects)]
+    widgets.append(Widget(layout.start_button, lambda gs: 1 <= len(gs.selected_character_indices) <= 4,
+                          lambda surface, gs: draw_start_button(surface, 1 <= len(gs.selected_character_indices) <= 4)))
+    return widgets
+
+def _bake_game(surface, game_state: GameState) -> ControlMap:
+    surface.fill(COLOR_BACKGROUND)
+    draw_travel_map_chrome(surface)
+    draw_cockpit_chrome(surface)
+    pygame.draw.rect(surface, COLOR_PANEL_BG, layout.crew_panel)
+    return controls_for("Mission", game_state)
+
+def _challenge_key(gs: GameState):
+    challenge = gs.current_challenge
+    return (challenge.name, challenge.target_thrust, challenge.target_navigation) if challenge else None
+
+def _game_widgets(game_state: GameState) -> List[Widget]:
+    widgets = [Widget(layout.travel_map, lambda gs: gs.mission_progress, lambda surface, gs: draw_rocket(surface, gs.mission_progress))]
+    for gauge in layout.gauges:
+        widgets.append(Widget(gauge.rect, lambda gs, k=gauge.sys_key: getattr(gs, k),
+                              lambda surface, gs, g=gauge: draw_gauge(surface, g, getattr(gs, g.sys_key))))
+    widgets.append(Widget(layout.energy, lambda gs: gs.energy_pool, lambda surface, gs: draw_energy(surface, gs.energy_pool)))
+    widgets.append(Widget(layout.challenge, _challenge_key, lambda surface, gs: draw_challenge(surface, gs.current_challenge)))
+    if advisor:
+        for gauge in layout.gauges:
+            widgets.append(Widget(gauge.plus_rect, lambda gs, k=gauge.sys_key: advised_clicks(k),
+                                  _timed(lambda surface, gs, g=gauge: draw_advice(surface, g, advised_clicks(g.sys_key)))))
+        widgets.append(Widget(layout.advisor_status, lambda gs: advisor.status(),
+                              _timed(lambda surface, gs: draw_advisor_status(surface, advisor.status()))))
+    for i in range(len(game_state.players)):
+        widgets.append(Widget(layout.crew_strips[i], lambda gs, i=i: (gs.players[i].name, gs.players[i] == gs.active_character, gs.players[i].is_ready),
+                              lambda surface, gs, i=i: draw_crew_card(surface, gs, i)))
+    return widgets
+
+def _timed(draw_fn):
+    """Counts a widget's drawing time towards the advisor's added frame time."""
+    def draw(surface, gs):
+        start = time.perf_counter()
+        draw_fn(surface, gs)
+        advisor.add_frame_time(time.perf_counter() - start)
+    return draw
+
+def _bake_game_over(surface, game_state: GameState) -> ControlMap:
+    surface.fill(COLOR_BACKGROUND)
+    draw_game_over_screen(surface, game_state)
+    return controls_for(GAME_OVER, game_state)
+
+def create_renderer() -> RetainedRenderer:
+    return RetainedRenderer({
+        SETUP_SCREEN: RetainedLayer(_bake_setup, _setup_widgets),
+        "Mission": RetainedLayer(_bake_game, _game_widgets),
+        GAME_OVER: RetainedLayer(_bake_game_over, lambda gs: []),
+    })
+
+def screen_for_phase(phase: str) -> str:
+    return phase if phase in (SETUP_SCREEN, GAME_OVER) else "Mission"
+
+def new_mission(seed: Optional[int], recording: Optional[BinaryIO]) -> GameState:
+    game_state = GameState(seed, tracer=tracer)
+    if recording: game_state.recorder = ActionLogWriter(recording, game_state.seed)
+    return game_state
+
+# --- Auflösungs-Animation ---
+def create_resolution_animation(game_state: GameState, challenge, success: Optional[bool]) -> ResolutionAnimation:
+    """Built right after begin_resolution; `challenge` is the card that was just resolved."""
+    provided = {"Schub": game_state.thrust, "Navigation": game_state.navigation}
+    required = {"Schub": challenge.target_thrust, "Navigation": challenge.target_navigation} if challenge else {}
+    decay_marks = [(gauge.rect, f"-{game_state.rules.decay}") for gauge in layout.gauges if gauge.sys_key in SPECIALIZATIONS]
+    crew_rects = [layout.crew_cards[i][0] for i in range(len(game_state.players))]
+    next_active = (game_state.players.index(game_state.active_character) + 1) % len(game_state.players)
+    return ResolutionAnimation(success, provided, required, layout.resolution, decay_marks, crew_rects, next_active, layout)
+
+def start_resolution_animation(game_state: GameState, challenge, success: Optional[bool],
+                               elapsed: float = 0.0) -> ResolutionAnimation:
+    resolution = create_resolution_animation(game_state, challenge, success)
+    resolution.elapsed = elapsed
+    if tracer: resolution.draw = tracer.wrap(resolution.draw, "ResolutionAnimation.draw")
+    return resolution
+
+def close_recording(game_state: GameState):
+    """Appends the mission's action log to the archive, once it has actually started."""
+    recorder = game_state.recorder
+    if not recorder or recorder.closed or not game_state.players:
+        return  # läuft in jedem GAME_OVER-Frame: nur der erste schreibt und braucht einen Snapshot
+    # Das Log kennt nur den ganzen Schritt FINISH_ACTION_PHASE: eine laufende Auflösung erst abschließen
+    if game_state.current_phase == AUFLOESUNGSPHASE: game_state.complete_resolution()
+    recorder.close(game_state.snapshot())
+
+def quit_game(game_state: GameState):
+    close_recording(game_state)
+    if advisor: advisor.close()
+    if tracer and trace_path:
+        tracer.save(trace_path)
+        print(f"Trace gespeichert: {trace_path} ({tracer.recorded} Ereignisse)")
+    pygame.quit(); sys.exit()
+
+# --- Diagnose ---
+def instrument_draw_functions(tracer: Tracer):
+    """Replaces this module's draw_* functions with traced wrappers; callers look them up at call time."""
+    namespace = globals()
+    for name, fn in list(namespace.items()):
+        if name.startswith("draw_") and name != "draw_text" and callable(fn):
+            namespace[name] = tracer.wrap(fn, name)
+
+def seed_argument(text: str) -> int:
+    seed = int(text)  # ValueError meldet argparse selbst als ungültigen Wert
+    try:
+        return check_seed(seed)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
 
 def main():
-    game_state = GameState()
-    interactive_rects = {}
+    parser = argparse.ArgumentParser(description="Mission Enceladus")
+    parser.add_argument("--seed", type=seed_argument, default=None, help="Seed der ersten Mission (zum Nachspielen)")
+    parser.add_argument("--record", default=DEFAULT_RECORDING_PATH, help="Archiv für Aktionslogs")
+    parser.add_argument("--no-record", action="store_true")
+    parser.add_argument("--full-redraw", action="store_true")
+    parser.add_argument("--fixed-fps", action="store_true")
+    parser.add_argument("--scheduler-stats", action="store_true")
+    parser.add_argument("--no-advisor", action="store_true", help="Spielberater abschalten")
+    parser.add_argument("--trace", metavar="DATEI", default=None, help="Chrome-Trace (JSON) beim Beenden schreiben")
+    parser.add_argument("--trace-console", action="store_true", help="Trace-Ereignisse zeilenweise ausgeben")
+    parser.add_argument("--frame-histogram", action="store_true", help="Frame-Zeit-Histogramm einblenden (F3)")
+    args = parser.parse_args()
+
+    init_display()
+    global screen, advisor, tracer, trace_path
+    if args.trace or args.trace_console:
+        tracer = Tracer(echo=sys.stdout if args.trace_console else None)
+        trace_path = args.trace
+        instrument_draw_functions(tracer)
+    if not args.no_advisor:
+        advisor = Advisor(on_result=lambda: pygame.event.post(pygame.event.Event(ADVICE_EVENT)))
+
+    recording = None
+    if not args.no_record:
+        os.makedirs(os.path.dirname(args.record) or ".", exist_ok=True)
+        recording = open(args.record, "ab")
+    scheduler = FrameScheduler(fps=60, always_animate=args.fixed_fps,
+                               report_interval=5.0 if args.scheduler_stats else None)
+    if args.scheduler_stats: scheduler.start_latency_probe()
+    game_state = new_mission(args.seed, recording)
+    renderer = create_renderer()
+    controls: Optional[ControlMap] = None
+    frame_histogram, show_histogram = FrameHistogram(layout=layout), args.frame_histogram
+    resolution: Optional[ResolutionAnimation] = None
+    resolved = None  # (Karte, Ergebnis) der laufenden Auflösung, zum Neuaufbau nach einer Größenänderung
+    overlay_rects: List[pygame.Rect] = []  # von der Animation im letzten Frame bemalt
     
     while True:
-        mouse_pos = pygame.mouse.get_pos()
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT: pygame.quit(); sys.exit()
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        window_exposed = False
+        events = scheduler.wait_events()
+        frame_start = time.perf_counter()  # Warten auf Eingaben zählt nicht zur Frame-Zeit
+        for event in events:
+            if event.type == pygame.QUIT: quit_game(game_state)
+            if event.type == pygame.WINDOWEXPOSED: window_exposed = True
+            if event.type == pygame.VIDEORESIZE:
+                # Einmal neu auslegen und in nativer Auflösung neu backen statt jeden Frame zu skalieren
+                screen = pygame.display.get_surface()
+                apply_layout(Layout(*screen.get_size()))
+                frame_histogram.set_layout(layout)
+                renderer.invalidate()
+                controls, overlay_rects, window_exposed = None, [], True
+                if resolution:
+                    elapsed, resolution.elapsed = resolution.elapsed, resolution.duration  # der Scheduler verwirft die alte
+                    resolution = start_resolution_animation(game_state, *resolved, elapsed)
+                    scheduler.add_animation(resolution)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                show_histogram = not show_histogram
+                renderer.invalidate()
+            if event.type == pygame.KEYDOWN and (event.key == pygame.K_BACKSPACE or (event.key == pygame.K_z and event.mod & pygame.KMOD_CTRL)):
+                game_state.undo()
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and controls:
+                action = controls.lookup(event.pos)
+                kind = action[0] if action else None
                 if game_state.current_phase == SETUP_SCREEN:
-                    if interactive_rects.get('start_button').collidepoint(mouse_pos) and 1 <= len(game_state.selected_character_indices) <= 4:
+                    if kind == "start" and 1 <= len(game_state.selected_character_indices) <= 4:
                         game_state.start_game()
-                    else:
-                        for i, rect in enumerate(interactive_rects.get('char_rects', [])):
-                            if rect.collidepoint(mouse_pos):
-                                if i in game_state.selected_character_indices: game_state.selected_character_indices.remove(i)
-                                else: game_state.selected_character_indices.add(i)
+                    elif kind == "select_character":
+                        game_state.toggle_character_selection(action[1])
                 elif game_state.current_phase == AKTIONSPHASE:
-                    for i, rect in enumerate(interactive_rects.get('portrait_rects', [])):
-                        if rect.collidepoint(mouse_pos): game_state.active_character = game_state.players[i]
-                    for i, rect in enumerate(interactive_rects.get('ready_button_rects', [])):
-                        if rect.collidepoint(mouse_pos): game_state.players[i].is_ready = not game_state.players[i].is_ready
-                    for rect, system, amount in interactive_rects.get('cockpit_buttons', []):
-                        if rect.collidepoint(mouse_pos):
-                            game_state.modify_system_value(system, amount)
+                    if kind == "set_active": game_state.set_active_character(action[1])
+                    elif kind == "toggle_ready": game_state.toggle_ready(action[1])
+                    elif kind == "modify":
+                        game_state.modify_system_value(action[1], action[2], record_undo=True)
                 elif game_state.current_phase == GAME_OVER:
-                    new_mission_button, exit_button = interactive_rects.get('new_mission_button'), interactive_rects.get('exit_button')
-                    if new_mission_button and new_mission_button.collidepoint(mouse_pos): game_state = GameState()
-                    if exit_button and exit_button.collidepoint(mouse_pos): pygame.quit(); sys.exit()
+                    if kind == "new_mission":
+                        close_recording(game_state)
+                        game_state = new_mission(None, recording)
+                    elif kind == "exit": quit_game(game_state)
 
+        # Eingaben dieses Frames sofort ins Archiv: stürzt das Spiel ab, bleibt das Log bis hierher nachspielbar
+        if game_state.recorder: game_state.recorder.flush()
+        logic_start = time.perf_counter()
         if game_state.current_phase == AKTIONSPHASE and game_state.players and all(p.is_ready for p in game_state.players):
-            game_state.current_phase = AUFLOESUNGSPHASE
-            game_state.resolve_challenge()
-            if not game_state.check_for_defeat():
-                game_state.current_phase = VORBEREITUNGSPHASE
-                game_state.prepare_next_round()
-
-        screen.fill(COLOR_BACKGROUND)
-        if game_state.current_phase == SETUP_SCREEN:
-            char_rects, start_button_rect = draw_setup_screen(screen, game_state.selected_character_indices)
-            interactive_rects = {'char_rects': char_rects, 'start_button': start_button_rect}
-        elif game_state.current_phase == GAME_OVER:
-            new_mission_button, exit_button = draw_game_over_screen(screen, game_state)
-            interactive_rects = {'new_mission_button': new_mission_button, 'exit_button': exit_button}
-        else:
-            draw_zone1_travel_map(screen, game_state.mission_progress)
-            cockpit_buttons = draw_cockpit(screen, game_state)
-            crew_controls = draw_zone3_crew_control(screen, game_state)
-            interactive_rects = {**crew_controls, 'cockpit_buttons': cockpit_buttons}
+            challenge = game_state.current_challenge
+            resolved = (challenge, game_state.begin_resolution())
+            resolution = start_resolution_animation(game_state, *resolved)
+            scheduler.add_animation(resolution)
+        elif resolution and resolution.is_finished:
+            game_state.complete_resolution()
+            resolution = resolved = None
+        if game_state.current_phase == GAME_OVER: close_recording(game_state)
+        if advisor: advisor.update(game_state)
 
-        pygame.display.flip()
-        clock.tick(60)
+        render_start = time.perf_counter()
+        if args.full_redraw:
+            controls = draw_frame(screen, game_state)
+            if resolution: resolution.draw(screen)
+            if show_histogram: frame_histogram.draw(screen, layout.histogram)
+            present_start = time.perf_counter()
+            pygame.display.flip()
+        else:
+            dirty_rects = renderer.render(screen, screen_for_phase(game_state.current_phase), game_state)
+            controls = renderer.controls
+            # Overlay des letzten Frames aus Hintergrund und Widgets wiederherstellen, dann neu zeichnen
+            if overlay_rects: dirty_rects += renderer.repaint(screen, game_state, overlay_rects)
+            overlay_rects = resolution.draw(screen) if resolution else []
+            dirty_rects += overlay_rects
+            if show_histogram:
+                frame_histogram.draw(screen, layout.histogram)
+                dirty_rects.append(layout.histogram)
+            present_start = time.perf_counter()
+            if window_exposed: pygame.display.flip()
+            elif dirty_rects: pygame.display.update(dirty_rects)
+        frame_end = time.perf_counter()
+        frame_histogram.add(frame_end - frame_start)
+        if tracer:
+            tracer.frame(frame_start, (("events", logic_start), ("logic", render_start), ("render", present_start),
+                                       ("present", frame_end)))
+        scheduler.end_frame()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
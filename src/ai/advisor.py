@@ -0,0 +1,286 @@
+# ==============================================================================
+# src/ai/advisor.py
+# Spielberater: Vorausschau über kommende Runden in einem Worker-Prozess (iterative Vertiefung).
+# ==============================================================================
+import argparse
+import os
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from src.ai.solver import MissionSolver, SYSTEMS
+from src.game.game_state import GameState, AKTIONSPHASE, SPECIALIZATIONS
+from src.game.rules import Rules
+
+# Bewertung: erwartete gemeisterte Herausforderungen im Horizont, plus Bonus fürs Überleben bis dahin
+ALIVE_BONUS = 0.5
+MAX_DEPTH = 12
+_ABORT_CHECK_NODES = 256
+STATUS_INTERVAL = 0.5  # s; Live-Zahlen der Statuszeile höchstens so oft neu, sonst wäre jeder Frame ein neuer Text
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class SearchAborted(Exception):
+    pass
+
+class DepthLimitedSearch:
+    """Expectimax over the next `depth` resolutions: own allocation, decay, then a chance node
+    over the cards left in `challenge_deck`. Reuses the solver's allocation generator, so
+    specialist bonuses, caps and rules match the exact solver.
+    """
+    def __init__(self, crew: Sequence[int], cards: Sequence[Tuple[int, int]], rules: Rules):
+        self.solver = MissionSolver(crew, cards, None, rules)
+        self.codec = self.solver.codec
+        self.table: Dict[Tuple[int, int], Tuple[float, Tuple[int, ...]]] = {}
+        self.nodes = 0
+        self.abort: Callable[[], bool] = lambda: False
+
+    def decision(self, values: Tuple[int, ...], energy: int, challenge: int, remaining: Tuple[int, ...],
+                 depth: int) -> Tuple[float, Tuple[int, ...]]:
+        """(value, units per system) of an AKTIONSPHASE state searched `depth` resolutions deep."""
+        solver = self.solver
+        caps = solver.caps[:4] + solver._target_caps(challenge, remaining)
+        values = tuple(min(value, cap) for value, cap in zip(values, caps))
+        key = (self.codec.key(values, energy, 0, challenge, remaining), depth)
+        entry = self.table.get(key)
+        if entry is not None:
+            return entry
+        self.nodes += 1
+        if self.nodes % _ABORT_CHECK_NODES == 0 and self.abort():
+            raise SearchAborted()
+        best = (-1.0, (0,) * len(SYSTEMS))
+        candidates = list(solver.allocations(values, energy, caps, must_survive=True)) \
+            or list(solver.allocations(values, energy, caps))
+        for units, new_values in candidates:
+            value = self._resolve(new_values, challenge, remaining, depth)
+            if value > best[0]:
+                best = (value, units)
+        self.table[key] = best
+        return best
+
+    def _resolve(self, values: Tuple[int, ...], challenge: int, remaining: Tuple[int, ...], depth: int) -> float:
+        gained = 0.0
+        if challenge >= 0:
+            target_thrust, target_navigation = self.codec.card_types[challenge]
+            gained = float(values[4] >= target_thrust and values[5] >= target_navigation)
+        decay = self.solver.decay
+        if min(values[:4]) <= decay:
+            return gained  # Kollaps im nächsten Verfall
+        total = sum(remaining)
+        if depth <= 1 or not total:
+            return gained + ALIVE_BONUS
+        decayed = tuple(v - decay for v in values[:4]) + values[4:]
+        expected = 0.0
+        for card, count in enumerate(remaining):
+            if count:
+                rest = remaining[:card] + (count - 1,) + remaining[card + 1:]
+                expected += count / total * self.decision(decayed, self.solver.round_energy, card, rest, depth - 1)[0]
+        return gained + expected
+
+    def max_useful_depth(self, remaining: Tuple[int, ...]) -> int:
+        """Beyond the last card only survival is left to evaluate, so deeper searches change nothing."""
+        return min(MAX_DEPTH, sum(remaining) + 1)
+
+class Advice:
+    """Best allocation found so far for one game state."""
+    __slots__ = ("units", "value", "depth", "complete", "nodes", "seconds")
+
+    def __init__(self, units: Tuple[int, ...], value: float, depth: int, complete: bool, nodes: int, seconds: float):
+        self.units = units
+        self.value = value
+        self.depth = depth
+        self.complete = complete
+        self.nodes = nodes
+        self.seconds = seconds
+
+    def clicks(self, system: str) -> int:
+        return self.units[SYSTEMS.index(system)]
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+def _worker_main(requests: Connection, results: Connection):
+    """Worker process: deepens one request at a time and reports after every finished depth.
+
+    A new request waiting in the pipe aborts the current search (anytime behaviour).
+    """
+    searches: Dict[Hashable, DepthLimitedSearch] = {}
+    while True:
+        try:
+            message = requests.recv()
+        except EOFError:
+            return
+        if message[0] == "stop":
+            return
+        _, request_id, crew, cards, rules_data, state = message
+        setup = (tuple(crew), tuple(map(tuple, cards)), tuple(sorted((k, repr(v)) for k, v in rules_data.items())))
+        search = searches.get(setup)
+        if search is None:
+            search = searches[setup] = DepthLimitedSearch(crew, cards, Rules.from_dict(rules_data))
+        values, energy, challenge, remaining_counts = state
+        remaining = search.codec.counts(dict(remaining_counts))
+        challenge_index = search.codec.card_index.get(challenge, -1) if challenge else -1
+        units = energy // search.solver.rules.action_cost
+        search.abort = requests.poll
+        start, nodes_before = time.perf_counter(), search.nodes
+        max_depth = search.max_useful_depth(remaining)
+        try:
+            for depth in range(1, max_depth + 1):
+                value, allocation = search.decision(values, units, challenge_index, remaining, depth)
+                results.send((request_id, allocation, value, depth, depth == max_depth,
+                              search.nodes - nodes_before, time.perf_counter() - start))
+        except SearchAborted:
+            pass
+
+def advice_key(game_state: GameState) -> Tuple:
+    """Everything the search depends on; ready flags and the active character do not matter."""
+    challenge = game_state.current_challenge
+    return (tuple(getattr(game_state, system) for system in SYSTEMS), game_state.energy_pool,
+            (challenge.target_thrust, challenge.target_navigation) if challenge else None,
+            tuple(sorted(game_state.challenge_deck.target_counts().items())))
+
+class Advisor:
+    """Main-process side: sends states to the worker and caches the deepest advice per state.
+
+    `on_result` is called from a listener thread whenever new advice arrives, e.g. to post
+    a pygame event so an idle event loop wakes up and redraws.
+    """
+    def __init__(self, on_result: Optional[Callable[[], None]] = None):
+        self.on_result = on_result
+        self.cache: Dict[Tuple, Advice] = {}
+        self.current: Optional[Advice] = None
+        self._current_key: Optional[Tuple] = None
+        self._requests: Dict[int, Tuple] = {}
+        self._pending_key: Optional[Tuple] = None
+        self._next_request = 1
+        self._lock = threading.Lock()
+        # Kosten im Hauptthread (update + Zeichnen), gemittelt über die Frames
+        self.frame_seconds = 0.0
+        self.frames = 0
+        self._status: Tuple[str, Optional[Advice], float] = ("", None, 0.0)  # Text, Ratschlag, Zeitpunkt
+
+        # Eigener Interpreter statt multiprocessing-spawn: der würde das Hauptmodul (und damit
+        # pygame samt Fenster) im Worker erneut importieren
+        authkey = secrets.token_bytes(16)
+        self._server = Listener(authkey=authkey)
+        env = dict(os.environ, ENCELADUS_ADVISOR_KEY=authkey.hex())
+        self.process = subprocess.Popen([sys.executable, "-m", "src.ai.advisor", "--worker", str(self._server.address)],
+                                        cwd=_PACKAGE_ROOT, env=env)
+        self._request_conn: Optional[Connection] = None
+        self._backlog: List[tuple] = []
+        self._listener = threading.Thread(target=self._listen, daemon=True)
+        self._listener.start()
+
+    def _send(self, message: tuple):
+        with self._lock:
+            if self._request_conn is None:
+                self._backlog.append(message)  # Worker startet noch
+            else:
+                self._request_conn.send(message)
+
+    def _listen(self):
+        try:
+            request_conn = self._server.accept()
+            results = self._server.accept()
+        except OSError:
+            return
+        with self._lock:
+            for message in self._backlog:
+                request_conn.send(message)
+            self._backlog.clear()
+            self._request_conn = request_conn
+        while True:
+            try:
+                request_id, units, value, depth, complete, nodes, seconds = results.recv()
+            except (EOFError, OSError):
+                return
+            with self._lock:
+                key = self._requests.get(request_id)
+                if key is None:
+                    continue
+                cached = self.cache.get(key)
+                if cached is None or depth >= cached.depth:
+                    self.cache[key] = Advice(units, value, depth, complete, nodes, seconds)
+                if complete:
+                    del self._requests[request_id]
+            if self.on_result: self.on_result()
+
+    def update(self, game_state: GameState) -> Optional[Advice]:
+        """Call once per frame; returns the best known advice for the current state."""
+        start = time.perf_counter()
+        if game_state.current_phase != AKTIONSPHASE or not game_state.players:
+            self.current, self._current_key = None, None
+        else:
+            key = advice_key(game_state)
+            with self._lock:
+                advice = self.cache.get(key)
+            if (advice is None or not advice.complete) and key != self._pending_key:
+                self._request(game_state, key)
+            self.current, self._current_key = advice, key
+        self.frames += 1
+        self.add_frame_time(time.perf_counter() - start)
+        return self.current
+
+    def _request(self, game_state: GameState, key: Tuple):
+        request_id = self._next_request
+        self._next_request += 1
+        with self._lock:
+            self._requests[request_id] = key
+            while len(self._requests) > 64:  # abgebrochene Suchen melden sich nie mehr
+                del self._requests[next(iter(self._requests))]
+        crew = sorted(self.crew_indices(game_state))
+        cards = [(card.target_thrust, card.target_navigation) for card in game_state.card_catalog]
+        values, energy, challenge, remaining = key
+        self._send(("search", request_id, crew, cards, game_state.rules.to_dict(),
+                    (values, energy, challenge, remaining)))
+        self._pending_key = key
+
+    @staticmethod
+    def crew_indices(game_state: GameState) -> List[int]:
+        return [SPECIALIZATIONS.index(player.specialization) for player in game_state.players]
+
+    def add_frame_time(self, seconds: float):
+        """Adds main-thread time spent on the advisor (e.g. drawing its highlights) to this frame."""
+        self.frame_seconds += seconds
+
+    def status(self) -> str:
+        """Status line; changes with new advice, the running figures at most every STATUS_INTERVAL."""
+        advice, now = self.current, time.perf_counter()
+        text, shown, updated = self._status
+        if text and advice is shown and now - updated < STATUS_INTERVAL:
+            return text
+        frame_ms = self.frame_seconds / self.frames * 1000 if self.frames else 0.0
+        if advice is None:
+            text = f"Berater rechnet ... (+{frame_ms:.2f} ms/Frame)"
+        else:
+            depth = f"Tiefe {advice.depth}" + (" (vollständig)" if advice.complete else "")
+            text = f"Berater: {depth}, {advice.nodes_per_second / 1000:.0f}k Knoten/s, +{frame_ms:.2f} ms/Frame"
+        self._status = (text, advice, now)
+        return text
+
+    def close(self):
+        try:
+            self._send(("stop",))
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.process.terminate()
+        self._server.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker-Prozess des Spielberaters (wird von main.py gestartet)")
+    parser.add_argument("--worker", required=True, metavar="ADRESSE")
+    args = parser.parse_args()
+    authkey = bytes.fromhex(os.environ["ENCELADUS_ADVISOR_KEY"])
+    requests = Client(args.worker, authkey=authkey)
+    results = Client(args.worker, authkey=authkey)
+    _worker_main(requests, results)
+
+if __name__ == "__main__":
+    main()
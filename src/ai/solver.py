@@ -0,0 +1,292 @@
+# ==============================================================================
+# src/ai/solver.py
+# Exakter Missions-Solver: Zustandsraumsuche mit Transpositionstabelle.
+# ==============================================================================
+import argparse
+import json
+import time
+from collections import Counter
+from itertools import combinations
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from src.game.game_state import GameState, AKTIONSPHASE
+from src.game.rules import Rules, DEFAULT_RULES
+
+LIFE_SUPPORT = ("oxygen", "water", "temperature", "airpressure")
+SYSTEMS = LIFE_SUPPORT + ("thrust", "navigation")
+SPECIALIZATIONS = ["oxygen", "water", "temperature", "airpressure"]  # Reihenfolge wie in start_game
+
+Click = Tuple[Optional[int], str]  # (Index des aktiven Spielers oder None, System) für einen "+"-Klick
+
+class StateCodec:
+    """Packs decision states into one int: 4 bits per system, then energy, progress, card, deck counts.
+
+    Energy is counted in actions (`energy_pool // action_cost`).
+    """
+    def __init__(self, card_types: Sequence[Tuple[int, int]], deck_size: int, action_cost: int = 1):
+        self.card_types = [tuple(card) for card in card_types]
+        self.action_cost = action_cost
+        self.card_index = {card: i for i, card in enumerate(self.card_types)}
+        self.deck_size = deck_size
+        self._count_bits = max(1, deck_size.bit_length())
+        self._card_bits = max(1, (len(self.card_types) + 1).bit_length())
+
+    def counts(self, cards: Union[Sequence[Tuple[int, int]], Mapping[Tuple[int, int], int]]) -> Tuple[int, ...]:
+        """Per-type counts from a list of (thrust, navigation) targets or an existing count mapping."""
+        counter = Counter(cards)
+        if any(card not in self.card_index for card in counter):
+            raise ValueError("Deck enthält Karten, die der Solver nicht kennt.")
+        return tuple(counter[card] for card in self.card_types)
+
+    def key(self, values: Sequence[int], energy: int, progress: int, challenge: int,
+            remaining: Sequence[int]) -> int:
+        key = 0
+        for count in remaining:
+            key = (key << self._count_bits) | count
+        key = (key << self._card_bits) | (challenge + 1)
+        key = (key << 8) | min(progress, 255)
+        key = (key << 5) | energy
+        for value in values:
+            key = (key << 4) | value
+        return key
+
+    def decision_state(self, game_state: GameState) -> Tuple:
+        """(values, energy, progress, card, remaining counts) of a game in AKTIONSPHASE."""
+        values = tuple(getattr(game_state, system) for system in SYSTEMS)
+        remaining = self.counts(game_state.challenge_deck.target_counts())
+        challenge = game_state.current_challenge
+        card = -1
+        if challenge:
+            card = self.card_index.get((challenge.target_thrust, challenge.target_navigation))
+            if card is None:
+                raise ValueError("Aktuelle Herausforderung ist dem Solver unbekannt.")
+        return values, game_state.energy_pool // self.action_cost, game_state.mission_progress, card, remaining
+
+    def target_caps(self, challenge: int, remaining: Sequence[int]) -> Tuple[int, int]:
+        """Highest thrust and navigation target among the current card and the cards left."""
+        in_play = [card for card, count in enumerate(remaining) if count]
+        if challenge >= 0: in_play.append(challenge)
+        return (max((self.card_types[c][0] for c in in_play), default=0),
+                max((self.card_types[c][1] for c in in_play), default=0))
+
+    def normalize(self, values: Sequence[int], energy: int, progress: int, challenge: int,
+                  remaining: Sequence[int]) -> Tuple:
+        """Clamps thrust and navigation to the highest target still in play; above it all values are equivalent."""
+        max_thrust, max_navigation = self.target_caps(challenge, remaining)
+        values = tuple(values[:4]) + (min(values[4], max_thrust), min(values[5], max_navigation))
+        return values, energy, progress, challenge, tuple(remaining)
+
+    def decision_key(self, game_state: GameState) -> int:
+        """Table key of a game in AKTIONSPHASE, normalized like the solver's own keys."""
+        return self.key(*self.normalize(*self.decision_state(game_state)))
+
+def click_plan(units: Sequence[int], game_state: GameState) -> List[Click]:
+    """Turns an allocation into the "+"-clicks to make, switching to specialists where they help."""
+    specialist_index = {p.specialization: i for i, p in enumerate(game_state.players)}
+    return [(specialist_index.get(system), system)
+            for system, count in zip(SYSTEMS, units) for _ in range(count)]
+
+class MissionSolver:
+    """Computes the exact win probability and best energy allocation for a crew.
+
+    A mission counts as won once `mission_progress` reaches `target_progress`
+    (by default every card of the deck). Players do not know the deck order, so
+    each draw is a chance node over the remaining cards. Within AKTIONSPHASE the
+    active character can be switched freely, so every crew specialist's +2 bonus
+    is available each round and only the final allocation of energy matters.
+    """
+    def __init__(self, crew: Sequence[int], cards: Sequence[Tuple[int, int]], target_progress: Optional[int] = None,
+                 rules: Rules = DEFAULT_RULES):
+        self.crew = sorted(crew)
+        self.rules = rules
+        specialists = {SPECIALIZATIONS[i] for i in self.crew}
+        self.steps = tuple(rules.specialist_bonus if system in specialists else 1 for system in LIFE_SUPPORT) + (1, 1)
+        self.caps = rules.system_caps()
+        self.decay = rules.decay
+        self.round_energy = rules.energy_for_crew(len(self.crew)) // rules.action_cost
+        if self.round_energy > 31 or max(self.caps) > 15:
+            raise ValueError("Regeln überschreiten die Bitbreiten des Zustandsschlüssels (Energie 5, Werte 4 Bit).")
+        self.codec = StateCodec(sorted(set(cards)), len(cards), rules.action_cost)
+        self.full_deck = self.codec.counts(cards)
+        self.target_progress = len(cards) if target_progress is None else target_progress
+        self.table: Dict[int, Tuple[float, Tuple[int, ...]]] = {}
+        self._after_action: Dict[int, float] = {}
+        self.nodes = 0
+
+    @classmethod
+    def for_phase1(cls, crew: Sequence[int], target_progress: Optional[int] = None,
+                   rules: Rules = DEFAULT_RULES) -> "MissionSolver":
+        cards = [(c.target_thrust, c.target_navigation) for c in rules.card_pool(1, len(crew))]
+        return cls(crew, cards, target_progress, rules)
+
+    # --- Suche ---
+    def allocations(self, values: Sequence[int], energy: int, caps: Optional[Sequence[int]] = None,
+                    must_survive: bool = False) -> Iterator[Tuple[Tuple[int, ...], Tuple[int, ...]]]:
+        """Yields (units per system, resulting values) for every non-dominated way to spend `energy`.
+
+        Raising a value never hurts, so only allocations that spend all energy (or max out every
+        system) are kept, and no unit is spent on a system that is already at its cap. With
+        `must_survive`, allocations that leave a life-support system to collapse in the next
+        decay are skipped as well.
+        """
+        caps = caps or self.caps
+        limits = [max(0, -(-(cap - value) // step)) for value, step, cap in zip(values, self.steps, caps)]
+        minimums = [0] * len(SYSTEMS)
+        if must_survive:
+            for i in range(len(LIFE_SUPPORT)):
+                minimums[i] = max(0, -(-(self.decay + 1 - values[i]) // self.steps[i]))
+            if sum(minimums) > energy:
+                return
+        capacity = [sum(limits[i:]) for i in range(len(limits))] + [0]
+        required = [sum(minimums[i:]) for i in range(len(minimums))] + [0]
+        units = [0] * len(SYSTEMS)
+
+        def place(index: int, energy_left: int):
+            if energy_left > capacity[index]:
+                return  # Restenergie wäre nicht mehr ausgebbar
+            if index == len(SYSTEMS):
+                yield tuple(units)
+                return
+            for u in range(min(limits[index], energy_left - required[index + 1]), minimums[index] - 1, -1):
+                units[index] = u
+                yield from place(index + 1, energy_left - u)
+            units[index] = 0
+
+        for allocation in place(0, min(energy, capacity[0])):
+            new_values = tuple(value if u == 0 else min(cap, value + u * step)
+                               for value, u, step, cap in zip(values, allocation, self.steps, caps))
+            yield allocation, new_values
+
+    def decision_value(self, values: Tuple[int, ...], energy: int, progress: int, challenge: int,
+                       remaining: Tuple[int, ...]) -> float:
+        """Win probability of an AKTIONSPHASE state when playing optimally from here."""
+        # Schub/Navigation über dem höchsten noch offenen Ziel sind gleichwertig
+        values, energy, progress, challenge, remaining = self.codec.normalize(values, energy, progress, challenge, remaining)
+        caps = self.caps[:4] + self._target_caps(challenge, remaining)
+        key = self.codec.key(values, energy, progress, challenge, remaining)
+        entry = self.table.get(key)
+        if entry is not None:
+            return entry[0]
+        self.nodes += 1
+        best_value, best_units = -1.0, (0,) * len(SYSTEMS)
+        can_win_now = challenge >= 0 and progress + 1 >= self.target_progress
+        for units, new_values in self.allocations(values, energy, caps, must_survive=not can_win_now):
+            value = self._resolve(new_values, progress, challenge, remaining)
+            if value > best_value:
+                best_value, best_units = value, units
+                if value >= 1.0 - 1e-9: break
+        best_value = max(best_value, 0.0)  # keine überlebensfähige Verteilung
+        self.table[key] = (best_value, best_units)
+        return best_value
+
+    def _target_caps(self, challenge: int, remaining: Tuple[int, ...]) -> Tuple[int, int]:
+        max_thrust, max_navigation = self.codec.target_caps(challenge, remaining)
+        return min(max_thrust, self.caps[4]), min(max_navigation, self.caps[5])
+
+    def _resolve(self, values: Tuple[int, ...], progress: int, challenge: int, remaining: Tuple[int, ...]) -> float:
+        """AUFLOESUNGSPHASE followed by the next round's decay and draw (chance node)."""
+        if challenge >= 0:
+            target_thrust, target_navigation = self.codec.card_types[challenge]
+            if values[4] >= target_thrust and values[5] >= target_navigation:
+                progress += 1
+        if progress >= self.target_progress:
+            return 1.0
+        if progress + sum(remaining) < self.target_progress or min(values[:4]) <= self.decay:
+            return 0.0  # Ziel unerreichbar oder Kollaps im nächsten Verfall
+        key = self.codec.key(values, 0, progress, -1, remaining)
+        cached = self._after_action.get(key)
+        if cached is not None:
+            return cached
+
+        decayed = tuple(v - self.decay for v in values[:4]) + values[4:]
+        result = 0.0
+        total = sum(remaining)
+        for card, count in enumerate(remaining):
+            if count:
+                rest = remaining[:card] + (count - 1,) + remaining[card + 1:]
+                result += count / total * self.decision_value(decayed, self.round_energy, progress, card, rest)
+        self._after_action[key] = result
+        return result
+
+    def solve_new_mission(self) -> float:
+        """Win probability before the deck is shuffled, i.e. from `start_game`."""
+        return self._resolve(self.rules.start_values(), 0, -1, self.full_deck)
+
+    def solve(self, game_state: GameState) -> Tuple[float, List[Click]]:
+        """Returns (win probability, click plan) for a game in AKTIONSPHASE."""
+        if game_state.current_phase != AKTIONSPHASE:
+            raise ValueError("Der Solver arbeitet nur in der AKTIONSPHASE.")
+        state = self.codec.normalize(*self.codec.decision_state(game_state))
+        probability = self.decision_value(*state)
+        return probability, click_plan(self.table[self.codec.key(*state)][1], game_state)
+
+    def policy_table(self) -> "PolicyTable":
+        return PolicyTable(self.crew, self.codec, self.target_progress, dict(self.table))
+
+class PolicyTable:
+    """Precomputed solver output; `lookup` is a single dict access per game state."""
+    def __init__(self, crew: Sequence[int], codec: StateCodec, target_progress: int,
+                 entries: Dict[int, Tuple[float, Tuple[int, ...]]]):
+        self.crew = list(crew)
+        self.codec = codec
+        self.target_progress = target_progress
+        self.entries = entries
+
+    def lookup(self, game_state: GameState) -> Optional[Tuple[float, List[Click]]]:
+        try:
+            key = self.codec.decision_key(game_state)
+        except ValueError:
+            return None
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return entry[0], click_plan(entry[1], game_state)
+
+    def dump(self, path: str):
+        data = {
+            "crew": self.crew,
+            "card_types": self.codec.card_types,
+            "deck_size": self.codec.deck_size,
+            "action_cost": self.codec.action_cost,
+            "target_progress": self.target_progress,
+            "entries": {str(key): [value, list(units)] for key, (value, units) in self.entries.items()},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path: str) -> "PolicyTable":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        codec = StateCodec(data["card_types"], data["deck_size"], data.get("action_cost", 1))
+        entries = {int(key): (value, tuple(units)) for key, (value, units) in data["entries"].items()}
+        return cls(data["crew"], codec, data["target_progress"], entries)
+
+def main():
+    parser = argparse.ArgumentParser(description="Exakter Solver für Mission Enceladus (Phase 1)")
+    parser.add_argument("--dump", help="Policy-Tabelle für --crew als JSON schreiben")
+    parser.add_argument("--crew", default="0,1,2,3")
+    parser.add_argument("--target", type=int, default=None, help="benötigter Missionsfortschritt (Standard: alle Karten)")
+    args = parser.parse_args()
+
+    print(f"{'Crew':>4} {'Besetzungen':>11} {'Zeit [s]':>9} {'Tabelle':>8} {'Knoten':>8} {'P(Sieg) min/max':>16}")
+    for size in range(1, 5):
+        start = time.perf_counter()
+        entries, nodes, probabilities = 0, 0, []
+        for crew in combinations(range(4), size):
+            solver = MissionSolver.for_phase1(crew, args.target)
+            probabilities.append(solver.solve_new_mission())
+            entries += len(solver.table)
+            nodes += len(solver.table) + len(solver._after_action)
+        elapsed = time.perf_counter() - start
+        print(f"{size:>4} {len(probabilities):>11} {elapsed:>9.3f} {entries:>8} {nodes:>8} "
+              f"{min(probabilities):>7.3f}/{max(probabilities):.3f}")
+
+    if args.dump:
+        solver = MissionSolver.for_phase1([int(i) for i in args.crew.split(",")], args.target)
+        solver.solve_new_mission()
+        solver.policy_table().dump(args.dump)
+        print(f"Policy-Tabelle mit {len(solver.table)} Einträgen nach {args.dump} geschrieben")
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@
 # ==============================================================================
 class Player:
     """Represents a player with a specific specialization."""
+    __slots__ = ("name", "specialization", "is_ready")
+
     def __init__(self, name: str, specialization: str):
         self.name = name
         self.specialization = specialization
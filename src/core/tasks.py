@@ -4,6 +4,8 @@
 # ==============================================================================
 class Task:
     """Base class for any challenge."""
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         self.name = name
 
@@ -12,6 +14,8 @@ class Task:
 
 class ChallengeCard(Task):
     """Represents a challenge event with thrust and navigation targets."""
+    __slots__ = ("description", "reward", "penalty", "target_thrust", "target_navigation")
+
     def __init__(self, name: str, description: str, reward: str, penalty: str,
                  target_thrust: int, target_navigation: int):
         super().__init__(name)
@@ -0,0 +1,165 @@
+# ==============================================================================
+# src/game/action_log.py
+# Kompaktes binäres Aktionsprotokoll (Event Sourcing) für reproduzierbare Missionen.
+# ==============================================================================
+import struct
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+# Format eines Archivs: beliebig viele Logs hintereinander. Ein Log ist
+#   "MEL1" | u64 Seed | Aktionen ... | END | Varint-Länge | Snapshot (little endian)
+# und steht in Blöcken "u32 Länge | Daten" im Archiv: der erste beginnt mit MAGIC, jeder weitere
+# mit CONTINUE. Blöcke werden während der Mission geschrieben; fehlt END, wurde das Spiel abgebrochen.
+MAGIC = b"MEL1"
+CONTINUE = b"MEL+"
+SEED_LIMIT = 1 << 64  # Seeds werden als u64 gespeichert
+
+SELECT_CHARACTER = 0x01    # u8 Charakter-Index
+START_GAME = 0x02
+MODIFY = 0x03              # u8 System-Index, i8 Betrag
+MODIFY_UNDOABLE = 0x04     # wie MODIFY, legt einen Undo-Schritt an
+SET_ACTIVE = 0x05          # u8 Spieler-Index
+TOGGLE_READY = 0x06        # u8 Spieler-Index
+FINISH_ACTION_PHASE = 0x07
+UNDO = 0x08
+END = 0x7F
+
+# Anzahl der Argument-Bytes je Opcode
+_ARG_BYTES = {SELECT_CHARACTER: 1, START_GAME: 0, MODIFY: 2, MODIFY_UNDOABLE: 2, SET_ACTIVE: 1,
+              TOGGLE_READY: 1, FINISH_ACTION_PHASE: 0, UNDO: 0}
+
+Action = Tuple[int, ...]
+
+def check_seed(seed: int) -> int:
+    """Returns `seed` if a log can store it, else raises ValueError."""
+    if not isinstance(seed, int) or isinstance(seed, bool) or not 0 <= seed < SEED_LIMIT:
+        raise ValueError(f"Seed muss eine ganze Zahl von 0 bis 2^64-1 sein, nicht {seed!r}")
+    return seed
+
+class ActionLogWriter:
+    """Streams the actions of one mission into an archive as length-prefixed blocks.
+
+    Actions are collected until `flush` (called once per frame, and after every round);
+    nothing is written before START_GAME, so abandoned setup screens stay out of the archive.
+    A killed game therefore leaves its log up to the last flush, without the final snapshot.
+    """
+    def __init__(self, stream: BinaryIO, seed: int):
+        self.stream = stream
+        self.seed = seed
+        self._buffer = bytearray(MAGIC + struct.pack("<Q", seed))
+        self.started = False  # START_GAME aufgezeichnet
+        self.written = False  # erster Block (mit MAGIC) im Archiv
+        self.closed = False
+
+    def record(self, opcode: int, *args: int):
+        self._buffer.append(opcode)
+        if opcode == MODIFY or opcode == MODIFY_UNDOABLE:
+            self._buffer += struct.pack("<Bb", *args)
+        else:
+            self._buffer += bytes(args)
+        if opcode == START_GAME:
+            self.started = True
+        elif opcode == FINISH_ACTION_PHASE:
+            self.flush()
+
+    def flush(self):
+        """Writes the actions collected since the last flush as one block."""
+        if self.closed or not self.started:
+            return
+        if self.written:
+            if not self._buffer:
+                return
+            block = CONTINUE + self._buffer
+        else:
+            block = self._buffer
+        self.stream.write(struct.pack("<I", len(block)) + block)
+        self.stream.flush()
+        self._buffer = bytearray()
+        self.written = True
+
+    def close(self, final_snapshot: int):
+        if self.closed:
+            return
+        self.started = True
+        self._buffer.append(END)
+        payload = final_snapshot.to_bytes((final_snapshot.bit_length() + 7) // 8, "little")
+        self._buffer += _varint(len(payload)) + payload
+        self.flush()
+        self.closed = True
+
+class ActionLog:
+    """One recorded mission: its seed, the action stream and the final snapshot."""
+    __slots__ = ("seed", "actions", "final_snapshot")
+
+    def __init__(self, seed: int, actions: List[Action], final_snapshot: Optional[int]):
+        self.seed = seed
+        self.actions = actions
+        self.final_snapshot = final_snapshot
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+def parse_log(data: bytes) -> ActionLog:
+    if data[:4] != MAGIC:
+        raise ValueError("Kein Mission-Enceladus-Aktionslog")
+    seed = struct.unpack_from("<Q", data, 4)[0]
+    actions: List[Action] = []
+    pos, end = 12, len(data)
+    while pos < end:
+        opcode = data[pos]
+        pos += 1
+        if opcode == END:
+            length, shift = 0, 0
+            while True:
+                byte = data[pos]
+                pos += 1
+                length |= (byte & 0x7F) << shift
+                shift += 7
+                if not byte & 0x80: break
+            return ActionLog(seed, actions, int.from_bytes(data[pos:pos + length], "little"))
+        if opcode == MODIFY or opcode == MODIFY_UNDOABLE:
+            system, amount = struct.unpack_from("<Bb", data, pos)
+            actions.append((opcode, system, amount))
+            pos += 2
+        else:
+            count = _ARG_BYTES.get(opcode)
+            if count is None:
+                raise ValueError(f"Unbekannter Opcode {opcode:#x} an Position {pos - 1}")
+            actions.append((opcode, *data[pos:pos + count]))
+            pos += count
+    return ActionLog(seed, actions, None)
+
+def iter_logs(stream: BinaryIO) -> Iterator[ActionLog]:
+    """Streams the logs of an archive one at a time, so archives never have to fit in memory.
+
+    A log is complete once the next one starts or the archive ends; logs of aborted games
+    come back with `final_snapshot` None.
+    """
+    current: Optional[bytearray] = None
+    while True:
+        header = stream.read(4)
+        if not header:
+            break
+        if len(header) < 4:
+            raise ValueError("Abgeschnittenes Archiv")
+        length = struct.unpack("<I", header)[0]
+        data = stream.read(length)
+        if len(data) < length:
+            raise ValueError("Abgeschnittenes Archiv")
+        if data[:4] == CONTINUE:
+            if current is None:
+                raise ValueError("Fortsetzungsblock ohne Log-Anfang")
+            current += data[4:]
+            continue
+        if current is not None:
+            yield parse_log(current)
+        current = bytearray(data)
+    if current is not None:
+        yield parse_log(current)
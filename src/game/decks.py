@@ -1,20 +1,129 @@
 # ==============================================================================
 # src/game/decks.py
-# Bereinigt: Aktionskarten-Logik entfernt.
+# Herausforderungsdecks aus Kartendateien (JSON), pro Phase und Crewgröße.
 # ==============================================================================
 from src.core.tasks import ChallengeCard
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import hashlib
+import json
+import os
 import random
 
-def create_challenge_deck_phase1(player_count: int = 4) -> List[ChallengeCard]:
+CARD_FILE = os.path.join(os.path.dirname(__file__), "data", "challenge_cards.json")
+
+_CARD_FIELDS = ("name", "description", "reward", "penalty", "target_thrust", "target_navigation")
+
+# Geladene Karten je (Datei, Phase, Crewgröße, Zielverschiebung); Karten sind unveränderlich und werden geteilt
+_pools: Dict[tuple, Tuple[ChallengeCard, ...]] = {}
+_definitions: Dict[str, list] = {}
+_hashes: Dict[str, str] = {}  # Inhalts-Hash je Datei, passend zu _definitions
+
+class ChallengeDeck:
+    """Draw pile of challenge cards with O(1) draws and a count index by (thrust, navigation) target."""
+    __slots__ = ("_cards", "_counts")
+
+    def __init__(self, cards: Iterable[ChallengeCard] = ()):
+        # Oberste Karte liegt am Listenende, damit draw() ein pop() vom Ende ist
+        self._cards: List[ChallengeCard] = list(cards)[::-1]
+        self._counts: Dict[Tuple[int, int], int] = {}
+        for card in self._cards:
+            key = (card.target_thrust, card.target_navigation)
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def draw(self) -> Optional[ChallengeCard]:
+        """Removes and returns the top card, or None if the deck is empty."""
+        if not self._cards:
+            return None
+        card = self._cards.pop()
+        key = (card.target_thrust, card.target_navigation)
+        remaining = self._counts[key] - 1
+        if remaining: self._counts[key] = remaining
+        else: del self._counts[key]
+        return card
+
+    def peek(self) -> Optional[ChallengeCard]:
+        return self._cards[-1] if self._cards else None
+
+    def count_targets(self, target_thrust: int, target_navigation: int) -> int:
+        """Number of remaining cards with exactly these targets."""
+        return self._counts.get((target_thrust, target_navigation), 0)
+
+    def count_beatable(self, thrust: Optional[int] = None, navigation: Optional[int] = None) -> int:
+        """Remaining cards whose targets are met by `thrust` and `navigation` (None = no limit).
+
+        Only the distinct target pairs are visited, never the cards themselves.
+        """
+        return sum(count for (target_thrust, target_navigation), count in self._counts.items()
+                   if (thrust is None or target_thrust <= thrust)
+                   and (navigation is None or target_navigation <= navigation))
+
+    def target_counts(self) -> Dict[Tuple[int, int], int]:
+        return dict(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __iter__(self) -> Iterator[ChallengeCard]:
+        """Iterates in draw order, top card first."""
+        return reversed(self._cards)
+
+    def __repr__(self):
+        return f"ChallengeDeck({len(self._cards)} Karten)"
+
+def load_card_definitions(path: str = CARD_FILE) -> list:
+    """Reads the card definitions of a file: a list of objects, or {"cards": [...]}."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    definitions = data["cards"] if isinstance(data, dict) else data
+    for index, definition in enumerate(definitions):
+        missing = [field for field in _CARD_FIELDS if field not in definition]
+        if missing:
+            raise ValueError(f"{path}: Karte #{index} ohne Feld(er) {', '.join(missing)}")
+    return definitions
+
+def card_definitions(path: str = CARD_FILE) -> list:
+    """The definitions of a card file, loaded once per file and shared."""
+    if path not in _definitions:
+        _definitions[path] = load_card_definitions(path)
+    return _definitions[path]
+
+def definitions_hash(path: str = CARD_FILE) -> str:
+    """sha256 over the loaded definitions, so edits to a card file change it while the path stays the same.
+
+    Computed once per file alongside the cached definitions.
+    """
+    digest = _hashes.get(path)
+    if digest is None:
+        canonical = json.dumps(card_definitions(path), sort_keys=True, separators=(",", ":"))
+        digest = _hashes[path] = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return digest
+
+def card_pool(phase: int, player_count: int, path: str = CARD_FILE,
+              target_shift: Tuple[int, int] = (0, 0)) -> Tuple[ChallengeCard, ...]:
+    """All cards of `phase` for a crew of `player_count`, in file order (loaded once per file).
+
+    Definitions without "phase" belong to phase 1, without "crew_sizes" to every crew.
+    `target_shift` moves every (thrust, navigation) target, never below 0.
+    """
+    key = (path, phase, player_count, target_shift)
+    pool = _pools.get(key)
+    if pool is None:
+        shift_thrust, shift_navigation = target_shift
+        pool = tuple(
+            ChallengeCard(d["name"], d["description"], d["reward"], d["penalty"],
+                          max(0, d["target_thrust"] + shift_thrust), max(0, d["target_navigation"] + shift_navigation))
+            for d in card_definitions(path)
+            if d.get("phase", 1) == phase and ("crew_sizes" not in d or player_count in d["crew_sizes"]))
+        _pools[key] = pool
+    return pool
+
+def create_challenge_deck(phase: int, player_count: int = 4, rng: Optional[random.Random] = None,
+                          path: str = CARD_FILE, target_shift: Tuple[int, int] = (0, 0)) -> ChallengeDeck:
+    """Shuffled challenge deck for one phase and crew size."""
+    cards = list(card_pool(phase, player_count, path, target_shift))
+    (rng or random).shuffle(cards)
+    return ChallengeDeck(cards)
+
+def create_challenge_deck_phase1(player_count: int = 4, rng: Optional[random.Random] = None) -> ChallengeDeck:
     """Creates and populates the challenge deck for the first phase of the game."""
-    challenges = [
-        ChallengeCard(name="Asteroidenfeld durchqueren", description="...", reward="Fortschritt", penalty="Integrität -2",
-                      target_thrust=4, target_navigation=6),
-        ChallengeCard(name="Sonneneruption ausweichen", description="...", reward="Fortschritt", penalty="Systemschaden",
-                      target_thrust=6, target_navigation=4),
-        ChallengeCard(name="Orbitalkorrektur am Mars", description="...", reward="Fortschritt", penalty="Treibstoff -2",
-                      target_thrust=5, target_navigation=5),
-    ]
-    random.shuffle(challenges)
-    return challenges
\ No newline at end of file
+    return create_challenge_deck(1, player_count, rng)
@@ -3,10 +3,13 @@
 # KORRIGIERT: Schub und Navigation werden nach einer Herausforderung nicht mehr zurückgesetzt.
 # ==============================================================================
 import random
-from typing import List, Optional, Set
+from typing import List, Optional, Set, Tuple
 from src.core.player import Player
 from src.core.tasks import ChallengeCard
-from src.game.decks import create_challenge_deck_phase1
+from src.game.decks import ChallengeDeck
+from src.game.rules import Rules, DEFAULT_RULES
+from src.game import action_log
+from src.game.tracing import Tracer
 
 # Phase Constants
 SETUP_SCREEN = "SetupScreen"
@@ -16,35 +19,82 @@ AKTIONSPHASE = "Aktionsphase"
 AUFLOESUNGSPHASE = "Auflösungsphase"
 VORBEREITUNGSPHASE = "Vorbereitungsphase"
 GAME_OVER = "GameOver"
+PHASES = [SETUP_SCREEN, VERFALLSPHASE, ENERGIEPHASE, AKTIONSPHASE, AUFLOESUNGSPHASE, VORBEREITUNGSPHASE, GAME_OVER]
+
+SPECIALIZATIONS = ["oxygen", "water", "temperature", "airpressure"]
+CHAR_NAMES = ["Sauerstoff", "Wasser", "Temperatur", "Luftdruck"]
+SYSTEMS = ["oxygen", "water", "temperature", "airpressure", "thrust", "navigation"]
+
+# Bitbreiten des gepackten Zustands (snapshot/restore), niedrigstwertige Bits zuerst;
+# Systemwerte und Energie wachsen mit den Regeln, Zähler und Decklänge mit dem Kartenkatalog
+# über diese Mindestbreiten hinaus
+_PHASE_BITS, _CREW_BITS, _ACTIVE_BITS, _SYSTEM_BITS = 3, 4, 2, 4
+_ENERGY_BITS, _ROUND_BITS, _COUNTER_BITS, _DECK_LEN_BITS = 5, 16, 8, 16
 
 class GameState:
     """Manages the entire state of the game using the energy system."""
-    def __init__(self):
+    __slots__ = ("tracer", "seed", "rules", "rng", "recorder", "current_phase", "players", "selected_character_indices", "round_counter",
+                 "challenges_completed_counter", "mission_progress", "challenge_deck", "card_catalog",
+                 "_card_index", "active_character", "oxygen", "water", "temperature", "airpressure",
+                 "thrust", "navigation", "energy_pool", "energy_spent", "current_challenge", "undo_stack",
+                 "trajectory", "_deck_cache")
+
+    def __init__(self, seed: Optional[int] = None, rules: Optional[Rules] = None, tracer: Optional[Tracer] = None):
+        self.tracer = tracer  # Phasenwechsel, Aktionen und Ergebnisse als Trace-Events; None kostet nichts
+        self.rules = rules or DEFAULT_RULES
+        # Jede Mission hat einen expliziten Seed; ohne Vorgabe wird einer gezogen und gemerkt
+        self.seed = action_log.check_seed(seed) if seed is not None else random.getrandbits(64)
+        self.rng = random.Random(self.seed)
+        self.recorder: Optional[action_log.ActionLogWriter] = None
+        self.trajectory = None  # z.B. src.sim.trajectories.TrajectoryWriter; bekommt eine Zeile pro Runde
         self.current_phase = SETUP_SCREEN
         self.players: List[Player] = []
         self.selected_character_indices: Set[int] = set()
+        self.energy_spent = [0] * len(SYSTEMS)  # Energie pro System in der laufenden Runde
+        # Undo-Schritte: (Snapshot, energy_spent) vor jedem rückgängig machbaren Klick
+        self.undo_stack: List[Tuple[int, Tuple[int, ...]]] = []
+        self._deck_cache: Optional[Tuple[ChallengeDeck, int, int]] = None  # (Deck, Länge, gepackte Karten)
+
+    def toggle_character_selection(self, index: int):
+        if self.recorder: self.recorder.record(action_log.SELECT_CHARACTER, index)
+        if self.tracer: self.tracer.action("select_character", index=index)
+        if index in self.selected_character_indices: self.selected_character_indices.remove(index)
+        else: self.selected_character_indices.add(index)
+
+    def set_active_character(self, index: int):
+        if self.recorder: self.recorder.record(action_log.SET_ACTIVE, index)
+        if self.tracer: self.tracer.action("set_active", index=index)
+        self.active_character = self.players[index]
+
+    def toggle_ready(self, index: int):
+        if self.recorder: self.recorder.record(action_log.TOGGLE_READY, index)
+        if self.tracer: self.tracer.action("toggle_ready", index=index)
+        self.players[index].is_ready = not self.players[index].is_ready
 
     def start_game(self):
+        if self.recorder: self.recorder.record(action_log.START_GAME)
+        if self.tracer: self.tracer.action("start_game", seed=self.seed, crew=sorted(self.selected_character_indices))
         self.round_counter = 0
         self.challenges_completed_counter = 0
         self.mission_progress = 0
         
-        self.challenge_deck = create_challenge_deck_phase1()
+        self.challenge_deck = self.rules.challenge_deck(1, len(self.selected_character_indices), self.rng)
+        # Feste Kartenreihenfolge, damit gepackte Zustände Karten als Indizes speichern können
+        self.card_catalog = sorted(self.challenge_deck, key=lambda c: (c.name, c.target_thrust, c.target_navigation))
+        self._card_index = {card: i for i, card in enumerate(self.card_catalog)}
+        self._deck_cache = None
         
-        specializations = ["oxygen", "water", "temperature", "airpressure"]
-        char_names = ["Sauerstoff", "Wasser", "Temperatur", "Luftdruck"]
-        
-        selected_specs = [specializations[i] for i in sorted(list(self.selected_character_indices))]
-        selected_names = [char_names[i] for i in sorted(list(self.selected_character_indices))]
+        selected_specs = [SPECIALIZATIONS[i] for i in sorted(list(self.selected_character_indices))]
+        selected_names = [CHAR_NAMES[i] for i in sorted(list(self.selected_character_indices))]
         self.players = [Player(name, spec) for name, spec in zip(selected_names, selected_specs)]
         
-        start_player_index = random.randint(0, len(self.players) - 1)
+        start_player_index = self.rng.randint(0, len(self.players) - 1)
         self.active_character = self.players[start_player_index]
         
-        self.oxygen = 6
-        self.water = 6
-        self.temperature = 6
-        self.airpressure = 6
+        self.oxygen = self.rules.start_life_support
+        self.water = self.rules.start_life_support
+        self.temperature = self.rules.start_life_support
+        self.airpressure = self.rules.start_life_support
         self.thrust = 0
         self.navigation = 0
         self.energy_pool = 0
@@ -54,64 +104,106 @@ class GameState:
 
     def start_new_round(self):
         self.round_counter += 1
+        self.energy_spent = [0] * len(SYSTEMS)
         self.current_phase = VERFALLSPHASE
-        print(f"\n--- RUNDE {self.round_counter}: VERFALLSPHASE ---")
-        self.oxygen = max(0, self.oxygen - 2)
-        self.water = max(0, self.water - 2)
-        self.temperature = max(0, self.temperature - 2)
-        self.airpressure = max(0, self.airpressure - 2)
+        if self.tracer: self.tracer.phase(VERFALLSPHASE, self.round_counter)
+        decay = self.rules.decay
+        self.oxygen = max(0, self.oxygen - decay)
+        self.water = max(0, self.water - decay)
+        self.temperature = max(0, self.temperature - decay)
+        self.airpressure = max(0, self.airpressure - decay)
         if self.check_for_defeat(): return
         
         self.current_phase = ENERGIEPHASE
-        print("--- PHASE: ENERGIEPHASE ---")
-        energy_map = {1: 4, 2: 6, 3: 8, 4: 10}
-        self.energy_pool = energy_map.get(len(self.players), 10)
+        if self.tracer: self.tracer.phase(ENERGIEPHASE, self.round_counter)
+        self.energy_pool = self.rules.energy_for_crew(len(self.players))
         
         if self.challenge_deck and not self.current_challenge:
-             self.current_challenge = self.challenge_deck.pop(0)
+             self.current_challenge = self.challenge_deck.draw()
 
         for player in self.players:
             player.is_ready = False
+        self.undo_stack.clear()
             
         self.current_phase = AKTIONSPHASE
-        print("--- PHASE: AKTIONSPHASE ---")
+        if self.tracer: self.tracer.phase(AKTIONSPHASE, self.round_counter)
 
-    def modify_system_value(self, system: str, amount: int):
-        cost = 1 
+    def modify_system_value(self, system: str, amount: int, record_undo: bool = False):
+        if self.recorder:
+            self.recorder.record(action_log.MODIFY_UNDOABLE if record_undo else action_log.MODIFY, SYSTEMS.index(system), amount)
+        if record_undo and self.current_phase == AKTIONSPHASE:
+            self.undo_stack.append((self.snapshot(), tuple(self.energy_spent)))
+        rules = self.rules
+        cost = rules.action_cost
         
         if amount > 0 and self.active_character.specialization == system:
             if self.energy_pool >= cost:
-                setattr(self, system, min(6, getattr(self, system) + 2))
+                setattr(self, system, min(rules.life_support_max, getattr(self, system) + rules.specialist_bonus))
                 self.energy_pool -= cost
+                self.energy_spent[SYSTEMS.index(system)] += cost
         elif amount != 0:
             if self.energy_pool >= cost:
-                max_value = 8 if system in ["thrust", "navigation"] else 6
+                max_value = rules.system_max(system)
                 current_value = getattr(self, system)
                 new_value = max(0, min(max_value, current_value + amount))
                 if new_value != current_value:
                     setattr(self, system, new_value)
                     self.energy_pool -= cost
+                    self.energy_spent[SYSTEMS.index(system)] += cost
+        if self.tracer:
+            self.tracer.action("modify", system=system, amount=amount, value=getattr(self, system), energy=self.energy_pool)
         
         self.check_for_defeat()
         
     def check_for_defeat(self) -> bool:
         if self.oxygen <= 0 or self.water <= 0 or self.temperature <= 0 or self.airpressure <= 0:
+            if self.trajectory and self.current_phase != GAME_OVER: self.trajectory.record_defeat(self)
+            if self.tracer and self.current_phase != GAME_OVER:
+                self.tracer.instant("defeat", "outcome", {system: getattr(self, system) for system in SYSTEMS[:4]})
+                self.tracer.phase(GAME_OVER, self.round_counter)
             self.current_phase = GAME_OVER
-            print("NIEDERLAGE: Ein Lebenserhaltungssystem ist kollabiert.")
             return True
         return False
 
-    def resolve_challenge(self):
+    def resolve_challenge(self) -> Optional[bool]:
+        success = None
         if self.current_challenge:
-            if self.thrust >= self.current_challenge.target_thrust and self.navigation >= self.current_challenge.target_navigation:
+            success = self.thrust >= self.current_challenge.target_thrust and self.navigation >= self.current_challenge.target_navigation
+            if success:
                 self.mission_progress += 1
                 self.challenges_completed_counter += 1
-                print("Herausforderung ERFOLGREICH!")
-            else:
-                print("Herausforderung GESCHEITERT!")
+            if self.tracer:
+                self.tracer.instant("challenge", "outcome", {"card": self.current_challenge.name, "success": success,
+                                                             "thrust": self.thrust, "navigation": self.navigation})
+        if self.trajectory: self.trajectory.record_round(self, success)
         
         # KORREKTUR: Schub und Navigation werden NICHT mehr zurückgesetzt.
         self.current_challenge = None
+        return success
+
+    def finish_action_phase(self):
+        """Resolves the current challenge once the crew is ready and moves on to the next round."""
+        self.begin_resolution()
+        self.complete_resolution()
+
+    def begin_resolution(self) -> Optional[bool]:
+        """First half of finish_action_phase: enters AUFLOESUNGSPHASE and resolves the challenge.
+
+        Returns the challenge outcome (None without a card). The UI animates it and then calls
+        complete_resolution; the action log records both halves as one FINISH_ACTION_PHASE.
+        """
+        if self.recorder: self.recorder.record(action_log.FINISH_ACTION_PHASE)
+        self.current_phase = AUFLOESUNGSPHASE
+        if self.tracer: self.tracer.phase(AUFLOESUNGSPHASE, self.round_counter)
+        return self.resolve_challenge()
+
+    def complete_resolution(self):
+        """Second half of finish_action_phase: defeat check, then VORBEREITUNGSPHASE and the next round."""
+        if self.current_phase != AUFLOESUNGSPHASE: return
+        if not self.check_for_defeat():
+            self.current_phase = VORBEREITUNGSPHASE
+            if self.tracer: self.tracer.phase(VORBEREITUNGSPHASE, self.round_counter)
+            self.prepare_next_round()
 
     def prepare_next_round(self):
         if self.current_phase != VORBEREITUNGSPHASE: return
@@ -120,4 +212,118 @@ class GameState:
         next_idx = (current_idx + 1) % len(self.players)
         self.active_character = self.players[next_idx]
         
-        self.start_new_round()
\ No newline at end of file
+        self.start_new_round()
+
+    def undo(self) -> bool:
+        """Reverts the last recorded modify_system_value click of the current AKTIONSPHASE."""
+        if self.recorder: self.recorder.record(action_log.UNDO)
+        if self.tracer: self.tracer.action("undo")
+        if self.current_phase != AKTIONSPHASE or not self.undo_stack:
+            return False
+        snapshot, energy_spent = self.undo_stack.pop()
+        self.restore(snapshot)
+        self.energy_spent = list(energy_spent)
+        return True
+
+    # --- Gepackter Zustand ---
+    def snapshot(self) -> int:
+        """Packs the complete mission state into one int.
+
+        Cards are stored as indices into `card_catalog`, so a snapshot can only be
+        restored into this game (or one with the same catalog). The rules are not
+        part of the snapshot either. The packed draw pile is cached and only shifted
+        as cards are drawn, so a snapshot per click stays cheap for large decks.
+        """
+        crew_mask = sum(1 << SPECIALIZATIONS.index(p.specialization) for p in self.players)
+        selected_mask = sum(1 << i for i in self.selected_character_indices)
+        state = PHASES.index(self.current_phase) | (selected_mask << _PHASE_BITS) | (crew_mask << (_PHASE_BITS + _CREW_BITS))
+        if not self.players:
+            return state
+        shift = _PHASE_BITS + 2 * _CREW_BITS
+        fields = [(self.players.index(self.active_character), _ACTIVE_BITS),
+                  (sum(1 << i for i, p in enumerate(self.players) if p.is_ready), _CREW_BITS)]
+        system_bits, energy_bits, card_bits, counter_bits, deck_len_bits = self._field_bits()
+        fields += [(getattr(self, system), system_bits) for system in SYSTEMS]
+        fields += [(self.energy_pool, energy_bits), (self.round_counter, _ROUND_BITS),
+                   (self.mission_progress, counter_bits), (self.challenges_completed_counter, counter_bits)]
+        challenge = self._card_index[self.current_challenge] + 1 if self.current_challenge else 0
+        fields += [(challenge, card_bits), (len(self.challenge_deck), deck_len_bits)]
+        for value, bits in fields:
+            if not 0 <= value < (1 << bits):
+                raise ValueError(f"Wert {value} passt nicht in {bits} Bit")
+            state |= value << shift
+            shift += bits
+        return state | (self._packed_deck(card_bits) << shift)
+
+    def _packed_deck(self, card_bits: int) -> int:
+        """Catalog indices of the draw pile, top card in the lowest bits."""
+        deck, cache = self.challenge_deck, self._deck_cache
+        if cache and cache[0] is deck and cache[1] >= len(deck):
+            # Seitdem nur gezogen: die obersten Karten einfach herausschieben
+            packed = cache[2] >> ((cache[1] - len(deck)) * card_bits)
+        else:
+            # Über eine Binärziffernfolge in linearer Zeit, Schieben je Karte wäre quadratisch
+            index, digits = self._card_index, f"0{card_bits}b"
+            packed = int("".join(format(index[card], digits) for card in reversed(list(deck))) or "0", 2)
+        self._deck_cache = (deck, len(deck), packed)
+        return packed
+
+    def restore(self, state: int):
+        """Restores a state produced by `snapshot`; Player objects are reused where possible."""
+        def take(bits: int) -> int:
+            nonlocal state
+            value = state & ((1 << bits) - 1)
+            state >>= bits
+            return value
+
+        self.current_phase = PHASES[take(_PHASE_BITS)]
+        selected_mask, crew_mask = take(_CREW_BITS), take(_CREW_BITS)
+        self.selected_character_indices = {i for i in range(len(SPECIALIZATIONS)) if selected_mask >> i & 1}
+        crew = [i for i in range(len(SPECIALIZATIONS)) if crew_mask >> i & 1]
+        if [p.specialization for p in self.players] != [SPECIALIZATIONS[i] for i in crew]:
+            self.players = [Player(CHAR_NAMES[i], SPECIALIZATIONS[i]) for i in crew]
+        if not self.players:
+            return
+        active = take(_ACTIVE_BITS)
+        ready_mask = take(_CREW_BITS)
+        for i, player in enumerate(self.players):
+            player.is_ready = bool(ready_mask >> i & 1)
+        self.active_character = self.players[active]
+        system_bits, energy_bits, card_bits, counter_bits, deck_len_bits = self._field_bits()
+        for system in SYSTEMS:
+            setattr(self, system, take(system_bits))
+        self.energy_pool = take(energy_bits)
+        self.round_counter = take(_ROUND_BITS)
+        self.mission_progress = take(counter_bits)
+        self.challenges_completed_counter = take(counter_bits)
+        challenge = take(card_bits)
+        self.current_challenge = self.card_catalog[challenge - 1] if challenge else None
+        deck_len = take(deck_len_bits)
+        cache = self._deck_cache
+        if cache and cache[0] is self.challenge_deck and cache[1] == deck_len == len(self.challenge_deck) and cache[2] == state:
+            return  # Undo innerhalb einer Runde: der Nachziehstapel ist unverändert
+        # Karten aus der Binärdarstellung schneiden statt den Rest je Karte zu verschieben (linear statt quadratisch)
+        end = deck_len * card_bits
+        digits, catalog = format(state, "b").zfill(end), self.card_catalog
+        cards = [catalog[int(digits[end - i - card_bits:end - i], 2)] for i in range(0, end, card_bits)]
+        self.challenge_deck = ChallengeDeck(cards)
+        self._deck_cache = (self.challenge_deck, deck_len, state)
+
+    def _field_bits(self) -> Tuple[int, int, int, int, int]:
+        """(system, energy, card, counter, deck length) widths.
+
+        System and energy widths follow the rules, the others the card catalog; for the
+        shipped rules and deck they match the fixed minimums.
+        """
+        rules, cards = self.rules, len(self.card_catalog)
+        system_max = max(rules.system_caps() + rules.start_values())
+        energy_max = max(rules.energy_map.values())
+        return (max(_SYSTEM_BITS, system_max.bit_length()), max(_ENERGY_BITS, energy_max.bit_length()),
+                max(1, (cards + 1).bit_length()), max(_COUNTER_BITS, cards.bit_length()),
+                max(_DECK_LEN_BITS, cards.bit_length()))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, GameState) and self.snapshot() == other.snapshot()
+
+    def __hash__(self) -> int:
+        return hash(self.snapshot())
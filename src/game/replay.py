@@ -0,0 +1,80 @@
+# ==============================================================================
+# src/game/replay.py
+# Headless-Replay aufgezeichneter Missionen (ohne pygame) als Regressionstest.
+# Aufruf: python -m src.game.replay recordings/missions.mlog [...]
+# ==============================================================================
+import argparse
+import sys
+import time
+from typing import Iterable, Optional
+
+from src.game import action_log
+from src.game.action_log import ActionLog, iter_logs
+from src.game.game_state import GameState, SYSTEMS
+
+def replay(log: ActionLog, trajectory=None) -> GameState:
+    """Re-runs a recorded mission at full speed and returns the final state.
+
+    `trajectory` (e.g. a src.sim.trajectories.TrajectoryWriter) receives one row per round.
+    """
+    game_state = GameState(seed=log.seed)
+    game_state.trajectory = trajectory
+    for action in log.actions:
+        opcode = action[0]
+        if opcode == action_log.MODIFY:
+            game_state.modify_system_value(SYSTEMS[action[1]], action[2])
+        elif opcode == action_log.MODIFY_UNDOABLE:
+            game_state.modify_system_value(SYSTEMS[action[1]], action[2], record_undo=True)
+        elif opcode == action_log.SET_ACTIVE:
+            game_state.set_active_character(action[1])
+        elif opcode == action_log.TOGGLE_READY:
+            game_state.toggle_ready(action[1])
+        elif opcode == action_log.FINISH_ACTION_PHASE:
+            game_state.finish_action_phase()
+        elif opcode == action_log.SELECT_CHARACTER:
+            game_state.toggle_character_selection(action[1])
+        elif opcode == action_log.START_GAME:
+            game_state.start_game()
+        elif opcode == action_log.UNDO:
+            game_state.undo()
+    return game_state
+
+def verify(log: ActionLog, trajectory=None) -> bool:
+    """True if the replay ends in exactly the recorded final state."""
+    return log.final_snapshot is not None and replay(log, trajectory).snapshot() == log.final_snapshot
+
+def verify_archives(paths: Iterable[str], trajectory_dir: Optional[str] = None) -> int:
+    trajectory = None
+    if trajectory_dir:
+        from src.sim.trajectories import TrajectoryWriter  # NumPy nur, wenn Verläufe gewünscht sind
+        trajectory = TrajectoryWriter(trajectory_dir, prefix="replay")
+    sessions = failures = actions = aborted = 0
+    start = time.perf_counter()
+    for path in paths:
+        with open(path, "rb") as stream:
+            for index, log in enumerate(iter_logs(stream)):
+                sessions += 1
+                actions += len(log.actions)
+                if log.final_snapshot is None:
+                    # Abgebrochenes Spiel ohne Endzustand: nichts zu vergleichen, aber mit replay() nachspielbar
+                    aborted += 1
+                    print(f"ABGEBROCHEN: {path} Log #{index} (Seed {log.seed}, {len(log.actions)} Aktionen)")
+                elif not verify(log, trajectory):
+                    failures += 1
+                    print(f"ABWEICHUNG: {path} Log #{index} (Seed {log.seed})")
+    if trajectory: trajectory.close()
+    elapsed = time.perf_counter() - start
+    rate = sessions / elapsed if elapsed else 0.0
+    print(f"{sessions} Missionen, {actions} Aktionen, {failures} Abweichungen, {aborted} abgebrochen "
+          f"in {elapsed:.2f} s ({rate:.0f} Missionen/s)")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Aufgezeichnete Missionen headless nachspielen und prüfen")
+    parser.add_argument("archives", nargs="+")
+    parser.add_argument("--trajectories", default=None, help="Rundenverläufe in dieses Verzeichnis schreiben")
+    args = parser.parse_args()
+    sys.exit(1 if verify_archives(args.archives, args.trajectories) else 0)
+
+if __name__ == "__main__":
+    main()
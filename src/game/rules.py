@@ -0,0 +1,93 @@
+# ==============================================================================
+# src/game/rules.py
+# Balancing-Konstanten einer Mission als austauschbares Regelobjekt.
+# ==============================================================================
+import hashlib
+import json
+import random
+from typing import Dict, Optional, Tuple
+
+from src.game import decks
+
+LIFE_SUPPORT_SYSTEMS = ("oxygen", "water", "temperature", "airpressure")
+DRIVE_SYSTEMS = ("thrust", "navigation")
+
+class Rules:
+    """Tunable constants of the energy system; `Rules()` is the shipped game."""
+    __slots__ = ("decay", "energy_map", "life_support_max", "drive_max", "specialist_bonus", "action_cost",
+                 "start_life_support", "target_thrust_shift", "target_navigation_shift", "card_file")
+
+    def __init__(self, decay: int = 2, energy_map: Optional[Dict[int, int]] = None, life_support_max: int = 6,
+                 drive_max: int = 8, specialist_bonus: int = 2, action_cost: int = 1, start_life_support: int = 6,
+                 target_thrust_shift: int = 0, target_navigation_shift: int = 0, card_file: Optional[str] = None):
+        self.decay = decay
+        self.energy_map = {1: 4, 2: 6, 3: 8, 4: 10} if energy_map is None else {int(k): v for k, v in energy_map.items()}
+        self.life_support_max = life_support_max
+        self.drive_max = drive_max
+        self.specialist_bonus = specialist_bonus
+        self.action_cost = action_cost
+        self.start_life_support = start_life_support
+        # Verschiebung aller Kartenziele; Ziele fallen nie unter 0
+        self.target_thrust_shift = target_thrust_shift
+        self.target_navigation_shift = target_navigation_shift
+        self.card_file = card_file  # None = mitgelieferte Kartendatei
+
+    # --- Abgeleitete Werte ---
+    def energy_for_crew(self, crew_size: int) -> int:
+        return self.energy_map.get(crew_size, max(self.energy_map.values()))
+
+    def system_max(self, system: str) -> int:
+        return self.drive_max if system in DRIVE_SYSTEMS else self.life_support_max
+
+    def system_caps(self) -> Tuple[int, ...]:
+        return (self.life_support_max,) * len(LIFE_SUPPORT_SYSTEMS) + (self.drive_max,) * len(DRIVE_SYSTEMS)
+
+    def start_values(self) -> Tuple[int, ...]:
+        return (self.start_life_support,) * len(LIFE_SUPPORT_SYSTEMS) + (0,) * len(DRIVE_SYSTEMS)
+
+    def card_pool(self, phase: int, player_count: int):
+        return decks.card_pool(phase, player_count, self.card_file or decks.CARD_FILE, self._target_shift())
+
+    def challenge_deck(self, phase: int, player_count: int, rng: Optional[random.Random] = None) -> decks.ChallengeDeck:
+        return decks.create_challenge_deck(phase, player_count, rng, self.card_file or decks.CARD_FILE,
+                                           self._target_shift())
+
+    def cards_hash(self) -> str:
+        """Content hash of the card definitions these rules draw from (`decks.definitions_hash`)."""
+        return decks.definitions_hash(self.card_file or decks.CARD_FILE)
+
+    def _target_shift(self) -> Tuple[int, int]:
+        return self.target_thrust_shift, self.target_navigation_shift
+
+    # --- Serialisierung ---
+    def to_dict(self) -> dict:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["energy_map"] = {str(k): v for k, v in sorted(self.energy_map.items())}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Rules":
+        return cls(**data)
+
+    def replace(self, **changes) -> "Rules":
+        data = self.to_dict()
+        data.update(changes)
+        return Rules.from_dict(data)
+
+    def config_hash(self) -> str:
+        """Stable hash of all values, e.g. as a cache key for sweeps."""
+        canonical = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Rules) and self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(self.config_hash())
+
+    def __repr__(self):
+        changed = {k: v for k, v in self.to_dict().items() if v != DEFAULT_RULES_DICT[k]}
+        return f"Rules({', '.join(f'{k}={v!r}' for k, v in changed.items())})"
+
+DEFAULT_RULES = Rules()
+DEFAULT_RULES_DICT = DEFAULT_RULES.to_dict()
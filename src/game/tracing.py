@@ -0,0 +1,101 @@
+# ==============================================================================
+# src/game/tracing.py
+# Tracing: Phasenwechsel, Aktionen und Frame-Aufteilung als Chrome-Trace-Events (JSON).
+# Ansehen: chrome://tracing oder https://ui.perfetto.dev
+# ==============================================================================
+import functools
+import json
+import os
+import time
+from collections import deque
+from typing import Callable, Optional, Sequence, TextIO, Tuple
+
+# Zeilen im Trace-Viewer (Chrome nennt sie Threads)
+GAME_TID, FRAME_TID = 1, 2
+_THREAD_NAMES = {GAME_TID: "Spiel", FRAME_TID: "Frames"}
+
+class Tracer:
+    """Collects trace events in memory and writes them as Chrome trace-event JSON.
+
+    Call sites guard every hook with `if tracer:`, so a disabled tracer (None) costs one
+    attribute test. Events live in a ring buffer of `max_events`; long sessions keep the
+    most recent ones. With `echo`, every event is also written as one line of text.
+    """
+    def __init__(self, max_events: int = 1_000_000, echo: Optional[TextIO] = None):
+        # Roh-Tupel (ph, name, cat, start, dauer, tid, args); JSON-Objekte erst beim Export
+        self.events: deque = deque(maxlen=max_events)
+        self.echo = echo
+        self.pid = os.getpid()
+        self.recorded = 0
+        self._origin = time.perf_counter()
+        self._phase: Optional[Tuple[str, float, int]] = None  # offene Phase: (Name, Start, Runde)
+
+    # --- Ereignisse ---
+    def instant(self, name: str, cat: str, args: Optional[dict] = None, tid: int = GAME_TID):
+        self.events.append(("i", name, cat, time.perf_counter(), 0.0, tid, args))
+        self.recorded += 1
+        if self.echo:
+            text = " ".join(f"{key}={value}" for key, value in (args or {}).items())
+            self.echo.write(f"[{cat}] {name} {text}".rstrip() + "\n")
+
+    def complete(self, name: str, cat: str, start: float, end: float, args: Optional[dict] = None, tid: int = FRAME_TID):
+        """A finished span between two `time.perf_counter()` readings; spans are not echoed."""
+        self.events.append(("X", name, cat, start, end - start, tid, args))
+        self.recorded += 1
+
+    def phase(self, name: str, round_number: int):
+        """Closes the running phase span and opens `name`; phases tile the game row without gaps."""
+        self._close_phase(time.perf_counter())
+        self.instant(name, "phase", {"round": round_number})
+        self._phase = (name, self.events[-1][3], round_number)
+
+    def _close_phase(self, now: float):
+        if self._phase:
+            name, start, round_number = self._phase
+            self.complete(name, "phase", start, now, {"round": round_number}, GAME_TID)
+            self._phase = None
+
+    def action(self, name: str, **args):
+        self.instant(name, "action", args)
+
+    def frame(self, start: float, sections: Sequence[Tuple[str, float]]):
+        """One frame from `start`; `sections` are (name, end time) in order, e.g. events, logic, render."""
+        previous = start
+        for name, end in sections:
+            self.complete(name, "frame", previous, end)
+            previous = end
+        self.complete("Frame", "frame", start, previous)
+
+    def wrap(self, fn: Callable, name: Optional[str] = None, cat: str = "draw") -> Callable:
+        """`fn` with every call recorded as a span, e.g. to instrument draw functions."""
+        name = name or fn.__name__
+        @functools.wraps(fn)
+        def traced(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.complete(name, cat, start, time.perf_counter())
+        return traced
+
+    # --- Ausgabe ---
+    def to_json(self) -> dict:
+        self._close_phase(time.perf_counter())
+        metadata = [{"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+                    for tid, name in _THREAD_NAMES.items()]
+        events = []
+        for ph, name, cat, start, duration, tid, args in self.events:
+            event = {"name": name, "cat": cat, "ph": ph, "ts": round((start - self._origin) * 1e6, 3),
+                     "pid": self.pid, "tid": tid}
+            if ph == "X": event["dur"] = round(duration * 1e6, 3)
+            else: event["s"] = "t"
+            if args: event["args"] = args
+            events.append(event)
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms",
+                "otherData": {"recorded": self.recorded, "dropped": self.recorded - len(self.events)}}
+
+    def save(self, path: str):
+        directory = os.path.dirname(path)
+        if directory: os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, separators=(",", ":"))
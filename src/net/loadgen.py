@@ -0,0 +1,200 @@
+# ==============================================================================
+# src/net/loadgen.py
+# Lastgenerator: Loopback-Clients spielen viele Sitzungen gleichzeitig gegen den Server.
+# Aufruf: python -m src.net.loadgen [--sessions 500 --clients 2 --duration 10]
+# ==============================================================================
+import argparse
+import asyncio
+import itertools
+import multiprocessing
+import random
+import time
+from typing import List, Sequence, Tuple
+
+from src.game.game_state import AKTIONSPHASE, GAME_OVER, SYSTEMS
+from src.net import protocol
+from src.net.server import GameServer
+
+# Kurze Nachfrist, damit der Lauf auch das verzögerte Aufräumen der Sitzungen abdeckt
+LOAD_SESSION_GRACE = 0.5
+
+def _run_server(port_queue, session_grace: float):
+    async def run():
+        server = await GameServer(session_grace).start("127.0.0.1", 0)
+        port_queue.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+    asyncio.run(run())
+
+class LoadClient:
+    """One crew member's device: mirrors the session from deltas and plays a simple policy."""
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, rng: random.Random):
+        self.reader = reader
+        self.writer = writer
+        self.rng = rng
+        self.fields: protocol.Fields = {}
+        self.players: List[int] = []
+        self.errors = 0
+
+    async def request(self, message: dict, ack=None) -> dict:
+        """Sends one message and reads (applying deltas) until the reply that answers it."""
+        self.writer.write(protocol.encode(message))
+        while True:
+            reply = protocol.decode(await self.reader.readline())
+            kind = reply["type"]
+            if kind == "delta":
+                protocol.apply_delta(self.fields, reply["changes"])
+                if ack is not None and reply.get("ack") == ack:
+                    return reply
+            elif kind == "joined":
+                self.fields = dict(reply["state"])
+                return reply
+            elif kind == "error" or kind == "ack" or kind == "stats":
+                if kind == "error": self.errors += 1
+                if ack is None or reply.get("id") == ack:
+                    return reply
+
+    def next_action(self) -> dict:
+        fields = self.fields
+        if fields["phase"] == GAME_OVER:
+            return {"op": "restart"}
+        if fields["phase"] != AKTIONSPHASE:
+            return {"op": "undo"}
+        if fields["energy"] > 0:
+            if fields["active"] not in self.players:
+                return {"op": "set_active", "player": self.rng.choice(self.players)}
+            return {"op": "modify", "system": self.rng.choice(SYSTEMS), "amount": 1}
+        waiting = [i for i in self.players if not fields["ready"][i]]
+        return {"op": "ready", "player": waiting[0]} if waiting else {"op": "undo"}
+
+async def _play(host: str, port: int, sessions: int, clients: int, warmup: float, duration: float,
+                think_time: float, seed: int) -> Tuple[List[float], int, int]:
+    rng = random.Random(seed)
+    ids = itertools.count(1)
+    latencies: List[float] = []
+    connections: List[List[LoadClient]] = []
+    for _ in range(sessions):
+        group = []
+        for _ in range(clients):
+            reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+            group.append(LoadClient(reader, writer, random.Random(rng.getrandbits(32))))
+        joined = await group[0].request({"op": "create", "crew": [0, 1, 2, 3], "seed": rng.getrandbits(32)})
+        for client in group[1:]:
+            await client.request({"op": "join", "session": joined["session"]})
+        crew_size = len(joined["state"]["crew"])
+        for i, client in enumerate(group):
+            client.players = [p for p in range(crew_size) if p % clients == i] or [i % crew_size]
+        connections.append(group)
+
+    measure_from = time.perf_counter() + warmup
+    stop_at = measure_from + duration
+
+    async def drive(client: LoadClient):
+        await asyncio.sleep(client.rng.random() * think_time)
+        while time.perf_counter() < stop_at:
+            action_id = next(ids)
+            message = client.next_action()
+            message["id"] = action_id
+            sent = time.perf_counter()
+            await client.request(message, ack=action_id)
+            if sent >= measure_from:
+                latencies.append(time.perf_counter() - sent)
+            if think_time: await asyncio.sleep(think_time)
+
+    clients_flat = [client for group in connections for client in group]
+    await asyncio.gather(*(drive(client) for client in clients_flat))
+    for client in clients_flat:
+        client.writer.close()
+    return latencies, len(latencies), sum(client.errors for client in clients_flat)
+
+def _client_worker(args) -> Tuple[List[float], int, int]:
+    return asyncio.run(_play(*args))
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+async def _server_stats(host: str, port: int) -> dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(protocol.encode({"op": "stats"}))
+    stats = protocol.decode(await reader.readline())
+    writer.close()
+    return stats
+
+def run_load(sessions: int = 500, clients: int = 2, duration: float = 10.0, warmup: float = 2.0,
+             think_time: float = 0.1, workers: int = 2, seed: int = 0) -> dict:
+    """Starts a server process, plays `sessions` missions over loopback and measures it."""
+    context = multiprocessing.get_context("spawn")
+    port_queue = context.Queue()
+    server = context.Process(target=_run_server, args=(port_queue, LOAD_SESSION_GRACE), daemon=True)
+    server.start()
+    port = port_queue.get(timeout=30)
+    try:
+        shares = [sessions // workers + (1 if i < sessions % workers else 0) for i in range(workers)]
+        jobs = [("127.0.0.1", port, share, clients, warmup, duration, think_time, seed + i)
+                for i, share in enumerate(shares) if share]
+        with context.Pool(len(jobs)) as pool:
+            result = pool.map_async(_client_worker, jobs)
+            # Warte, bis alle Sitzungen angelegt sind und die Aufwärmphase läuft
+            while asyncio.run(_server_stats("127.0.0.1", port))["sessions"] < sessions and not result.ready():
+                time.sleep(0.05)
+            time.sleep(warmup)
+            before = asyncio.run(_server_stats("127.0.0.1", port))
+            start = time.perf_counter()
+            time.sleep(duration)
+            after = asyncio.run(_server_stats("127.0.0.1", port))
+            elapsed = time.perf_counter() - start
+            outcomes = result.get()
+            # Alle Clients sind getrennt: nach der Nachfrist darf keine Sitzung übrig bleiben
+            deadline = time.perf_counter() + LOAD_SESSION_GRACE + 10
+            while True:
+                sessions_left = asyncio.run(_server_stats("127.0.0.1", port))["sessions"]
+                if not sessions_left or time.perf_counter() > deadline:
+                    break
+                time.sleep(0.05)
+    finally:
+        server.terminate()
+        server.join()
+
+    latencies = [value for outcome in outcomes for value in outcome[0]]
+    cpu = (after["cpu_time"] - before["cpu_time"]) / elapsed
+    actions_per_second = (after["actions"] - before["actions"]) / elapsed
+    return {
+        "sessions": sessions,
+        "connections": sessions * clients,
+        "actions_per_second": actions_per_second,
+        "broadcasts_per_second": (after["broadcasts"] - before["broadcasts"]) / elapsed,
+        "server_cpu": cpu,
+        "sessions_per_core": sessions / cpu if cpu else float("inf"),
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "errors": sum(outcome[2] for outcome in outcomes),
+        "sessions_left": sessions_left,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Loopback-Lasttest für den Mission-Enceladus-Server")
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--clients", type=int, default=2, help="Clients (Geräte) pro Sitzung")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--think-ms", type=float, default=100.0, help="Pause zwischen Aktionen eines Clients")
+    parser.add_argument("--workers", type=int, default=2, help="Client-Prozesse")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stats = run_load(args.sessions, args.clients, args.duration, args.warmup, args.think_ms / 1000,
+                     args.workers, args.seed)
+    print(f"Sitzungen: {stats['sessions']} ({stats['connections']} Verbindungen)")
+    print(f"Aktionen/s: {stats['actions_per_second']:.0f}, Broadcasts/s: {stats['broadcasts_per_second']:.0f}")
+    print(f"Server-CPU: {stats['server_cpu'] * 100:.1f} % eines Kerns -> {stats['sessions_per_core']:.0f} Sitzungen/Kern")
+    print(f"Latenz Aktion->Broadcast: p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms")
+    print(f"Abgelehnte Aktionen: {stats['errors']}")
+    print(f"Sitzungen nach Trennung aller Clients: {stats['sessions_left']}")
+    if stats["sessions_left"]:
+        raise SystemExit("Server hat Sitzungen ohne Verbindungen nicht freigegeben")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# ==============================================================================
+# src/net/protocol.py
+# Zeilenbasiertes JSON-Protokoll und Delta-Kodierung des Spielzustands.
+# ==============================================================================
+import json
+from typing import Any, Dict
+
+from src.game.game_state import GameState, SYSTEMS
+
+# Client -> Server (eine JSON-Nachricht pro Zeile, Feld "op"):
+#   {"op": "create", "crew": [0, 2], "seed": 7}     neue Sitzung anlegen und beitreten
+#   {"op": "join", "session": 3}                    bestehender Sitzung beitreten (abonnieren)
+#   {"op": "modify", "system": "oxygen", "amount": 1, "id": 12}
+#   {"op": "set_active", "player": 1, "id": 13}
+#   {"op": "ready", "player": 0, "id": 14}          Bereitschaft umschalten; alle bereit -> Auflösung
+#   {"op": "undo", "id": 15}
+#   {"op": "restart", "id": 16}                     neue Mission nach GAME_OVER
+#   {"op": "stats"}
+# Server -> Client (Feld "type"):
+#   {"type": "joined", "session": 3, "seq": 5, "state": {...}}   voller Zustand einmal beim Beitritt
+#   {"type": "delta", "seq": 6, "changes": {...}, "ack": 12}     nur geänderte Felder an alle Abonnenten
+#   {"type": "ack", "id": 13}                                    Aktion ohne sichtbare Änderung
+#   {"type": "error", "message": "...", "id": 14}
+#   {"type": "stats", ...}
+# "id" wählt der Client frei; "ack" in einem Delta nennt die Aktion, die es ausgelöst hat.
+
+Fields = Dict[str, Any]
+
+def encode(message: Dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+def decode(line: bytes) -> Dict[str, Any]:
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Nachricht muss ein JSON-Objekt sein")
+    return message
+
+def state_fields(game_state: GameState) -> Fields:
+    """Flat, JSON-ready view of a started mission; the unit of delta encoding."""
+    challenge = game_state.current_challenge
+    fields: Fields = {
+        "phase": game_state.current_phase,
+        "round": game_state.round_counter,
+        "progress": game_state.mission_progress,
+        "completed": game_state.challenges_completed_counter,
+        "energy": game_state.energy_pool,
+        "crew": [player.name for player in game_state.players],
+        "active": game_state.players.index(game_state.active_character),
+        "ready": [player.is_ready for player in game_state.players],
+        "challenge": [challenge.name, challenge.target_thrust, challenge.target_navigation] if challenge else None,
+        "deck": len(game_state.challenge_deck),
+        "seed": game_state.seed,
+    }
+    for system in SYSTEMS:
+        fields[system] = getattr(game_state, system)
+    return fields
+
+def diff(old: Fields, new: Fields) -> Fields:
+    return {key: value for key, value in new.items() if old.get(key) != value}
+
+def apply_delta(fields: Fields, changes: Fields) -> Fields:
+    fields.update(changes)
+    return fields
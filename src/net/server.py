@@ -0,0 +1,214 @@
+# ==============================================================================
+# src/net/server.py
+# Asyncio-Spielserver: viele unabhängige Missionen in einem Prozess.
+# Aufruf: python -m src.net.server [--port 7777 | --unix /tmp/enceladus.sock]
+# ==============================================================================
+import argparse
+import asyncio
+import time
+from typing import Dict, Optional, Sequence, Set
+
+from src.game.game_state import GameState, AKTIONSPHASE, GAME_OVER, SYSTEMS
+from src.net import protocol
+
+# Abonnenten, deren Sendepuffer darüber wächst, werden getrennt statt den Server zu bremsen
+MAX_WRITE_BUFFER = 1 << 20
+# Sitzungen ohne Abonnenten bleiben so viele Sekunden für ein Wiederverbinden erhalten
+SESSION_GRACE = 30.0
+
+class Session:
+    """One mission with its subscribed connections and the last broadcast field set."""
+    __slots__ = ("session_id", "crew", "game_state", "subscribers", "fields", "seq", "eviction")
+
+    def __init__(self, session_id: int, crew: Sequence[int], seed: Optional[int] = None):
+        self.session_id = session_id
+        self.crew = sorted(set(crew))
+        if not self.crew or any(not 0 <= i < 4 for i in self.crew):
+            raise ValueError("Crew muss aus 1-4 Charakter-Indizes 0..3 bestehen")
+        self.subscribers: Set[asyncio.StreamWriter] = set()
+        self.seq = 0
+        self.eviction: Optional[asyncio.TimerHandle] = None
+        self.new_mission(seed)
+
+    def new_mission(self, seed: Optional[int] = None):
+        self.game_state = GameState(seed)
+        self.game_state.selected_character_indices = set(self.crew)
+        self.game_state.start_game()
+        self.fields = protocol.state_fields(self.game_state)
+
+    def apply(self, message: dict):
+        """Applies one player action; raises ValueError for actions the rules do not allow now."""
+        op = message.get("op")
+        game_state = self.game_state
+        if op == "restart":
+            if game_state.current_phase != GAME_OVER:
+                raise ValueError("Neustart nur nach GAME_OVER")
+            self.new_mission(message.get("seed"))
+            self.fields = {}  # volles Delta an alle Abonnenten
+            return
+        if game_state.current_phase != AKTIONSPHASE:
+            raise ValueError("Aktionen nur in der AKTIONSPHASE")
+        if op == "modify":
+            system, amount = message.get("system"), message.get("amount")
+            if system not in SYSTEMS or amount not in (-1, 1):
+                raise ValueError("modify braucht ein gültiges System und amount +1/-1")
+            game_state.modify_system_value(system, amount, record_undo=True)
+        elif op == "set_active":
+            game_state.set_active_character(self._player(message))
+        elif op == "ready":
+            game_state.toggle_ready(self._player(message))
+            if all(player.is_ready for player in game_state.players):
+                game_state.finish_action_phase()
+        elif op == "undo":
+            game_state.undo()
+        else:
+            raise ValueError(f"Unbekannte Aktion: {op}")
+
+    def _player(self, message: dict) -> int:
+        index = message.get("player")
+        if not isinstance(index, int) or not 0 <= index < len(self.game_state.players):
+            raise ValueError("Ungültiger Spieler-Index")
+        return index
+
+    def publish(self, ack=None) -> Optional[bytes]:
+        """Encodes the changed fields as one delta line, or None if nothing visible changed."""
+        fields = protocol.state_fields(self.game_state)
+        changes = protocol.diff(self.fields, fields)
+        if not changes:
+            return None
+        self.fields = fields
+        self.seq += 1
+        delta = {"type": "delta", "seq": self.seq, "changes": changes}
+        if ack is not None: delta["ack"] = ack
+        return protocol.encode(delta)
+
+class GameServer:
+    """Holds all sessions and serves the line protocol of `src.net.protocol`."""
+    def __init__(self, session_grace: float = SESSION_GRACE):
+        self.sessions: Dict[int, Session] = {}
+        self.session_grace = session_grace
+        self.next_session_id = 1
+        self.actions = 0
+        self.broadcasts = 0
+        self.connections = 0
+
+    def create_session(self, crew: Sequence[int], seed: Optional[int] = None) -> Session:
+        session = Session(self.next_session_id, crew, seed)
+        self.sessions[session.session_id] = session
+        self.next_session_id += 1
+        return session
+
+    def subscribe(self, session: Session, writer: asyncio.StreamWriter):
+        if session.eviction:
+            session.eviction.cancel()
+            session.eviction = None
+        session.subscribers.add(writer)
+
+    def unsubscribe(self, session: Session, writer: asyncio.StreamWriter):
+        """Removes a subscriber; a session left without any is evicted after `session_grace` seconds."""
+        session.subscribers.discard(writer)
+        if session.subscribers or session.eviction:
+            return
+        if self.session_grace <= 0:
+            self.evict(session)
+        else:
+            session.eviction = asyncio.get_running_loop().call_later(self.session_grace, self.evict, session)
+
+    def evict(self, session: Session):
+        session.eviction = None
+        if not session.subscribers and self.sessions.get(session.session_id) is session:
+            del self.sessions[session.session_id]
+
+    def stats(self) -> dict:
+        return {"type": "stats", "sessions": len(self.sessions), "connections": self.connections,
+                "actions": self.actions, "broadcasts": self.broadcasts, "cpu_time": time.process_time()}
+
+    def broadcast(self, session: Session, line: bytes):
+        for writer in list(session.subscribers):
+            if writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+                self.unsubscribe(session, writer)
+                writer.close()
+                continue
+            writer.write(line)
+            self.broadcasts += 1
+
+    def handle_message(self, message: dict, session: Optional[Session], writer: asyncio.StreamWriter) -> Optional[Session]:
+        """Handles one message of a connection and returns the session it is joined to afterwards."""
+        op = message.get("op")
+        if op == "stats":
+            writer.write(protocol.encode(self.stats()))
+            return session
+        if op in ("create", "join"):
+            if op == "create":
+                joined = self.create_session(message.get("crew", [0, 1, 2, 3]), message.get("seed"))
+            else:
+                joined = self.sessions.get(message.get("session"))
+                if joined is None:
+                    raise ValueError("Unbekannte Sitzung")
+            if session and session is not joined:
+                self.unsubscribe(session, writer)
+            session = joined
+            self.subscribe(session, writer)
+            writer.write(protocol.encode({"type": "joined", "session": session.session_id,
+                                          "seq": session.seq, "state": session.fields}))
+            return session
+        if session is None:
+            raise ValueError("Zuerst einer Sitzung beitreten")
+        session.apply(message)
+        self.actions += 1
+        line = session.publish(message.get("id"))
+        if line: self.broadcast(session, line)
+        else: writer.write(protocol.encode({"type": "ack", "id": message.get("id")}))
+        return session
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        session: Optional[Session] = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = {}
+                try:
+                    message = protocol.decode(line)
+                    session = self.handle_message(message, session, writer)
+                except (ValueError, TypeError) as e:
+                    writer.write(protocol.encode({"type": "error", "message": str(e), "id": message.get("id")}))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            if session:
+                self.unsubscribe(session, writer)
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 7777, path: Optional[str] = None) -> asyncio.AbstractServer:
+        if path:
+            return await asyncio.start_unix_server(self.handle_client, path=path)
+        return await asyncio.start_server(self.handle_client, host, port)
+
+async def serve(host: str = "127.0.0.1", port: int = 7777, path: Optional[str] = None,
+                session_grace: float = SESSION_GRACE):
+    server = await GameServer(session_grace).start(host, port, path)
+    address = path or "%s:%d" % server.sockets[0].getsockname()[:2]
+    print(f"Mission-Enceladus-Server lauscht auf {address}")
+    async with server:
+        await server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Mehrspieler-Server für Mission Enceladus")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", default=None, help="Unix-Socket statt TCP")
+    parser.add_argument("--grace", type=float, default=SESSION_GRACE,
+                        help="Sekunden, die eine Sitzung ohne Verbindungen erhalten bleibt")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.grace))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+# ==============================================================================
+# src/sim/batch_engine.py
+# Vektorisierte Batch-Engine: N Missionen im Gleichschritt als NumPy-Arrays.
+# ==============================================================================
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.game.game_state import GameState, GAME_OVER
+from src.game.rules import Rules, DEFAULT_RULES
+
+SYSTEMS = ["oxygen", "water", "temperature", "airpressure", "thrust", "navigation"]
+SYSTEM_INDEX = {name: i for i, name in enumerate(SYSTEMS)}
+LIFE_SUPPORT = slice(0, 4)
+THRUST, NAVIGATION = SYSTEM_INDEX["thrust"], SYSTEM_INDEX["navigation"]
+
+class BatchEngine:
+    """Struct-of-arrays mirror of GameState that steps N missions at once.
+
+    Every game starts in AKTIONSPHASE; games that reach GAME_OVER are masked out of all
+    further updates, exactly as a scalar driver would stop acting on them.
+    """
+    def __init__(self, values: np.ndarray, energy: np.ndarray, specs: np.ndarray, n_players: np.ndarray,
+                 active: np.ndarray, deck: np.ndarray, deck_len: np.ndarray, challenge: np.ndarray,
+                 card_targets: np.ndarray, round_counter: np.ndarray, game_over: Optional[np.ndarray] = None,
+                 rules: Rules = DEFAULT_RULES):
+        n = len(values)
+        self.n = n
+        self.rows = np.arange(n)
+        self.values = values.astype(np.int8)
+        self.energy = energy.astype(np.int16)
+        self.specs = specs.astype(np.int8)
+        self.n_players = n_players.astype(np.int8)
+        self.active = active.astype(np.int8)
+        self.deck = deck.astype(np.int16)
+        self.deck_len = deck_len.astype(np.int16)
+        self.deck_pos = np.zeros(n, dtype=np.int16)
+        self.challenge = challenge.astype(np.int16)
+        self.card_targets = card_targets.astype(np.int8)
+        self.round_counter = round_counter.astype(np.int32)
+        self.mission_progress = np.zeros(n, dtype=np.int32)
+        self.challenges_completed = np.zeros(n, dtype=np.int32)
+        self.game_over = np.zeros(n, dtype=bool) if game_over is None else game_over.astype(bool)
+        # Regeln wie in GameState.start_new_round / modify_system_value
+        self.rules = rules
+        self.system_max = np.array(rules.system_caps(), dtype=np.int8)
+        self.energy_by_crew = np.array([rules.energy_for_crew(size) for size in range(5)], dtype=np.int16)
+
+    @classmethod
+    def from_games(cls, games: Sequence[GameState]) -> "BatchEngine":
+        """Loads freshly started GameState instances (all in AKTIONSPHASE or GAME_OVER)."""
+        n = len(games)
+        rules = games[0].rules if games else DEFAULT_RULES
+        if any(g.rules is not rules and g.rules != rules for g in games):
+            raise ValueError("Alle Spiele eines Batches brauchen dieselben Regeln")
+        catalog: List[Tuple[str, int, int]] = []
+        card_ids = {}
+
+        def card_id(card) -> int:
+            key = (card.name, card.target_thrust, card.target_navigation)
+            if key not in card_ids:
+                card_ids[key] = len(catalog)
+                catalog.append(key)
+            return card_ids[key]
+
+        max_deck = max((len(g.challenge_deck) for g in games), default=0)
+        values = np.zeros((n, len(SYSTEMS)), dtype=np.int8)
+        specs = np.full((n, 4), -1, dtype=np.int8)
+        deck = np.full((n, max(1, max_deck)), -1, dtype=np.int16)
+        deck_len = np.zeros(n, dtype=np.int16)
+        challenge = np.full(n, -1, dtype=np.int16)
+        energy, n_players, active, rounds = (np.zeros(n, dtype=np.int32) for _ in range(4))
+        game_over = np.zeros(n, dtype=bool)
+        for i, g in enumerate(games):
+            values[i] = [getattr(g, name) for name in SYSTEMS]
+            energy[i] = g.energy_pool
+            n_players[i] = len(g.players)
+            specs[i, :len(g.players)] = [SYSTEM_INDEX[p.specialization] for p in g.players]
+            active[i] = g.players.index(g.active_character)
+            deck_len[i] = len(g.challenge_deck)
+            deck[i, :len(g.challenge_deck)] = [card_id(c) for c in g.challenge_deck]
+            if g.current_challenge: challenge[i] = card_id(g.current_challenge)
+            rounds[i] = g.round_counter
+            game_over[i] = g.current_phase == GAME_OVER
+        targets = np.array([(t, nav) for _, t, nav in catalog], dtype=np.int8).reshape(-1, 2)
+        engine = cls(values, energy, specs, n_players, active, deck, deck_len, challenge, targets, rounds, game_over, rules)
+        engine.mission_progress[:] = [g.mission_progress for g in games]
+        engine.challenges_completed[:] = [g.challenges_completed_counter for g in games]
+        return engine
+
+    @classmethod
+    def from_seeds(cls, seeds: Sequence[int], selected_indices: Sequence[int],
+                   rules: Optional[Rules] = None) -> "BatchEngine":
+        """Starts one scalar game per seed and loads them, so setups match GameState exactly."""
+        games = []
+        for seed in seeds:
+            game_state = GameState(seed, rules=rules)
+            game_state.selected_character_indices = set(selected_indices)
+            game_state.start_game()
+            games.append(game_state)
+        return cls.from_games(games)
+
+    @classmethod
+    def random_start(cls, n: int, selected_indices: Sequence[int], rng: np.random.Generator,
+                     rules: Rules = DEFAULT_RULES) -> "BatchEngine":
+        """Builds N started missions directly in NumPy (same rules, but NumPy's RNG instead of per-game seeds)."""
+        crew = sorted(selected_indices)
+        cards = rules.card_pool(1, len(crew))
+        targets = np.array([(c.target_thrust, c.target_navigation) for c in cards], dtype=np.int8)
+        deck = rng.permuted(np.tile(np.arange(len(cards), dtype=np.int16), (n, 1)), axis=1)
+        values = np.tile(np.array(rules.start_values(), dtype=np.int8), (n, 1))
+        specs = np.full((n, 4), -1, dtype=np.int8)
+        specs[:, :len(crew)] = crew
+        engine = cls(values, np.zeros(n), specs, np.full(n, len(crew)), rng.integers(0, len(crew), n),
+                     deck, np.full(n, len(cards)), np.full(n, -1), targets, np.zeros(n), rules=rules)
+        engine._start_new_round(np.ones(n, dtype=bool))
+        return engine
+
+    def _live(self, mask: Optional[np.ndarray]) -> np.ndarray:
+        return ~self.game_over if mask is None else (~self.game_over & mask)
+
+    def _check_for_defeat(self, live: np.ndarray):
+        values = self.values
+        collapsed = (values[:, 0] <= 0) | (values[:, 1] <= 0) | (values[:, 2] <= 0) | (values[:, 3] <= 0)
+        self.game_over |= live & collapsed
+
+    def set_active(self, player_index, mask: Optional[np.ndarray] = None):
+        """Vectorized `game_state.active_character = players[player_index]`."""
+        live = self._live(mask)
+        self.active = np.where(live, np.asarray(player_index, dtype=np.int8), self.active).astype(np.int8)
+
+    def modify_system_value(self, system, amount, mask: Optional[np.ndarray] = None):
+        """Applies GameState.modify_system_value to every live game; system/amount may be arrays."""
+        live = self._live(mask)
+        system = np.broadcast_to(np.asarray(system, dtype=np.intp), (self.n,))
+        amount = np.broadcast_to(np.asarray(amount, dtype=np.int16), (self.n,))
+        current = self.values[self.rows, system].astype(np.int16)
+        specialist = (amount > 0) & (self.specs[self.rows, self.active] == system)
+        cost = self.rules.action_cost
+        boosted = np.minimum(self.rules.life_support_max, current + self.rules.specialist_bonus)
+        clamped = np.clip(current + amount, 0, self.system_max[system])
+        changed = ~specialist & (amount != 0) & (clamped != current)
+        apply = live & (self.energy >= cost) & (specialist | changed)
+        new_values = np.where(apply, np.where(specialist, boosted, clamped), current)
+        self.values[self.rows, system] = new_values
+        self.energy -= apply * cost
+        # Nur das geänderte System kann kollabieren; alle anderen waren vorher schon > 0
+        self.game_over |= live & (system < THRUST) & (new_values <= 0)
+
+    def end_round(self, mask: Optional[np.ndarray] = None):
+        """Vectorized GameState.finish_action_phase: resolve, rotate active character, next round."""
+        live = self._live(mask)
+        has_challenge = self.challenge >= 0
+        targets = self.card_targets[np.maximum(self.challenge, 0)]
+        success = live & has_challenge & (self.values[:, THRUST] >= targets[:, 0]) & (self.values[:, NAVIGATION] >= targets[:, 1])
+        self.mission_progress += success
+        self.challenges_completed += success
+        self.challenge = np.where(live, -1, self.challenge).astype(np.int16)
+        self.active = np.where(live, (self.active + 1) % self.n_players, self.active).astype(np.int8)
+        self._start_new_round(live)
+
+    def _start_new_round(self, live: np.ndarray):
+        self.round_counter += live
+        decayed = np.maximum(0, self.values[:, LIFE_SUPPORT] - self.rules.decay)
+        self.values[:, LIFE_SUPPORT] = np.where(live[:, None], decayed, self.values[:, LIFE_SUPPORT])
+        self._check_for_defeat(live)
+        survivors = live & ~self.game_over
+        self.energy = np.where(survivors, self.energy_by_crew[self.n_players], self.energy).astype(np.int16)
+        draw = survivors & (self.deck_pos < self.deck_len) & (self.challenge < 0)
+        next_card = self.deck[self.rows, np.minimum(self.deck_pos, self.deck.shape[1] - 1)]
+        self.challenge = np.where(draw, next_card, self.challenge).astype(np.int16)
+        self.deck_pos += draw
+
+    def game_tuple(self, i: int) -> Tuple:
+        """Comparable view of game i, matching scalar_game_tuple for a GameState."""
+        challenge = None if self.challenge[i] < 0 else tuple(int(v) for v in self.card_targets[self.challenge[i]])
+        return (tuple(int(v) for v in self.values[i]), int(self.energy[i]), int(self.round_counter[i]),
+                int(self.mission_progress[i]), int(self.challenges_completed[i]), int(self.active[i]),
+                challenge, int(self.deck_len[i] - self.deck_pos[i]), bool(self.game_over[i]))
+
+def scalar_game_tuple(game_state: GameState) -> Tuple:
+    challenge = game_state.current_challenge
+    return (tuple(getattr(game_state, name) for name in SYSTEMS), game_state.energy_pool, game_state.round_counter,
+            game_state.mission_progress, game_state.challenges_completed_counter,
+            game_state.players.index(game_state.active_character),
+            (challenge.target_thrust, challenge.target_navigation) if challenge else None,
+            len(game_state.challenge_deck), game_state.current_phase == GAME_OVER)
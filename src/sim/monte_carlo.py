@@ -0,0 +1,218 @@
+# ==============================================================================
+# src/sim/monte_carlo.py
+# Headless Monte-Carlo-Simulation: spielt komplette Missionen ohne pygame.
+# ==============================================================================
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+
+from src.game.game_state import GameState, AKTIONSPHASE, GAME_OVER
+from src.game.rules import Rules
+from src.game.tracing import Tracer
+from src.sim.trajectories import TrajectoryWriter
+
+LIFE_SUPPORT_SYSTEMS = ["oxygen", "water", "temperature", "airpressure"]
+ALL_SYSTEMS = LIFE_SUPPORT_SYSTEMS + ["thrust", "navigation"]
+
+Policy = Callable[[GameState, random.Random], None]
+
+# --- Strategien für die AKTIONSPHASE ---
+def idle_policy(game_state: GameState, rng: random.Random):
+    """Spends no energy at all; useful as a lower bound."""
+
+def random_policy(game_state: GameState, rng: random.Random):
+    """Spends the energy pool on random +1 clicks with random active characters."""
+    attempts = 4 * game_state.energy_pool
+    while game_state.energy_pool > 0 and attempts > 0 and game_state.current_phase != GAME_OVER:
+        attempts -= 1
+        game_state.active_character = rng.choice(game_state.players)
+        game_state.modify_system_value(rng.choice(ALL_SYSTEMS), 1)
+
+def greedy_policy(game_state: GameState, rng: random.Random):
+    """Keeps life support above the next decay, then chases the current challenge targets."""
+    specialists = {player.specialization: player for player in game_state.players}
+    rules = game_state.rules
+
+    def raise_system(system: str) -> bool:
+        if system in specialists:
+            game_state.active_character = specialists[system]
+        before = game_state.energy_pool
+        game_state.modify_system_value(system, 1)
+        return game_state.energy_pool < before
+
+    # 1. Systeme retten, die den nächsten Verfall nicht überleben würden
+    for system in LIFE_SUPPORT_SYSTEMS:
+        while getattr(game_state, system) <= rules.decay and game_state.energy_pool > 0:
+            if not raise_system(system): break
+
+    # 2. Schub und Navigation auf die Ziele der aktuellen Herausforderung bringen
+    challenge = game_state.current_challenge
+    if challenge:
+        for system, target in (("thrust", challenge.target_thrust), ("navigation", challenge.target_navigation)):
+            while getattr(game_state, system) < target and game_state.energy_pool > 0:
+                if not raise_system(system): break
+
+    # 3. Restenergie in das schwächste Lebenserhaltungssystem
+    while game_state.energy_pool > 0:
+        candidates = [s for s in LIFE_SUPPORT_SYSTEMS if getattr(game_state, s) < rules.life_support_max]
+        if not candidates: break
+        if not raise_system(min(candidates, key=lambda s: getattr(game_state, s))): break
+
+POLICIES: Dict[str, Policy] = {
+    "idle": idle_policy,
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
+
+class SimulationStats:
+    """Aggregated results of many simulated missions; batches can be merged."""
+    def __init__(self):
+        self.games = 0
+        self.truncated = 0
+        self.rounds_total = 0
+        self.rounds_min: Optional[int] = None
+        self.rounds_max = 0
+        self.challenges_completed_total = 0
+        self.rounds_survived = Counter()
+        self.mission_progress = Counter()
+        self.first_collapse = Counter()
+        self.cpu_seconds = 0.0
+
+    def add_game(self, game_state: GameState, truncated: bool):
+        rounds = game_state.round_counter
+        self.games += 1
+        self.truncated += truncated
+        self.rounds_total += rounds
+        self.rounds_min = rounds if self.rounds_min is None else min(self.rounds_min, rounds)
+        self.rounds_max = max(self.rounds_max, rounds)
+        self.challenges_completed_total += game_state.challenges_completed_counter
+        self.rounds_survived[rounds] += 1
+        self.mission_progress[game_state.mission_progress] += 1
+        if not truncated:
+            self.first_collapse[first_collapsed_system(game_state)] += 1
+
+    def merge(self, other: "SimulationStats"):
+        self.games += other.games
+        self.truncated += other.truncated
+        self.rounds_total += other.rounds_total
+        if other.rounds_min is not None:
+            self.rounds_min = other.rounds_min if self.rounds_min is None else min(self.rounds_min, other.rounds_min)
+        self.rounds_max = max(self.rounds_max, other.rounds_max)
+        self.challenges_completed_total += other.challenges_completed_total
+        self.rounds_survived.update(other.rounds_survived)
+        self.mission_progress.update(other.mission_progress)
+        self.first_collapse.update(other.first_collapse)
+        self.cpu_seconds += other.cpu_seconds
+
+    def summary(self) -> Dict:
+        games = max(1, self.games)
+        return {
+            "games": self.games,
+            "truncated": self.truncated,
+            "rounds_mean": self.rounds_total / games,
+            "rounds_min": self.rounds_min,
+            "rounds_max": self.rounds_max,
+            "rounds_survived": dict(sorted(self.rounds_survived.items())),
+            "challenges_completed_mean": self.challenges_completed_total / games,
+            "mission_progress": dict(sorted(self.mission_progress.items())),
+            "first_collapse": dict(self.first_collapse.most_common()),
+        }
+
+def first_collapsed_system(game_state: GameState) -> Optional[str]:
+    """Returns the life-support system that ended the mission (first in cockpit order on ties)."""
+    for system in LIFE_SUPPORT_SYSTEMS:
+        if getattr(game_state, system) <= 0:
+            return system
+    return None
+
+def play_game(selected_indices: Sequence[int], policy: Policy, rng: random.Random,
+              max_rounds: int = 50, rules: Optional[Rules] = None,
+              trajectory: Optional[TrajectoryWriter] = None, tracer: Optional[Tracer] = None) -> GameState:
+    """Plays one mission from start_game until GAME_OVER or max_rounds (missions can be endless).
+
+    The mission seed is drawn from `rng`, so a seeded rng reproduces the whole batch.
+    """
+    game_state = GameState(rng.getrandbits(64), rules=rules, tracer=tracer)
+    game_state.trajectory = trajectory
+    game_state.selected_character_indices = set(selected_indices)
+    game_state.start_game()
+    while game_state.current_phase == AKTIONSPHASE and game_state.round_counter < max_rounds:
+        policy(game_state, rng)
+        if game_state.current_phase == GAME_OVER: break
+        for player in game_state.players:
+            player.is_ready = True
+        game_state.finish_action_phase()
+    return game_state
+
+def run_batch(selected_indices: Sequence[int], policy_name: str, games: int, seed: int,
+              max_rounds: int = 50, rules: Optional[Rules] = None,
+              trajectory_dir: Optional[str] = None) -> SimulationStats:
+    """Runs a batch of missions in the current process with its own seeded RNG."""
+    rng = random.Random(seed)
+    policy = POLICIES[policy_name]
+    stats = SimulationStats()
+    trajectory = TrajectoryWriter(trajectory_dir, prefix=f"mc{seed}") if trajectory_dir else None
+    start = time.process_time()
+    for _ in range(games):
+        game_state = play_game(selected_indices, policy, rng, max_rounds, rules, trajectory)
+        stats.add_game(game_state, truncated=game_state.current_phase != GAME_OVER)
+    if trajectory: trajectory.close()
+    stats.cpu_seconds = time.process_time() - start
+    return stats
+
+def run_simulation(selected_indices: Sequence[int], policy_name: str = "greedy", games: int = 10000,
+                   workers: Optional[int] = None, seed: int = 0, batch_size: int = 1000,
+                   max_rounds: int = 50, trajectory_dir: Optional[str] = None) -> Dict:
+    """Spreads the missions over a process pool and returns aggregate stats plus throughput."""
+    if policy_name not in POLICIES:
+        raise ValueError(f"Unbekannte Strategie: {policy_name}")
+    workers = workers or os.cpu_count() or 1
+    batches: List[int] = [batch_size] * (games // batch_size)
+    if games % batch_size: batches.append(games % batch_size)
+
+    stats = SimulationStats()
+    start = time.perf_counter()
+    if workers == 1:
+        for i, count in enumerate(batches):
+            stats.merge(run_batch(selected_indices, policy_name, count, seed + i, max_rounds,
+                                  trajectory_dir=trajectory_dir))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_batch, selected_indices, policy_name, count, seed + i, max_rounds,
+                                   trajectory_dir=trajectory_dir)
+                       for i, count in enumerate(batches)]
+            for future in futures:
+                stats.merge(future.result())
+    elapsed = time.perf_counter() - start
+
+    result = stats.summary()
+    result["workers"] = workers
+    result["elapsed_seconds"] = elapsed
+    result["games_per_second"] = stats.games / elapsed if elapsed else 0.0
+    result["games_per_second_per_core"] = stats.games / stats.cpu_seconds if stats.cpu_seconds else 0.0
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Monte-Carlo-Simulation von Mission Enceladus")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--crew", default="0,1,2,3", help="Charakter-Indizes, z.B. 0,2")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--max-rounds", type=int, default=50)
+    parser.add_argument("--trajectories", default=None, help="Rundenverläufe in dieses Verzeichnis schreiben")
+    args = parser.parse_args()
+
+    crew = [int(i) for i in args.crew.split(",")]
+    result = run_simulation(crew, args.policy, args.games, args.workers, args.seed, args.batch_size, args.max_rounds,
+                            args.trajectories)
+    for key, value in result.items():
+        print(f"{key}: {value}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# ==============================================================================
+# src/sim/sweep.py
+# Balancing-Sweeps: viele Regelvarianten parallel simulieren, Ergebnisse in SQLite cachen.
+# Aufruf: python -m src.sim.sweep --grid decay=1,2,3 --grid drive_max=7,8 --games 200
+# ==============================================================================
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.game.rules import Rules, DEFAULT_RULES
+from src.sim.monte_carlo import POLICIES, run_batch
+
+# Erhöhen, wenn sich Spiellogik oder Strategien ändern: alte Cache-Einträge passen dann nicht mehr
+SWEEP_VERSION = 1
+DEFAULT_CACHE = os.path.join("sweeps", "cache.sqlite")
+
+Axes = Dict[str, Sequence]
+
+# --- Konfigurationsräume ---
+def _with_value(base: Rules, name: str, value) -> Rules:
+    if name == "energy_map":
+        value = {**base.energy_map, **{int(k): v for k, v in value.items()}}
+    return base.replace(**{name: value})
+
+def grid(axes: Axes, base: Rules = DEFAULT_RULES) -> Iterator[Rules]:
+    """Every combination of the axis values (cartesian product)."""
+    names = list(axes)
+    for values in itertools.product(*(axes[name] for name in names)):
+        rules = base
+        for name, value in zip(names, values):
+            rules = _with_value(rules, name, value)
+        yield rules
+
+def random_sample(axes: Axes, n: int, seed: int = 0, base: Rules = DEFAULT_RULES) -> List[Rules]:
+    """Up to `n` distinct configs with each axis value drawn uniformly."""
+    rng = random.Random(seed)
+    configs: Dict[str, Rules] = {}
+    for _ in range(n * 4):
+        if len(configs) >= n: break
+        rules = base
+        for name, values in axes.items():
+            rules = _with_value(rules, name, rng.choice(values))
+        configs.setdefault(rules.config_hash(), rules)
+    return list(configs.values())
+
+# --- Cache ---
+def point_key(rules: Rules, seed: int, settings: dict) -> str:
+    """Cache key of one sweep point: config hash, card contents, seed and the evaluation settings.
+
+    `config_hash` only names the card file; the content hash makes results of an edited file miss the cache.
+    """
+    payload = json.dumps([SWEEP_VERSION, rules.config_hash(), rules.cards_hash(), seed, settings], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class SweepCache:
+    """SQLite table of finished sweep points; every write is committed, so a killed sweep keeps its results."""
+    def __init__(self, path: str = DEFAULT_CACHE):
+        directory = os.path.dirname(path)
+        if directory: os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, config TEXT, "
+                                "seed INTEGER, settings TEXT, result TEXT, created REAL)")
+        self.connection.commit()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, dict]:
+        found: Dict[str, dict] = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = self.connection.execute(
+                f"SELECT key, result FROM results WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+            found.update((key, json.loads(result)) for key, result in rows)
+        return found
+
+    def put_many(self, rows: Iterable[Tuple[str, Rules, int, dict, dict]]):
+        now = time.time()
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+            [(key, json.dumps(rules.to_dict(), sort_keys=True), seed, json.dumps(settings, sort_keys=True),
+              json.dumps(result), now) for key, rules, seed, settings, result in rows])
+        self.connection.commit()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+# --- Auswertung ---
+def evaluate_point(rules_data: dict, seed: int, settings: dict) -> dict:
+    """Simulates one (config, seed) point; runs in a worker process."""
+    stats = run_batch(settings["crew"], settings["policy"], settings["games"], seed,
+                      settings["max_rounds"], Rules.from_dict(rules_data))
+    result = stats.summary()
+    result["cpu_seconds"] = stats.cpu_seconds
+    return result
+
+def _evaluate_chunk(points: List[Tuple[str, dict, int]], settings: dict) -> List[Tuple[str, dict]]:
+    # Durch dieselbe JSON-Form wie der Cache: frische und gecachte Ergebnisse haben so gleiche (String-)Schlüssel
+    return [(key, json.loads(json.dumps(evaluate_point(rules_data, seed, settings)))) for key, rules_data, seed in points]
+
+def run_sweep(configs: Iterable[Rules], seeds: Sequence[int] = (0,), crew: Sequence[int] = (0, 1, 2, 3),
+              policy: str = "greedy", games: int = 200, max_rounds: int = 50, cache_path: str = DEFAULT_CACHE,
+              workers: Optional[int] = None, chunk_size: int = 8,
+              progress: bool = True) -> List[Tuple[Rules, int, dict]]:
+    """Evaluates every (config, seed) point, computing only those missing from the cache.
+
+    Returns (rules, seed, result) in input order.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unbekannte Strategie: {policy}")
+    settings = {"crew": sorted(crew), "policy": policy, "games": games, "max_rounds": max_rounds}
+    points = [(point_key(rules, seed, settings), rules, seed) for rules in configs for seed in seeds]
+    cache = SweepCache(cache_path)
+    try:
+        results = cache.get_many([key for key, _, _ in points])
+        missing: Dict[str, Tuple[Rules, int]] = {}
+        for key, rules, seed in points:
+            if key not in results: missing.setdefault(key, (rules, seed))
+        if progress:
+            print(f"{len(points)} Punkte, {len(points) - len(missing)} aus dem Cache, {len(missing)} zu berechnen")
+
+        start = time.perf_counter()
+        todo = [(key, rules.to_dict(), seed) for key, (rules, seed) in missing.items()]
+        chunks = [todo[i:i + chunk_size] for i in range(0, len(todo), chunk_size)]
+        done = 0
+        if chunks:
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+                futures = [pool.submit(_evaluate_chunk, chunk, settings) for chunk in chunks]
+                for future in as_completed(futures):
+                    finished = future.result()
+                    cache.put_many((key, missing[key][0], missing[key][1], settings, result)
+                                   for key, result in finished)
+                    results.update(finished)
+                    done += len(finished)
+                    if progress and (done == len(todo) or done % max(chunk_size, len(todo) // 20 or 1) < chunk_size):
+                        elapsed = time.perf_counter() - start
+                        print(f"  {done}/{len(todo)} berechnet, {done / elapsed:.1f} Punkte/s")
+    finally:
+        cache.close()
+    return [(rules, seed, results[key]) for key, rules, seed in points]
+
+def parse_axis(text: str) -> Tuple[str, list]:
+    """"decay=1,2,3" or a JSON list such as 'energy_map=[{"4": 9}, {"4": 11}]'."""
+    name, _, values = text.partition("=")
+    if name not in DEFAULT_RULES.__slots__:
+        raise argparse.ArgumentTypeError(f"Unbekannte Regel: {name}")
+    if values.lstrip().startswith("["):
+        return name, json.loads(values)
+    return name, [json.loads(value) for value in values.split(",")]
+
+def main():
+    parser = argparse.ArgumentParser(description="Balancing-Sweep über Regelvarianten mit Ergebnis-Cache")
+    parser.add_argument("--grid", action="append", type=parse_axis, default=[], metavar="REGEL=W1,W2,...")
+    parser.add_argument("--sample", type=int, default=None, help="Stichprobe statt vollem Gitter")
+    parser.add_argument("--seeds", default="0")
+    parser.add_argument("--crew", default="0,1,2,3")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--max-rounds", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache", default=DEFAULT_CACHE)
+    parser.add_argument("--top", type=int, default=10, help="beste Konfigurationen nach Fortschritt anzeigen")
+    args = parser.parse_args()
+
+    axes = dict(args.grid)
+    configs = random_sample(axes, args.sample) if args.sample else list(grid(axes))
+    seeds = [int(seed) for seed in args.seeds.split(",")]
+    start = time.perf_counter()
+    results = run_sweep(configs, seeds, [int(i) for i in args.crew.split(",")], args.policy, args.games,
+                        args.max_rounds, args.cache, args.workers)
+    print(f"Sweep fertig in {time.perf_counter() - start:.1f} s")
+
+    by_config: Dict[str, List[dict]] = {}
+    for rules, _, result in results:
+        by_config.setdefault(repr(rules), []).append(result)
+    ranking = sorted(by_config.items(), key=lambda item: -sum(r["challenges_completed_mean"] for r in item[1]) / len(item[1]))
+    print(f"{'Fortschritt':>11} {'Runden':>7}  Regeln")
+    for name, rows in ranking[:args.top]:
+        progress = sum(r["challenges_completed_mean"] for r in rows) / len(rows)
+        rounds = sum(r["rounds_mean"] for r in rows) / len(rows)
+        print(f"{progress:>11.3f} {rounds:>7.2f}  {name}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# ==============================================================================
+# src/sim/trajectories.py
+# Spaltenbasierter Verlaufsspeicher: eine Zeile pro Runde, .npy-Chunks mit Index.
+# Aufruf: python -m src.sim.trajectories VERZEICHNIS --column oxygen --where round=5 crew=3
+# ==============================================================================
+import argparse
+import glob
+import json
+import os
+import shutil
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+SYSTEMS = ["oxygen", "water", "temperature", "airpressure", "thrust", "navigation"]
+
+# Ausgang einer Runde (Spalte "outcome")
+NO_CHALLENGE, SUCCESS, FAILURE, DEFEAT = 0, 1, 2, 3
+OUTCOME_NAMES = {NO_CHALLENGE: "keine Karte", SUCCESS: "Erfolg", FAILURE: "gescheitert", DEFEAT: "Niederlage"}
+
+# Spalten in Zeilenreihenfolge; "seed" identifiziert die Mission (passt zu Aktionslogs)
+COLUMNS: List[Tuple[str, type]] = (
+    [("seed", np.uint64), ("round", np.int32), ("crew", np.int8)]
+    + [(system, np.int8) for system in SYSTEMS]
+    + [(f"spent_{system}", np.int16) for system in SYSTEMS]
+    + [("energy_left", np.int16), ("target_thrust", np.int8), ("target_navigation", np.int8),
+       ("outcome", np.int8), ("progress", np.int16)]
+)
+COLUMN_TYPES = dict(COLUMNS)
+
+Condition = Union[int, Tuple[int, int]]  # Wert oder (min, max) einschließlich
+
+class TrajectoryWriter:
+    """Streams round rows into `directory` as immutable chunks of `chunk_rows` rows.
+
+    Attach it as `game_state.trajectory`; GameState calls `record_round` after every
+    resolution and `record_defeat` when a life-support system collapses. Chunks appear
+    atomically (written to a temporary directory, then renamed). Chunk names carry the
+    optional `prefix` label plus pid and start time, so concurrent writers and reruns
+    append to one store without colliding.
+    """
+    def __init__(self, directory: str, chunk_rows: int = 1 << 20, prefix: Optional[str] = None):
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        unique = f"{os.getpid()}-{time.time_ns()}"
+        self.prefix = f"{prefix}-{unique}" if prefix else unique
+        self.chunks_written = 0
+        self.rows_written = 0
+        self._seeds: List[int] = []
+        self._rows: List[tuple] = []
+        os.makedirs(directory, exist_ok=True)
+
+    def record_round(self, game_state, success: Optional[bool]):
+        self._append(game_state, NO_CHALLENGE if success is None else (SUCCESS if success else FAILURE))
+
+    def record_defeat(self, game_state):
+        self._append(game_state, DEFEAT)
+
+    def _append(self, gs, outcome: int):
+        challenge = gs.current_challenge
+        self._seeds.append(gs.seed)
+        self._rows.append((gs.round_counter, len(gs.players), gs.oxygen, gs.water, gs.temperature, gs.airpressure,
+                           gs.thrust, gs.navigation, *gs.energy_spent, gs.energy_pool,
+                           challenge.target_thrust if challenge else -1, challenge.target_navigation if challenge else -1,
+                           outcome, gs.mission_progress))
+        if len(self._rows) >= self.chunk_rows:
+            self.flush()
+
+    def append_columns(self, columns: Dict[str, np.ndarray]):
+        """Bulk append of whole columns (e.g. from a BatchEngine); all COLUMNS are required."""
+        self.flush()
+        n = len(columns["seed"])
+        for start in range(0, n, self.chunk_rows):
+            self._write_chunk({name: np.asarray(columns[name][start:start + self.chunk_rows], dtype=dtype)
+                               for name, dtype in COLUMNS})
+
+    def flush(self):
+        if not self._rows:
+            return
+        table = np.array(self._rows, dtype=np.int64)
+        chunk = {"seed": np.array(self._seeds, dtype=np.uint64)}
+        for i, (name, dtype) in enumerate(COLUMNS[1:]):
+            chunk[name] = table[:, i].astype(dtype)
+        self._rows.clear()
+        self._seeds.clear()
+        self._write_chunk(chunk)
+
+    def _write_chunk(self, chunk: Dict[str, np.ndarray]):
+        rows = len(chunk["seed"])
+        if not rows:
+            return
+        name = f"chunk-{self.prefix}-{self.chunks_written:06d}"
+        temporary = os.path.join(self.directory, "." + name)
+        final = os.path.join(self.directory, name)
+        if os.path.exists(final):
+            raise FileExistsError(f"Chunk {name} existiert bereits in {self.directory}")
+        os.makedirs(temporary)
+        try:
+            # Zonenkarten (min/max je Spalte) erlauben Abfragen, ganze Chunks zu überspringen
+            meta = {"rows": rows, "columns": {}}
+            for column, values in chunk.items():
+                np.save(os.path.join(temporary, column + ".npy"), values)
+                meta["columns"][column] = [int(values.min()), int(values.max())]
+            with open(os.path.join(temporary, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.rename(temporary, final)
+        except BaseException:
+            shutil.rmtree(temporary, ignore_errors=True)  # keine halben Chunks liegen lassen
+            raise
+        self.chunks_written += 1
+        self.rows_written += rows
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class TrajectoryStore:
+    """Read side: memory-maps chunk columns and answers filtered queries chunk by chunk."""
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.chunks: List[Tuple[str, dict]] = []
+        self.refresh()
+
+    def refresh(self):
+        """Re-reads the chunk index, picking up chunks appended since opening."""
+        self.chunks = []
+        for path in sorted(glob.glob(os.path.join(self.directory, "chunk-*"))):
+            with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+                self.chunks.append((path, json.load(f)))
+
+    def __len__(self) -> int:
+        return sum(meta["rows"] for _, meta in self.chunks)
+
+    def iter_chunks(self, columns: Sequence[str], **where: Condition) -> Iterator[Dict[str, np.ndarray]]:
+        """Yields the matching rows of each chunk; only the touched columns are paged in."""
+        for name in list(columns) + list(where):
+            if name not in COLUMN_TYPES:
+                raise ValueError(f"Unbekannte Spalte: {name}")
+        bounds = {name: (cond, cond) if isinstance(cond, int) else tuple(cond) for name, cond in where.items()}
+        for path, meta in self.chunks:
+            zones = meta["columns"]
+            if any(hi < zones[name][0] or lo > zones[name][1] for name, (lo, hi) in bounds.items()):
+                continue
+            mask = None
+            for name, (lo, hi) in bounds.items():
+                values = np.load(os.path.join(path, name + ".npy"), mmap_mode="r")
+                part = (values >= lo) & (values <= hi) if lo != hi else values == lo
+                mask = part if mask is None else mask & part
+            result = {}
+            for name in columns:
+                values = np.load(os.path.join(path, name + ".npy"), mmap_mode="r")
+                result[name] = np.asarray(values) if mask is None else values[mask]
+            yield result
+
+    def query(self, columns: Sequence[str], **where: Condition) -> Dict[str, np.ndarray]:
+        """All matching rows in memory at once; prefer `iter_chunks`/`histogram` for large results."""
+        parts = list(self.iter_chunks(columns, **where))
+        return {name: np.concatenate([part[name] for part in parts]) if parts else np.empty(0, COLUMN_TYPES[name])
+                for name in columns}
+
+    def count(self, **where: Condition) -> int:
+        return sum(len(part["round"]) for part in self.iter_chunks(["round"], **where))
+
+    def histogram(self, column: str, **where: Condition) -> Dict[int, int]:
+        """Value distribution of `column` among the matching rows, in constant memory."""
+        counts: Dict[int, int] = {}
+        for part in self.iter_chunks([column], **where):
+            values, frequencies = np.unique(part[column], return_counts=True)
+            for value, frequency in zip(values.tolist(), frequencies.tolist()):
+                counts[value] = counts.get(value, 0) + frequency
+        return dict(sorted(counts.items()))
+
+    def clear(self):
+        for path, _ in self.chunks:
+            shutil.rmtree(path)
+        self.chunks = []
+
+def parse_condition(text: str) -> Tuple[str, Condition]:
+    """"round=5" or "round=3..7"."""
+    name, _, value = text.partition("=")
+    if ".." in value:
+        lo, hi = value.split("..")
+        return name, (int(lo), int(hi))
+    return name, int(value)
+
+def main():
+    parser = argparse.ArgumentParser(description="Verteilung einer Spalte im Verlaufsspeicher abfragen")
+    parser.add_argument("directory")
+    parser.add_argument("--column", default="oxygen")
+    parser.add_argument("--where", nargs="*", type=parse_condition, default=[], metavar="SPALTE=WERT|MIN..MAX")
+    args = parser.parse_args()
+
+    store = TrajectoryStore(args.directory)
+    start = time.perf_counter()
+    histogram = store.histogram(args.column, **dict(args.where))
+    elapsed = time.perf_counter() - start
+    total = sum(histogram.values())
+    print(f"{len(store)} Zeilen in {len(store.chunks)} Chunks, {total} Treffer in {elapsed:.2f} s")
+    for value, count in histogram.items():
+        print(f"{args.column}={value:>3}: {count:>12} ({count / max(1, total):6.1%})")
+
+if __name__ == "__main__":
+    main()
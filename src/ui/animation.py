@@ -1,64 +1,90 @@
 # ==============================================================================
 # src/ui/animation.py
-# REFACTORING: 'crisis' wurde zu 'challenge' umbenannt.
+# Auflösungs-Animation: Timeline mit vorgerenderten Zählern, Ergebnisbanner und Gauge-/Crew-Effekten.
 # ==============================================================================
 import pygame
+from typing import Dict, Optional, Sequence, Tuple
+from src.ui.layout import Layout
+from src.ui.text_cache import get_font, render_text
+from src.ui.tween import Clip, Timeline, Track, constant, ease_out_cubic
 
-# Animation States
-IDLE, ANIM_DUTY_HIGHLIGHT, ANIM_DUTY_COUNT, ANIM_DUTY_RESULT, ANIM_CHALLENGE_HIGHLIGHT, ANIM_CHALLENGE_COUNT, ANIM_CHALLENGE_RESULT, FINISHED = range(8)
+# Zeitplan in Sekunden
+FADE = 0.25
+COUNT_START, COUNT_STAGGER = 0.25, 0.2
+BANNER_START = 1.0
+DECAY_START, DECAY_TIME, DECAY_RISE = 1.6, 1.0, 30
+CREW_START, CREW_STAGGER, CREW_TIME = 1.8, 0.08, 0.4
+HOLD_END = 2.4
+END = 2.8
 
-class ResolutionAnimation:
-    """Manages the visual feedback sequence during the resolution phase."""
-    def __init__(self, duty_success, challenge_success, duty_provided, challenge_provided, duty_req, challenge_req):
-        self.state = ANIM_DUTY_HIGHLIGHT
-        self.timer = 0
-        self.font = pygame.font.SysFont("Arial", 48, bold=True)
-        self.small_font = pygame.font.SysFont("Arial", 24)
-        self.duty_success, self.challenge_success = duty_success, challenge_success
-        self.duty_provided, self.challenge_provided = duty_provided, challenge_provided
-        self.duty_req, self.challenge_req = duty_req, challenge_req
-    
-    def update(self, dt):
-        self.timer += dt
-        transitions = {
-            ANIM_DUTY_HIGHLIGHT: (0.5, ANIM_DUTY_COUNT),
-            ANIM_DUTY_COUNT: (1.5, ANIM_DUTY_RESULT),
-            ANIM_DUTY_RESULT: (1.5, ANIM_CHALLENGE_HIGHLIGHT),
-            ANIM_CHALLENGE_HIGHLIGHT: (0.5, ANIM_CHALLENGE_COUNT),
-            ANIM_CHALLENGE_COUNT: (1.5, ANIM_CHALLENGE_RESULT),
-            ANIM_CHALLENGE_RESULT: (1.5, FINISHED),
-        }
-        if self.state in transitions and self.timer > transitions[self.state][0]:
-            self.timer = 0
-            self.state = transitions[self.state][1]
-            
-    def draw(self, surface):
-        if self.state in [ANIM_DUTY_HIGHLIGHT, ANIM_DUTY_COUNT, ANIM_DUTY_RESULT]:
-            self._draw_overlay_for_task(surface, "duty", self.duty_req, self.duty_provided, self.duty_success)
-        if self.state in [ANIM_CHALLENGE_HIGHLIGHT, ANIM_CHALLENGE_COUNT, ANIM_CHALLENGE_RESULT] and self.challenge_req:
-            self._draw_overlay_for_task(surface, "challenge", self.challenge_req, self.challenge_provided, self.challenge_success)
+COLOR_OK, COLOR_FAIL, COLOR_NEUTRAL = (0, 200, 0), (200, 0, 0), (100, 100, 120)
 
-    def _draw_overlay_for_task(self, surface, task_name, requirements, provided, success):
-        rect = pygame.Rect(680, 150, 550, 200) if task_name == "duty" else pygame.Rect(50, 150, 550, 200)
-        
-        if self.state in [ANIM_DUTY_HIGHLIGHT, ANIM_CHALLENGE_HIGHLIGHT]:
-            pygame.draw.rect(surface, (255, 255, 0, 100), rect)
-        elif self.state in [ANIM_DUTY_COUNT, ANIM_CHALLENGE_COUNT]:
-            y_offset = 0
-            for symbol, required in requirements.items():
-                provided_val = provided.get(symbol, 0)
-                text = f"{symbol}: {provided_val} / {required}"
-                color = (0, 200, 0) if provided_val >= required else (200, 0, 0)
-                text_surf = self.small_font.render(text, True, color)
-                surface.blit(text_surf, (rect.centerx - text_surf.get_width() // 2, rect.centery - 20 + y_offset))
-                y_offset += 30
-        elif self.state in [ANIM_DUTY_RESULT, ANIM_CHALLENGE_RESULT]:
-            result_text, result_color = ("ERFOLG", (0, 255, 0)) if success else ("FEHLSCHLAG", (255, 0, 0))
-            text_surf = self.font.render(result_text, True, result_color)
-            overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            surface.blit(overlay, rect.topleft)
-            surface.blit(text_surf, (rect.centerx - text_surf.get_width() // 2, rect.centery - text_surf.get_height() // 2))
+def _fade(start: float, end: float, peak: float = 255) -> Track:
+    """0 -> peak over FADE from `start`, held, back to 0 over FADE before `end`."""
+    return Track([(start, 0), (start + FADE, peak), (end - FADE, peak), (end, 0)])
 
-    @property
-    def is_finished(self): return self.state == FINISHED
\ No newline at end of file
+def _own(surface: pygame.Surface) -> pygame.Surface:
+    # Texte kommen aus dem geteilten Cache; Clips ändern das Alpha, also eigene Kopie im Bildschirmformat
+    return surface.convert_alpha() if pygame.display.get_surface() else surface.copy()
+
+def _panel(size: Tuple[int, int], color) -> pygame.Surface:
+    """Uniform panel without per-pixel alpha: blitting with surface alpha is the cheap path."""
+    panel = pygame.Surface(size)
+    panel.fill(color)
+    return panel.convert() if pygame.display.get_surface() else panel
+
+class ResolutionAnimation(Timeline):
+    """Visual feedback while the challenge resolves.
+
+    Everything is rendered once here: a dimmed panel over `rect`, one count label per
+    requirement ("Schub: 4 / 6"), the result banner, a decay marker per gauge rect in
+    `decay_marks` and a flash per crew card; `next_active` gets a highlight frame.
+    `success` None means there was no challenge card this round. Font sizes and offsets
+    go through `layout.px` (the 1280x720 design when no layout is given).
+    """
+    def __init__(self, success: Optional[bool], provided: Dict[str, int], required: Dict[str, int], rect: pygame.Rect,
+                 decay_marks: Sequence[Tuple[pygame.Rect, str]] = (), crew_rects: Sequence[pygame.Rect] = (),
+                 next_active: Optional[int] = None, layout: Optional[Layout] = None):
+        super().__init__()
+        self.success = success
+        self.rect = pygame.Rect(rect)
+        px = (layout or Layout()).px
+        font = get_font("Arial", px(48), bold=True)
+        small_font = get_font("Arial", px(24))
+
+        self.add(Clip(_panel(self.rect.size, (0, 0, 0)), constant(self.rect.topleft, 0, END), _fade(0, HOLD_END + FADE, 180)))
+
+        for i, (symbol, target) in enumerate(required.items()):
+            value = provided.get(symbol, 0)
+            label = _own(render_text(small_font, f"{symbol}: {value} / {target}", COLOR_OK if value >= target else COLOR_FAIL))
+            x = self.rect.centerx - label.get_width() // 2
+            y = self.rect.y + px(20) + i * px(30)
+            start = COUNT_START + i * COUNT_STAGGER
+            self.add(Clip(label, Track([(start, (x - px(40), y)), (start + FADE, (x, y))], ease_out_cubic),
+                          _fade(start, HOLD_END + FADE)))
+
+        if success is None:
+            text, color = "KEINE HERAUSFORDERUNG", COLOR_NEUTRAL
+        else:
+            text, color = ("ERFOLG", (0, 255, 0)) if success else ("FEHLSCHLAG", (255, 0, 0))
+        banner = _own(render_text(font, text, color))
+        x = self.rect.centerx - banner.get_width() // 2
+        y = self.rect.bottom - banner.get_height() - px(20)
+        self.add(Clip(banner, Track([(BANNER_START, (x, y - px(30))), (BANNER_START + 0.3, (x, y))], ease_out_cubic),
+                      _fade(BANNER_START, HOLD_END + FADE)))
+
+        for gauge_rect, text in decay_marks:
+            mark = _own(render_text(small_font, text, COLOR_FAIL))
+            x, y = gauge_rect.centerx - mark.get_width() // 2, gauge_rect.y
+            self.add(Clip(mark, Track([(DECAY_START, (x, y)), (DECAY_START + DECAY_TIME, (x, y - px(DECAY_RISE)))], ease_out_cubic),
+                          Track([(DECAY_START, 0), (DECAY_START + 0.15, 255), (DECAY_START + DECAY_TIME, 0)])))
+
+        for i, crew_rect in enumerate(crew_rects):
+            start = CREW_START + i * CREW_STAGGER
+            self.add(Clip(_panel(crew_rect.size, (255, 255, 255)), constant(crew_rect.topleft, start, start + CREW_TIME),
+                          Track([(start, 120), (start + CREW_TIME, 0)])))
+        if next_active is not None and next_active < len(crew_rects):
+            crew_rect = crew_rects[next_active]
+            frame = pygame.Surface(crew_rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(frame, (255, 255, 0), frame.get_rect(), px(4), border_radius=px(5))
+            self.add(Clip(frame, constant(crew_rect.topleft, HOLD_END - FADE, END), Track([(HOLD_END - FADE, 0), (END, 255)])))
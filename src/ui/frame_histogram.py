@@ -0,0 +1,76 @@
+# ==============================================================================
+# src/ui/frame_histogram.py
+# Rollierendes Frame-Zeit-Histogramm als Overlay (Umschalten mit F3).
+# ==============================================================================
+import bisect
+import time
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+
+import pygame
+from src.ui.layout import Layout
+from src.ui.text_cache import get_font, render_text
+
+# Obergrenzen der Klassen in ms; die letzte Klasse sammelt alles darüber
+BUCKET_EDGES_MS = (1, 2, 4, 8, 16, 33, 50)
+TITLE_INTERVAL = 0.5  # s; Perzentile im Titel höchstens so oft neu, sonst verdrängt jeder Frame Texte aus dem TextCache
+
+class FrameHistogram:
+    """Frame times of the last `window` frames, bucketed incrementally (O(1) per frame)."""
+    def __init__(self, window: int = 600, edges_ms: Sequence[float] = BUCKET_EDGES_MS, layout: Optional[Layout] = None):
+        self.edges = [edge / 1000 for edge in edges_ms]
+        self.labels = [f"<{edge:g}" for edge in edges_ms] + [f"{edges_ms[-1]:g}+"]
+        self.window: deque = deque(maxlen=window)
+        self.counts: List[int] = [0] * (len(self.edges) + 1)
+        self._title: Tuple[str, float] = ("", 0.0)  # Text, Zeitpunkt
+        self.set_layout(layout or Layout())
+
+    def set_layout(self, layout: Layout):
+        """Sizes font and offsets for a new window layout; the collected frame times are kept."""
+        self.px = layout.px
+        self.font = get_font("Arial", self.px(14))
+
+    def add(self, seconds: float):
+        if len(self.window) == self.window.maxlen:
+            self.counts[self._bucket(self.window[0])] -= 1
+        self.window.append(seconds)
+        self.counts[self._bucket(seconds)] += 1
+
+    def _bucket(self, seconds: float) -> int:
+        return bisect.bisect_right(self.edges, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        if not self.window: return 0.0
+        ordered = sorted(self.window)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def title(self) -> str:
+        """Percentile line; recomputed at most every TITLE_INTERVAL."""
+        text, updated = self._title
+        now = time.perf_counter()
+        if text and now - updated < TITLE_INTERVAL:
+            return text
+        p50, p99 = self.percentile(0.5) * 1000, self.percentile(0.99) * 1000
+        text = f"Frame p50 {p50:.1f} / p99 {p99:.1f} ms ({len(self.window)})"
+        self._title = (text, now)
+        return text
+
+    def draw(self, surface: pygame.Surface, rect: pygame.Rect):
+        """Opaque panel, so drawing it again fully replaces the previous frame's overlay."""
+        pygame.draw.rect(surface, (0, 0, 0), rect)
+        pygame.draw.rect(surface, (100, 100, 120), rect, self.px(1))
+        px, margin = self.px, self.px(6)
+        title = render_text(self.font, self.title(), (220, 220, 220))
+        surface.blit(title, (rect.x + margin, rect.y + px(4)))
+
+        top, bottom = rect.y + px(24), rect.bottom - px(18)
+        width = (rect.width - 2 * margin) // len(self.counts)
+        peak = max(self.counts) or 1
+        for i, (count, label) in enumerate(zip(self.counts, self.labels)):
+            x = rect.x + margin + i * width
+            height = (bottom - top) * count // peak
+            lower = self.edges[i - 1] if i else 0.0
+            color = (0, 200, 0) if lower < 0.016 else (255, 255, 0) if lower < 0.033 else (200, 0, 0)  # ab 16 ms: 60 FPS verfehlt
+            pygame.draw.rect(surface, color, (x + px(2), bottom - height, width - px(4), height))
+            text = render_text(self.font, label, (100, 100, 120))
+            surface.blit(text, (x + (width - text.get_width()) // 2, bottom + px(2)))
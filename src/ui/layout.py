@@ -0,0 +1,143 @@
+# ==============================================================================
+# src/ui/layout.py
+# Layout-Engine: alle Rechtecke, Schriften und Klickziele einmal pro Fenstergröße berechnen.
+# ==============================================================================
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import pygame
+from src.ui.text_cache import get_font
+
+# Entwurfsauflösung: alle Maße unten sind in diesem Raster angegeben und werden skaliert
+BASE_WIDTH, BASE_HEIGHT = 1280, 720
+PANEL_WIDTH = int(BASE_WIDTH * 0.15)
+CENTER_WIDTH = BASE_WIDTH - 2 * PANEL_WIDTH
+CHAR_COUNT = 4
+MAX_CREW = 4
+
+LIFE_SUPPORT = {"oxygen": "Sauerstoff", "water": "Wasser", "temperature": "Temperatur", "airpressure": "Luftdruck"}
+DRIVE = {"thrust": "Schub", "navigation": "Navigation"}
+
+class Gauge:
+    """Geometry of one system gauge in the cockpit, in window pixels."""
+    def __init__(self, layout: "Layout", sys_key: str, sys_name: str, x_pos: float, label_y: int, segments: int,
+                 segment_step: int, color, button_heights: Tuple[int, int]):
+        self.sys_key, self.sys_name = sys_key, sys_name
+        self.segments, self.color = segments, color
+        self.label_pos = layout.point(x_pos, label_y)
+        top = label_y + 50
+        self.segment_rects = [layout.rect(x_pos, top + j * segment_step, 150, 20) for j in range(segments)]
+        self.rect = self.segment_rects[0].unionall(self.segment_rects)
+        plus_height, minus_height = button_heights
+        self.plus_rect = layout.rect(x_pos + 160, top, 40, plus_height)
+        self.minus_rect = layout.rect(x_pos + 160, top + plus_height + 10, 40, minus_height)
+
+class ControlMap:
+    """Maps a click position to the control under it through a uniform grid of `cell` pixels.
+
+    Each lookup only tests the few rects registered in one cell instead of scanning every
+    control. On overlap the control added last (drawn on top) wins.
+    """
+    def __init__(self, cell: int = 64):
+        self.cell = max(1, cell)
+        self.cells: Dict[Tuple[int, int], List[Tuple[pygame.Rect, Hashable]]] = {}
+        self.controls: List[Tuple[pygame.Rect, Hashable]] = []
+
+    def add(self, rect: pygame.Rect, action: Hashable):
+        entry = (pygame.Rect(rect), action)
+        self.controls.append(entry)
+        cell = self.cell
+        for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+            for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                self.cells.setdefault((cx, cy), []).append(entry)
+
+    def lookup(self, pos: Tuple[int, int]) -> Optional[Hashable]:
+        bucket = self.cells.get((pos[0] // self.cell, pos[1] // self.cell))
+        if bucket:
+            for rect, action in reversed(bucket):
+                if rect.collidepoint(pos):
+                    return action
+        return None
+
+    def rects(self, kind: str) -> List[pygame.Rect]:
+        """Rects of all controls whose action tuple starts with `kind`, in insertion order."""
+        return [rect for rect, action in self.controls if action[0] == kind]
+
+class Layout:
+    """All screen geometry for one window size; build a new one on every resize.
+
+    The 1280x720 design is scaled uniformly into the largest 16:9 viewport that fits the
+    window and centred in it. Fonts, line widths and offsets scale along, so everything is
+    drawn at native resolution instead of scaling a finished frame.
+    """
+    def __init__(self, width: int = BASE_WIDTH, height: int = BASE_HEIGHT):
+        self.size = (width, height)
+        self.scale = min(width / BASE_WIDTH, height / BASE_HEIGHT)
+        self.offset = ((width - BASE_WIDTH * self.scale) / 2, (height - BASE_HEIGHT * self.scale) / 2)
+        self.viewport = self.rect(0, 0, BASE_WIDTH, BASE_HEIGHT)
+
+        self.font = get_font("Arial", self.px(24), bold=True)
+        self.big_font = get_font("Arial", self.px(36), bold=True)
+        self.small_font = get_font("Arial", self.px(18))
+
+        # Setup-Bildschirm
+        self.title_pos = self.point(BASE_WIDTH / 2, 100)
+        self.char_rects = [self.rect(200 + i * 220, 250, 200, 250) for i in range(CHAR_COUNT)]
+        self.start_button = self.rect(BASE_WIDTH / 2 - 150, 600, 300, 70)
+
+        # Spielende
+        self.game_over_lines = [self.point(BASE_WIDTH / 2, y) for y in (150, 250, 300, 350)]
+        self.new_mission_button = self.rect(BASE_WIDTH / 2 - 350, 500, 300, 70)
+        self.exit_button = self.rect(BASE_WIDTH / 2 + 50, 500, 300, 70)
+        self._dim_overlay: Optional[pygame.Surface] = None
+
+        # Zone 1: Reisekarte
+        self.travel_map = self.rect(0, 0, PANEL_WIDTH, BASE_HEIGHT)
+        self.travel_start_y, self.travel_end_y = self.point(0, BASE_HEIGHT - 50)[1], self.point(0, 50)[1]
+
+        # Zone 2: Cockpit
+        self.cockpit = self.rect(PANEL_WIDTH, 0, CENTER_WIDTH, BASE_HEIGHT)
+        self.gauges: List[Gauge] = []
+        for i, (sys_key, sys_name) in enumerate(LIFE_SUPPORT.items()):
+            self.gauges.append(Gauge(self, sys_key, sys_name, PANEL_WIDTH + 30 + i * (CENTER_WIDTH / 4), 50, 6, 30,
+                                     (0, 200, 0), (95, 75)))
+        for i, (sys_key, sys_name) in enumerate(DRIVE.items()):
+            self.gauges.append(Gauge(self, sys_key, sys_name, PANEL_WIDTH + 100 + i * 450, 350, 8, 25, (255, 255, 0), (95, 95)))
+        self.energy = self.rect(BASE_WIDTH / 2 - 180, 625, 360, 50)
+        self.challenge = self.rect(PANEL_WIDTH, 480, CENTER_WIDTH, 80)
+        self.challenge_lines = (self.point(BASE_WIDTH / 2, 500), self.point(BASE_WIDTH / 2, 540))
+        self.advisor_status = self.rect(PANEL_WIDTH, 685, CENTER_WIDTH, 30)
+        self.resolution = self.rect(BASE_WIDTH / 2 - 275, 260, 550, 200)
+
+        # Zone 3: Crew
+        self.crew_panel = self.rect(PANEL_WIDTH + CENTER_WIDTH, 0, PANEL_WIDTH, BASE_HEIGHT)
+        crew_x = PANEL_WIDTH + CENTER_WIDTH
+        self.crew_cards = [(self.rect(crew_x + 20, 50 + i * 150, PANEL_WIDTH - 40, 80),
+                            self.rect(crew_x + 20, 140 + i * 150, PANEL_WIDTH - 40, 40)) for i in range(MAX_CREW)]
+        self.crew_strips = [self.rect(crew_x, 50 + i * 150, PANEL_WIDTH, 140) for i in range(MAX_CREW)]
+
+        # Diagnose-Overlay
+        self.histogram = self.rect(0, BASE_HEIGHT - 100, 300, 100)
+
+    # --- Umrechnung aus dem Entwurfsraster ---
+    def px(self, length: float) -> int:
+        """A length (line width, font size, offset) in window pixels, at least 1."""
+        return max(1, round(length * self.scale))
+
+    def point(self, x: float, y: float) -> Tuple[int, int]:
+        return round(self.offset[0] + x * self.scale), round(self.offset[1] + y * self.scale)
+
+    def rect(self, x: float, y: float, width: float, height: float) -> pygame.Rect:
+        # Kanten getrennt runden, damit aneinanderstoßende Rechtecke lückenlos bleiben
+        left, top = self.point(x, y)
+        right, bottom = self.point(x + width, y + height)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def control_map(self) -> ControlMap:
+        return ControlMap(self.px(64))
+
+    def dim_overlay(self) -> pygame.Surface:
+        """Window-sized translucent black used behind the game-over screen, created once per layout."""
+        if self._dim_overlay is None:
+            self._dim_overlay = pygame.Surface(self.size, pygame.SRCALPHA)
+            self._dim_overlay.fill((0, 0, 0, 200))
+        return self._dim_overlay
@@ -0,0 +1,114 @@
+# ==============================================================================
+# src/ui/retained.py
+# Retained-Mode-Rendering: statische Elemente einmal backen, nur Änderungen neu zeichnen.
+# ==============================================================================
+import pygame
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+_UNSET = object()
+
+class Widget:
+    """A screen region that is redrawn only when the key derived from the game state changes.
+
+    `draw_fn` must stay inside `rect`; drawing is clipped to it.
+    """
+    def __init__(self, rect: pygame.Rect, key_fn: Callable[[Any], Hashable], draw_fn: Callable[[pygame.Surface, Any], None]):
+        self.rect = pygame.Rect(rect)
+        self.key_fn = key_fn
+        self.draw_fn = draw_fn
+        self.key = _UNSET
+
+    def draw(self, surface: pygame.Surface, state, area: Optional[pygame.Rect] = None):
+        """Draws the widget, restricted to `area` when given (partial repaints)."""
+        clip = surface.get_clip()
+        surface.set_clip(self.rect.clip(area) if area else self.rect)
+        self.draw_fn(surface, state)
+        surface.set_clip(clip)
+
+class RetainedLayer:
+    """One screen: a background baked once per `invalidate`, plus widgets in z-order.
+
+    `bake_fn(surface, state)` draws all static chrome and returns the screen's
+    click targets; `widgets_fn(state)` creates the widgets for that bake.
+    """
+    def __init__(self, bake_fn: Callable[[pygame.Surface, Any], Any], widgets_fn: Callable[[Any], Sequence[Widget]]):
+        self.bake_fn = bake_fn
+        self.widgets_fn = widgets_fn
+        self.background: Optional[pygame.Surface] = None
+        self.widgets: List[Widget] = []
+        self.controls: Any = {}
+
+    def invalidate(self):
+        self.background = None
+
+    def render(self, surface: pygame.Surface, state) -> List[pygame.Rect]:
+        """Brings `surface` up to date and returns the rects that changed."""
+        if self.background is None:
+            self.background = pygame.Surface(surface.get_size())
+            self.controls = self.bake_fn(self.background, state) or {}
+            self.widgets = list(self.widgets_fn(state))
+            surface.blit(self.background, (0, 0))
+            for widget in self.widgets:
+                widget.key = widget.key_fn(state)
+                widget.draw(surface, state)
+            return [surface.get_rect()]
+
+        changed = []
+        for widget in self.widgets:
+            key = widget.key_fn(state)
+            if key != widget.key:
+                widget.key = key
+                changed.append(widget)
+        if not changed:
+            return []
+
+        # Überlappende Widgets mitzeichnen, sonst löscht der Hintergrund sie teilweise
+        dirty = set(changed)
+        grown = True
+        while grown:
+            grown = False
+            for widget in self.widgets:
+                if widget not in dirty and any(widget.rect.colliderect(d.rect) for d in dirty):
+                    dirty.add(widget)
+                    grown = True
+
+        redraw = [widget for widget in self.widgets if widget in dirty]
+        for widget in redraw:
+            surface.blit(self.background, widget.rect, widget.rect)
+        for widget in redraw:
+            widget.draw(surface, state)
+        return [widget.rect for widget in redraw]
+
+    def repaint(self, surface: pygame.Surface, state, rects: Sequence[pygame.Rect]) -> List[pygame.Rect]:
+        """Restores `rects` from the background and the widgets under them, e.g. after an overlay."""
+        if self.background is None:
+            return []
+        for rect in rects:
+            surface.blit(self.background, rect, rect)
+            for widget in self.widgets:
+                if widget.rect.colliderect(rect):
+                    widget.draw(surface, state, rect)
+        return list(rects)
+
+class RetainedRenderer:
+    """Switches between named layers; switching repaints the whole screen."""
+    def __init__(self, layers: Dict[str, RetainedLayer]):
+        self.layers = layers
+        self.current: Optional[str] = None
+
+    @property
+    def controls(self) -> Any:
+        return self.layers[self.current].controls if self.current else {}
+
+    def invalidate(self):
+        for layer in self.layers.values():
+            layer.invalidate()
+
+    def repaint(self, surface: pygame.Surface, state, rects: Sequence[pygame.Rect]) -> List[pygame.Rect]:
+        return self.layers[self.current].repaint(surface, state, rects) if self.current else []
+
+    def render(self, surface: pygame.Surface, name: str, state) -> List[pygame.Rect]:
+        if name != self.current:
+            self.current = name
+            self.layers[name].invalidate()
+        return self.layers[name].render(surface, state)
@@ -0,0 +1,128 @@
+# ==============================================================================
+# src/ui/scheduler.py
+# Ereignisgesteuerter Frame-Scheduler: blockiert im Leerlauf, feste Schrittweite nur bei Animationen.
+# ==============================================================================
+import threading
+import time
+import pygame
+from typing import List, Optional
+
+# Synthetisches Eingabe-Event für Latenzmessungen (trägt den Sendezeitpunkt)
+PROBE_EVENT = pygame.USEREVENT + 1
+
+class SchedulerStats:
+    """CPU usage and input-to-present latency per scheduler mode over a reporting window."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.window_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.frames = 0
+        self.latencies: List[float] = []
+
+    def cpu_percent(self) -> float:
+        wall = time.perf_counter() - self.window_start
+        return 100.0 * (time.process_time() - self.cpu_start) / wall if wall > 0 else 0.0
+
+    def summary(self, mode: str) -> str:
+        latencies = sorted(self.latencies)
+        if latencies:
+            p50 = latencies[len(latencies) // 2] * 1000
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+            latency = f"Latenz p50 {p50:.1f} ms / p99 {p99:.1f} ms ({len(latencies)} Proben)"
+        else:
+            latency = "keine Latenzproben"
+        return f"[Scheduler] Modus {mode}: CPU {self.cpu_percent():.1f} %, {self.frames} Frames, {latency}"
+
+class FrameScheduler:
+    """Blocks on `pygame.event.wait` while nothing time-based runs and switches to a
+    fixed-timestep loop while animations are registered.
+
+    Animations need `update(dt)` and an `is_finished` property. The frame after an
+    animation finishes never blocks, so its owner can react right away. With `always_animate`
+    the scheduler behaves like the old `clock.tick(fps)` loop, for comparisons.
+    """
+    def __init__(self, fps: int = 60, idle_timeout_ms: int = 1000, always_animate: bool = False,
+                 report_interval: Optional[float] = None):
+        self.fps = fps
+        self.timestep = 1.0 / fps
+        self.idle_timeout_ms = idle_timeout_ms
+        self.always_animate = always_animate
+        self.report_interval = report_interval
+        self.animations: List = []
+        self.clock = pygame.time.Clock()
+        self.stats = SchedulerStats()
+        self._accumulator = 0.0
+        self._last_tick = time.perf_counter()
+        self._frame_requested = False
+        self._pending_probes: List[float] = []
+        self._probe_thread: Optional[threading.Thread] = None
+        self._probe_stop = threading.Event()
+
+    @property
+    def animating(self) -> bool:
+        return self.always_animate or bool(self.animations)
+
+    @property
+    def mode(self) -> str:
+        return "animiert" if self.animating else "Leerlauf"
+
+    def add_animation(self, animation):
+        if not self.animations:
+            self._last_tick = time.perf_counter()
+            self._accumulator = 0.0
+        self.animations.append(animation)
+
+    def wait_events(self) -> List[pygame.event.Event]:
+        """Returns the input for this frame; blocks while idle."""
+        if self.animating or self._frame_requested:
+            self._frame_requested = False
+            events = pygame.event.get()
+        else:
+            first = pygame.event.wait(self.idle_timeout_ms)
+            events = [] if first.type == pygame.NOEVENT else [first] + pygame.event.get()
+        result = []
+        for event in events:
+            if event.type == PROBE_EVENT:
+                self._pending_probes.append(event.posted_at)
+            else:
+                result.append(event)
+        return result
+
+    def end_frame(self):
+        """Call after presenting the frame: records stats and advances animations."""
+        now = time.perf_counter()
+        self.stats.frames += 1
+        self.stats.latencies.extend(now - posted_at for posted_at in self._pending_probes)
+        self._pending_probes.clear()
+
+        if self.animating:
+            self.clock.tick(self.fps)
+            now = time.perf_counter()
+            self._accumulator += now - self._last_tick
+            self._last_tick = now
+            while self._accumulator >= self.timestep and self.animations:
+                for animation in self.animations:
+                    animation.update(self.timestep)
+                running = [a for a in self.animations if not a.is_finished]
+                if len(running) < len(self.animations): self._frame_requested = True  # Abschluss ohne Warten
+                self.animations = running
+                self._accumulator -= self.timestep
+            if not self.animations: self._accumulator = 0.0
+
+        if self.report_interval and now - self.stats.window_start >= self.report_interval:
+            print(self.stats.summary(self.mode))
+            self.stats.reset()
+
+    # --- Latenzmessung ---
+    def start_latency_probe(self, interval_ms: int = 250):
+        """Posts a timestamped synthetic event every `interval_ms` from a background thread."""
+        def post_probes():
+            while not self._probe_stop.wait(interval_ms / 1000):
+                pygame.event.post(pygame.event.Event(PROBE_EVENT, posted_at=time.perf_counter()))
+        self._probe_thread = threading.Thread(target=post_probes, daemon=True)
+        self._probe_thread.start()
+
+    def stop_latency_probe(self):
+        self._probe_stop.set()
@@ -0,0 +1,68 @@
+# ==============================================================================
+# src/ui/text_cache.py
+# Prozessweite Font-Registry und LRU-Cache für gerenderte Texte.
+# ==============================================================================
+import pygame
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+class FontRegistry:
+    """Creates each (name, size, bold, italic) font once; SysFont lookups are slow."""
+    def __init__(self):
+        self._fonts: Dict[Tuple[str, int, bool, bool], pygame.font.Font] = {}
+        self.lookups = 0
+
+    def get(self, name: str, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+        key = (name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init(): pygame.font.init()
+            font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+            self._fonts[key] = font
+            self.lookups += 1
+        return font
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces keyed by (text, font, color, antialias).
+
+    Cached surfaces are shared, so callers must blit them and never draw onto them.
+    """
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._surfaces: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        key = (text, font, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._surfaces)}
+
+    def clear(self):
+        self._surfaces.clear()
+
+font_registry = FontRegistry()
+text_cache = TextCache()
+
+def get_font(name: str, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+    return font_registry.get(name, size, bold, italic)
+
+def render_text(font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+    return text_cache.render(font, text, color, antialias)
@@ -0,0 +1,110 @@
+# ==============================================================================
+# src/ui/tween.py
+# Tween-/Timeline-Engine: vorgerenderte Flächen, Alpha und Position über die verstrichene Zeit.
+# ==============================================================================
+import bisect
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import pygame
+
+Easing = Callable[[float], float]
+Value = Union[float, Tuple[float, ...]]
+
+# --- Easing (t in [0, 1]) ---
+def linear(t: float) -> float:
+    return t
+
+def ease_out_cubic(t: float) -> float:
+    return 1 - (1 - t) ** 3
+
+def ease_in_out_quad(t: float) -> float:
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+class Track:
+    """A value over time given by keyframes [(seconds, value), ...]; values are numbers or tuples.
+
+    Before the first keyframe the track holds the first value, after the last one the last.
+    `easing` shapes every segment between two keyframes.
+    """
+    __slots__ = ("times", "values", "easing")
+
+    def __init__(self, keyframes: Sequence[Tuple[float, Value]], easing: Easing = linear):
+        self.times = [time for time, _ in keyframes]
+        self.values = [value for _, value in keyframes]
+        self.easing = easing
+
+    @property
+    def start(self) -> float:
+        return self.times[0]
+
+    @property
+    def end(self) -> float:
+        return self.times[-1]
+
+    def at(self, t: float) -> Value:
+        i = bisect.bisect_right(self.times, t)
+        if i == 0: return self.values[0]
+        if i == len(self.times): return self.values[-1]
+        t0, t1 = self.times[i - 1], self.times[i]
+        v0, v1 = self.values[i - 1], self.values[i]
+        f = self.easing((t - t0) / (t1 - t0))
+        if isinstance(v0, tuple):
+            return tuple(a + (b - a) * f for a, b in zip(v0, v1))
+        return v0 + (v1 - v0) * f
+
+def constant(value: Value, start: float, end: float) -> Track:
+    return Track([(start, value), (end, value)])
+
+class Clip:
+    """A pre-rendered surface blitted with tweened position (top-left) and alpha while active.
+
+    The clip owns `surface` and changes its alpha, so never pass a shared (cached) surface.
+    """
+    __slots__ = ("surface", "position", "alpha", "start", "end")
+
+    def __init__(self, surface: pygame.Surface, position: Track, alpha: Track):
+        self.surface = surface
+        self.position = position
+        self.alpha = alpha
+        self.start = min(position.start, alpha.start)
+        self.end = max(position.end, alpha.end)
+
+    def draw(self, surface: pygame.Surface, t: float) -> Optional[pygame.Rect]:
+        alpha = self.alpha.at(t)
+        if alpha <= 0: return None
+        self.surface.set_alpha(int(alpha))
+        x, y = self.position.at(t)
+        return surface.blit(self.surface, (round(x), round(y)))
+
+class Timeline:
+    """Clips on one clock driven by elapsed seconds; fits FrameScheduler.add_animation.
+
+    A frame costs one track lookup per tween and one blit per visible clip, whatever the
+    frame rate; nothing is rendered after construction.
+    """
+    def __init__(self):
+        self.clips: List[Clip] = []
+        self.elapsed = 0.0
+        self.duration = 0.0
+
+    def add(self, clip: Clip) -> Clip:
+        self.clips.append(clip)
+        self.duration = max(self.duration, clip.end)
+        return clip
+
+    def update(self, dt: float):
+        self.elapsed += dt
+
+    @property
+    def is_finished(self) -> bool:
+        return self.elapsed >= self.duration
+
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """Draws the frame at `elapsed` and returns the rects it touched."""
+        t = self.elapsed
+        drawn = []
+        for clip in self.clips:
+            if clip.start <= t <= clip.end:
+                rect = clip.draw(surface, t)
+                if rect: drawn.append(rect)
+        return drawn
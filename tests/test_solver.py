@@ -0,0 +1,32 @@
+# ==============================================================================
+# tests/test_solver.py
+# Der exakte Solver und seine Policy-Tabelle müssen jeden erreichbaren Zustand kennen.
+# ==============================================================================
+import random
+
+from src.ai.solver import MissionSolver
+from src.game.game_state import GameState, AKTIONSPHASE
+from src.sim.monte_carlo import greedy_policy
+
+def test_lookups_cover_greedy_play():
+    """solve() and the policy table answer every state greedy play reaches, incl. thrust above all targets."""
+    rng = random.Random(11)
+    solver = MissionSolver.for_phase1(range(4))
+    table = solver.policy_table()
+    for _ in range(50):
+        game_state = GameState(rng.getrandbits(64))
+        game_state.selected_character_indices = {0, 1, 2, 3}
+        game_state.start_game()
+        for _ in range(4):
+            if game_state.current_phase != AKTIONSPHASE: break
+            played = game_state.thrust
+            for thrust in (played, 8):
+                game_state.thrust = thrust
+                solver.solve(game_state)
+                table.entries = solver.table
+                assert table.lookup(game_state) is not None
+            game_state.thrust = played
+            greedy_policy(game_state, rng)
+            if game_state.current_phase != AKTIONSPHASE: break
+            for player in game_state.players: player.is_ready = True
+            game_state.finish_action_phase()